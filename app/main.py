@@ -1,5 +1,16 @@
 from fastapi import FastAPI
-from .routers import load_router, probes_router, system_router, log_router
+from .middleware import FaultInjectionMiddleware
+from .routers import (
+    faults_router,
+    load_router,
+    log_router,
+    metrics_router,
+    probes_router,
+    scenarios_router,
+    system_router,
+    telemetry_router,
+)
+from .routers.faults import fault_manager
 
 app = FastAPI(
     title="Stressed API",
@@ -12,3 +23,9 @@ app.include_router(system_router)
 app.include_router(load_router)
 app.include_router(probes_router)
 app.include_router(log_router.router)
+app.include_router(metrics_router)
+app.include_router(telemetry_router)
+app.include_router(scenarios_router)
+app.include_router(faults_router)
+
+app.add_middleware(FaultInjectionMiddleware, fault_manager=fault_manager)
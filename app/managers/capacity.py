@@ -0,0 +1,207 @@
+import glob
+import math
+import os
+import psutil
+
+# Limits at or above this value mean "unlimited" in cgroup v1
+UNLIMITED_BYTES = 1 << 60
+# Cache sizes assumed when sysfs does not report them
+DEFAULT_CACHE_BYTES = {"l1": 32 * 1024, "l2": 1024 * 1024, "l3": 8 * 1024 * 1024}
+MIN_DRAM_WORKING_SET = 64 * 1024 * 1024
+# CPU weight (v2) and shares (v1) of a cgroup nobody set a request on
+DEFAULT_CPU_WEIGHT = 100
+DEFAULT_CPU_SHARES = 1024
+
+
+def parse_cpulist(text: str) -> set[int]:
+    """Parse a kernel CPU list such as `0-3,8`"""
+    cpus = set()
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def cache_sizes(cpu_dir: str = "/sys/devices/system/cpu/cpu0") -> dict[str, int]:
+    """Data and unified cache sizes of a CPU in bytes, by level (`l1`...)"""
+    sizes = {}
+    for index in glob.glob(os.path.join(cpu_dir, "cache", "index*")):
+        try:
+            with open(os.path.join(index, "type")) as f:
+                if f.read().strip() == "Instruction":
+                    continue
+            with open(os.path.join(index, "level")) as f:
+                level = f"l{f.read().strip()}"
+            with open(os.path.join(index, "size")) as f:
+                size = f.read().strip()
+        except OSError:
+            continue
+        multiplier = {"K": 1024, "M": 1024 * 1024}.get(size[-1], 1)
+        sizes[level] = int(size.rstrip("KM")) * multiplier
+    return sizes
+
+
+def cache_working_set(level: str) -> int:
+    """Working set in bytes fitting in a cache level, or overflowing them (`dram`)"""
+    sizes = cache_sizes()
+    if level == "dram":
+        return max(4 * max(sizes.values(), default=0), MIN_DRAM_WORKING_SET)
+    return sizes.get(level, DEFAULT_CACHE_BYTES[level]) * 3 // 4
+
+
+class CgroupCapacity:
+    """Container CPU and memory capacity read from cgroup v2, falling back to v1
+
+    Requests are not visible in the memory cgroup, so they are taken from the
+    CONTAINER_CPU_REQUEST (cores) and CONTAINER_MEMORY_REQUEST (MB)
+    environment variables, which can be filled with the downward API. The CPU
+    request falls back to the cgroup CPU weight (v2) or shares (v1) when they
+    differ from their default, which is all a host outside Kubernetes has.
+    """
+
+    def __init__(
+        self, root: str = "/sys/fs/cgroup", proc_cgroup: str = "/proc/self/cgroup"
+    ):
+        self.root = root
+        self.paths = self._read_membership(proc_cgroup)
+        self.version = 2 if os.path.exists(self._v2_file("cgroup.controllers")) else 1
+
+    def _read_membership(self, proc_cgroup: str) -> dict[str, str]:
+        """Map each controller (or '' for v2) to this process' cgroup path"""
+        paths = {}
+        try:
+            with open(proc_cgroup) as f:
+                for line in f:
+                    _, controllers, path = line.strip().split(":", 2)
+                    for controller in controllers.split(",") if controllers else [""]:
+                        paths[controller] = path.lstrip("/")
+        except (OSError, ValueError):
+            pass
+        return paths
+
+    def _v2_file(self, name: str) -> str:
+        own = os.path.join(self.root, self.paths.get("", ""), name)
+        return own if os.path.exists(own) else os.path.join(self.root, name)
+
+    def _v1_file(self, controller: str, name: str) -> str:
+        base = os.path.join(self.root, controller)
+        own = os.path.join(base, self.paths.get(controller, ""), name)
+        return own if os.path.exists(own) else os.path.join(base, name)
+
+    def _read(self, path: str) -> str | None:
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def cpu_limit(self) -> float | None:
+        """CPU quota in cores, None when unlimited"""
+        if self.version == 2:
+            value = self._read(self._v2_file("cpu.max"))
+            if not value:
+                return None
+            quota, _, period = value.partition(" ")
+            if quota == "max":
+                return None
+            return int(quota) / int(period or 100000)
+        quota = self._read(self._v1_file("cpu", "cpu.cfs_quota_us"))
+        period = self._read(self._v1_file("cpu", "cpu.cfs_period_us"))
+        if not quota or not period or int(quota) <= 0:
+            return None
+        return int(quota) / int(period)
+
+    def cpuset(self) -> set[int]:
+        """CPUs the container may run on"""
+        if self.version == 2:
+            value = self._read(self._v2_file("cpuset.cpus.effective"))
+        else:
+            value = self._read(self._v1_file("cpuset", "cpuset.effective_cpus"))
+        if value:
+            return parse_cpulist(value)
+        return set(os.sched_getaffinity(0))
+
+    def memory_limit_mb(self) -> int | None:
+        """Memory limit in MB, None when unlimited"""
+        if self.version == 2:
+            value = self._read(self._v2_file("memory.max"))
+            if not value or value == "max":
+                return None
+            return int(value) // (1024 * 1024)
+        value = self._read(self._v1_file("memory", "memory.limit_in_bytes"))
+        if not value or int(value) >= UNLIMITED_BYTES:
+            return None
+        return int(value) // (1024 * 1024)
+
+    def cpu_request(self) -> float | None:
+        """CPU request in cores, None when no request is set"""
+        if os.getenv("CONTAINER_CPU_REQUEST"):
+            return float(os.getenv("CONTAINER_CPU_REQUEST"))
+        if self.version == 2:
+            weight = self._read(self._v2_file("cpu.weight"))
+            if not weight or int(weight) == DEFAULT_CPU_WEIGHT:
+                return None
+            # Inverse of the shares to weight conversion used by the kubelet
+            shares = 2 + (int(weight) - 1) * 262142 / 9999
+            return round(shares / 1024, 3)
+        shares = self._read(self._v1_file("cpu", "cpu.shares"))
+        if not shares or int(shares) == DEFAULT_CPU_SHARES:
+            return None
+        return round(int(shares) / 1024, 3)
+
+    def memory_request_mb(self) -> int | None:
+        """Memory request in MB"""
+        value = os.getenv("CONTAINER_MEMORY_REQUEST")
+        return int(value) if value else None
+
+    def cpu_usage_seconds(self) -> float | None:
+        """Total CPU time consumed by the container"""
+        if self.version == 2:
+            for line in (self._read(self._v2_file("cpu.stat")) or "").splitlines():
+                key, _, value = line.partition(" ")
+                if key == "usage_usec":
+                    return int(value) / 1e6
+            return None
+        value = self._read(self._v1_file("cpuacct", "cpuacct.usage"))
+        return int(value) / 1e9 if value else None
+
+    def memory_usage_mb(self) -> int | None:
+        """Memory currently charged to the container"""
+        if self.version == 2:
+            value = self._read(self._v2_file("memory.current"))
+        else:
+            value = self._read(self._v1_file("memory", "memory.usage_in_bytes"))
+        return int(value) // (1024 * 1024) if value else None
+
+    @property
+    def cpus(self) -> float:
+        """Usable CPUs: the quota, capped by the cpuset and the host"""
+        cpus = min(len(self.cpuset()), os.cpu_count())
+        limit = self.cpu_limit()
+        return min(limit, cpus) if limit else cpus
+
+    @property
+    def memory_mb(self) -> int:
+        """Usable memory: the limit, capped by the host memory"""
+        total = psutil.virtual_memory().total // (1024 * 1024)
+        limit = self.memory_limit_mb()
+        return min(limit, total) if limit else total
+
+    @property
+    def worker_slots(self) -> int:
+        """Number of CPU workers needed to reach the usable CPUs"""
+        return max(1, math.ceil(self.cpus))
+
+    def to_dict(self) -> dict:
+        return {
+            "cgroup_version": self.version,
+            "cpu_limit": self.cpu_limit(),
+            "cpu_request": self.cpu_request(),
+            "cpuset": sorted(self.cpuset()),
+            "memory_limit_mb": self.memory_limit_mb(),
+            "memory_request_mb": self.memory_request_mb(),
+            "cpus": self.cpus,
+            "memory_mb": self.memory_mb,
+        }
@@ -0,0 +1,101 @@
+import math
+import random
+from fnmatch import fnmatchcase
+from ..models.schemas import FaultDistribution, FaultRule
+
+# Paths never affected, so faults can always be inspected and removed
+EXEMPT_PREFIXES = ("/faults",)
+# Upper bound of an injected delay, whatever the distribution tail
+MAX_DELAY = 600.0
+MAX_RULES = 100
+
+
+class FaultManager:
+    """Latency and error rules applied to incoming requests
+
+    A request uses the most specific matching rule: an exact route before a
+    glob, then the longest glob. Rules are kept sorted in that order when
+    they change, so matching a request is a scan that stops at the first
+    hit, and a no-op without rules.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self.rules: dict[str, FaultRule] = {}
+        self.stats: dict[str, dict] = {}
+        self._ordered: list[FaultRule] = []
+        self.rng = random.Random(seed)
+
+    def set_rule(self, rule: FaultRule) -> FaultRule:
+        """Add a rule, or replace the rule of the same route"""
+        if rule.route not in self.rules and len(self.rules) >= MAX_RULES:
+            raise ValueError(f"Cannot define more than {MAX_RULES} fault rules")
+        if rule.route.startswith(EXEMPT_PREFIXES):
+            raise ValueError("Fault endpoints cannot be targeted")
+        self.rules[rule.route] = rule
+        self.stats[rule.route] = {"requests": 0, "errors": 0, "delay_seconds": 0.0}
+        self._sort()
+        return rule
+
+    def delete_rule(self, route: str):
+        if route not in self.rules:
+            raise KeyError(f"No fault rule for {route}")
+        del self.rules[route]
+        del self.stats[route]
+        self._sort()
+
+    def clear(self):
+        self.rules.clear()
+        self.stats.clear()
+        self._sort()
+
+    def _sort(self):
+        def specificity(rule: FaultRule):
+            is_glob = any(c in rule.route for c in "*?[")
+            return (is_glob, -len(rule.route))
+
+        self._ordered = sorted(self.rules.values(), key=specificity)
+
+    def match(self, method: str, path: str) -> FaultRule | None:
+        if not self._ordered or path.startswith(EXEMPT_PREFIXES):
+            return None
+        for rule in self._ordered:
+            if rule.methods and method not in rule.methods:
+                continue
+            if rule.route == path or fnmatchcase(path, rule.route):
+                return rule
+        return None
+
+    def sample_delay(self, rule: FaultRule) -> float:
+        """Delay in seconds drawn from the rule distribution"""
+        if rule.distribution == FaultDistribution.NORMAL:
+            delay = self.rng.gauss(rule.latency_ms, rule.stddev_ms)
+        elif rule.distribution == FaultDistribution.LOGNORMAL:
+            delay = rule.latency_ms * math.exp(self.rng.gauss(0, rule.sigma))
+        elif rule.distribution == FaultDistribution.BIMODAL:
+            slow = self.rng.random() < rule.slow_ratio
+            delay = rule.slow_ms if slow else rule.latency_ms
+        else:
+            delay = rule.latency_ms
+        return min(max(delay, 0.0) / 1000, MAX_DELAY)
+
+    def inject(self, method: str, path: str) -> tuple[float, int | None] | None:
+        """Delay and error status to apply to a request, None when unaffected"""
+        rule = self.match(method, path)
+        if rule is None:
+            return None
+        delay = self.sample_delay(rule)
+        status = rule.status_code if self.rng.random() < rule.error_rate else None
+        stats = self.stats[rule.route]
+        stats["requests"] += 1
+        stats["delay_seconds"] += delay
+        if status is not None:
+            stats["errors"] += 1
+        return delay, status
+
+    def to_dict(self) -> dict:
+        return {
+            "rules": [
+                {**rule.model_dump(mode="json"), "stats": self.stats[rule.route]}
+                for rule in self._ordered
+            ]
+        }
@@ -0,0 +1,90 @@
+import math
+
+# Linear sub-buckets per power of two: values keep 1/64 relative precision
+SUB_BUCKET_BITS = 6
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with bounded memory, HDR style
+
+    Latencies are recorded in microseconds. Values below SUB_BUCKETS get one
+    bucket each, larger ones SUB_BUCKETS linear buckets per power of two, so
+    percentiles stay within ~1.5% from a microsecond to hours whatever the
+    number of samples. Recording is a few integer operations and safe from
+    one writer thread while others read.
+    """
+
+    def __init__(self):
+        self.counts: list[int] = []
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS - 1
+        return (shift + 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+    @staticmethod
+    def _value(index: int) -> float:
+        """Midpoint of a bucket, in microseconds"""
+        if index < SUB_BUCKETS:
+            return float(index)
+        shift = index // SUB_BUCKETS - 1
+        low = (index % SUB_BUCKETS + SUB_BUCKETS) << shift
+        return low + ((1 << shift) - 1) / 2
+
+    def record(self, seconds: float, count: int = 1):
+        micros = max(0, int(seconds * 1e6))
+        index = self._index(micros)
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += count
+        self.count += count
+        self.total += seconds * count
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram"):
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float | None:
+        """Latency in seconds below which `percent` % of the samples fall"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._value(index) / 1e6, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def to_dict(self, percentiles=(50, 90, 99, 99.9)) -> dict:
+        """Summary in milliseconds"""
+
+        def ms(seconds):
+            return None if seconds is None else round(seconds * 1000, 3)
+
+        return {
+            "count": self.count,
+            "min_ms": ms(self.min if self.count else None),
+            "mean_ms": ms(self.mean),
+            "max_ms": ms(self.max if self.count else None),
+            **{f"p{p:g}_ms": ms(self.percentile(p)) for p in percentiles},
+        }
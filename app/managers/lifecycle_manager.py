@@ -1,15 +1,25 @@
 import os
 
+HEALTHY_STATUSES = ("SUCCESS", "ok")
+
 
 class LifecycleManager:
     def __init__(self):
         self.readiness_status = os.getenv("READINESS_STATUS", "SUCCESS")
         self.liveness_status = os.getenv("LIVENESS_STATUS", "SUCCESS")
+        # Number of healthy/unhealthy transitions of each probe
+        self.flips = {"readiness": 0, "liveness": 0}
 
     def set_probe_status(self, probe, status):
         if probe == "readiness":
-            self.readiness_status = status
+            previous, self.readiness_status = self.readiness_status, status
         elif probe == "liveness":
-            self.liveness_status = status
+            previous, self.liveness_status = self.liveness_status, status
         else:
             raise ValueError("Invalid probe")
+        if self.is_healthy(previous) != self.is_healthy(status):
+            self.flips[probe] += 1
+
+    @staticmethod
+    def is_healthy(status) -> bool:
+        return status in HEALTHY_STATUSES
@@ -1,8 +1,35 @@
 import os
-import signal
-import subprocess
-from threading import Timer
-import psutil
+import shutil
+import threading
+from urllib.parse import urlsplit
+from ..models.schemas import (
+    BandwidthPattern,
+    CacheLevel,
+    CPUPlacement,
+    CPUWorkload,
+    DiskPattern,
+    HttpArrival,
+    HttpMethod,
+    LoadUnit,
+    MemoryMode,
+    NetworkMode,
+    NetworkProtocol,
+    RampShape,
+)
+from .capacity import CgroupCapacity, cache_working_set
+from .load_sampler import LoadSampler
+from .ramp import Ramp
+from .worker_process import WorkerProcess
+
+# Largest UDP payload of the network load, and its connection limit
+MAX_DATAGRAM = 65507
+MAX_CONNECTIONS = 64
+# Limits of the HTTP load generator
+MAX_HTTP_RATE = 20000
+MAX_HTTP_CONNECTIONS = 1000
+# Limits of the connection churn load
+MAX_CHURN_RATE = 20000
+MAX_CHURN_HOLD_MS = 60000
 
 
 class LoadManager:
@@ -11,27 +38,75 @@ class LoadManager:
         self.memory_script_path = os.path.join(
             os.getcwd(), "app/scripts/memory_stress.py"
         )
+        self.bandwidth_script_path = os.path.join(
+            os.getcwd(), "app/scripts/bandwidth_stress.py"
+        )
+        self.disk_script_path = os.path.join(os.getcwd(), "app/scripts/disk_stress.py")
+        self.network_script_path = os.path.join(
+            os.getcwd(), "app/scripts/network_stress.py"
+        )
+        self.http_script_path = os.path.join(os.getcwd(), "app/scripts/http_stress.py")
+        self.churn_script_path = os.path.join(
+            os.getcwd(), "app/scripts/churn_stress.py"
+        )
 
         self.cpu_requested = float(os.getenv("CPU_REQUESTED", 0))
         self.memory_requested = int(os.getenv("MEMORY_REQUESTED", 0))
         self.cpu_processes = []
-        self.cpu_timers = []
-        self.memory_timers = []
+        self.cpu_ramp = None
+        self.memory_ramp = None
+        # Serialize pool changes between requests and ramp threads
+        self._cpu_lock = threading.Lock()
+        # Workload the running CPU pool was last given
+        self._cpu_pool_workload = None
+        self._memory_lock = threading.Lock()
         self.memory_process = None
+        self.bandwidth_process = None
+        self.disk_process = None
+        self.disk_path = os.getenv("DISK_LOAD_PATH", "/tmp")
+        self.disk_max_size_mb = int(os.getenv("DISK_MAX_SIZE_MB", 1024))
+        self.network_process = None
+        self.network_port = int(os.getenv("NETWORK_LOAD_PORT", 5201))
+        self.http_process = None
+        self.self_url = f"http://127.0.0.1:{os.getenv('PORT', 8000)}"
+        self.churn_process = None
 
         self.memory_at_start = int(os.getenv("INITIAL_MEMORY_LOAD", 50))
         self.memory_at_end = int(os.getenv("FINAL_MEMORY_LOAD", 256))
         self.memory_duration = int(os.getenv("MEMORY_LOAD_DURATION", 60))
         self.stop_memory_at_end = os.getenv("STOP_MEMORY_LOAD_AT_END", "true") == "true"
+        self.memory_shape = RampShape(os.getenv("MEMORY_LOAD_SHAPE", "linear"))
+        self.memory_mode = MemoryMode(os.getenv("MEMORY_MODE", "touch"))
+        self.memory_dirty_rate = float(os.getenv("MEMORY_DIRTY_RATE", 0))
+        self.memory_unit = LoadUnit(os.getenv("MEMORY_LOAD_UNIT", "absolute"))
 
         self.cpu_at_start = float(os.getenv("INITIAL_CPU_LOAD", 0))
         self.cpu_at_end = float(os.getenv("FINAL_CPU_LOAD", 1))
         self.cpu_duration = int(os.getenv("CPU_LOAD_DURATION", 60))
         self.stop_cpu_at_end = os.getenv("STOP_CPU_LOAD_AT_END", "true") == "true"
+        self.cpu_shape = RampShape(os.getenv("CPU_LOAD_SHAPE", "linear"))
+        self.cpu_feedback = os.getenv("CPU_FEEDBACK", "false") == "true"
+        self.cpu_workload = CPUWorkload(os.getenv("CPU_WORKLOAD", "spin"))
+        self.cpu_placement = CPUPlacement(os.getenv("CPU_PLACEMENT", "none"))
+        self.cpu_unit = LoadUnit(os.getenv("CPU_LOAD_UNIT", "absolute"))
 
         self.max_duration = 3600
-        self.system_memory = psutil.virtual_memory().total // (1024 * 1024)
-        self.system_cpus = os.cpu_count()
+        # Container capacity (cgroup limits), not the host's
+        self.capacity = CgroupCapacity()
+        self.system_memory = self.capacity.memory_mb
+        self.system_cpus = self.capacity.cpus
+
+        self.sampler = LoadSampler(
+            self._worker_pids,
+            lambda: {
+                "cpu_requested": self.cpu_requested,
+                "memory_requested": self.memory_requested,
+            },
+            self.capacity,
+            float(os.getenv("LOAD_SAMPLE_INTERVAL", 1.0)),
+            int(os.getenv("LOAD_HISTORY_SIZE", 600)),
+        )
+        self.sampler.start()
 
         if os.getenv("ENABLE_DYNAMIC_MEMORY_LOAD", "false") == "true":
             self.dynamic_memory_load(
@@ -39,6 +114,7 @@ class LoadManager:
                 self.memory_at_end,
                 self.memory_duration,
                 self.stop_memory_at_end,
+                shape=self.memory_shape,
             )
 
         if os.getenv("ENABLE_DYNAMIC_CPU_LOAD", "false") == "true":
@@ -47,122 +123,350 @@ class LoadManager:
                 self.cpu_at_end,
                 self.cpu_duration,
                 self.stop_cpu_at_end,
+                shape=self.cpu_shape,
             )
 
     def __del__(self):
+        self.sampler.stop()
         self.stop_cpu_load()
         self.stop_memory_load()
+        self.stop_bandwidth_load()
+        self.stop_disk_load()
+        self.stop_network_load()
+        self.stop_http_load()
+        self.stop_churn_load()
 
     def stop_cpu_load(self):
+        self._cancel_cpu_ramp()
+        with self._cpu_lock:
+            for process in self.cpu_processes:
+                process.stop()
+            self.cpu_processes.clear()
+            self.cpu_requested = 0
+
+    def _cancel_cpu_ramp(self):
+        # Joins the ramp thread, so it must not be called with the lock held
+        ramp, self.cpu_ramp = self.cpu_ramp, None
+        if ramp is not None:
+            ramp.cancel()
+
+    def _cpu_pool(self) -> WorkerProcess:
+        """Return the running CPU worker pool, spawning it on first use"""
+        if self.cpu_processes and self.cpu_processes[0].is_alive():
+            return self.cpu_processes[0]
         for process in self.cpu_processes:
-            try:
-                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                process.wait()
-            except Exception as e:
-                raise RuntimeError(f"Failed to terminate process {process.pid}: {e}")
-        self.cpu_processes.clear()
-        for timer in self.cpu_timers:
-            timer.cancel()
-        self.cpu_timers.clear()
-        self.cpu_requested = 0
-
-    def add_cpu_load(self, value: float):
-        """Add CPU load with validation"""
+            process.stop()
+        try:
+            pool = WorkerProcess(
+                self.cpu_script_path, "--workers", str(self.capacity.worker_slots)
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to start CPU stress: {e}")
+        self.cpu_processes = [pool]
+        return pool
+
+    def add_cpu_load(
+        self,
+        value: float,
+        feedback: bool | None = None,
+        workload: CPUWorkload | None = None,
+        placement: CPUPlacement | None = None,
+        cpus: list[int] | None = None,
+        unit: LoadUnit | None = None,
+    ):
+        """Add CPU load with validation
+
+        The worker pool is spawned once and retargeted in place, so changing
+        the load does not restart any process. With feedback enabled the pool
+        measures the CPU time its workers actually consume and corrects their
+        duty cycle until it matches the requested value. The workload selects
+        the operation the workers repeat; their throughput is reported in
+        ops/sec. Workers can be restricted to a CPU set and pinned with
+        sched_setaffinity following a spread, pack or per-NUMA-node policy.
+        The value is in cores, or a percentage of the container CPU limit or
+        request depending on `unit`.
+        """
+        value = self._cpu_cores(value, unit)
+        self._validate_cpu_load(value, cpus)
+        self._cancel_cpu_ramp()
+        self._set_cpu_load(value, feedback, workload, placement, cpus)
+
+    def _validate_cpu_load(self, value: float, cpus: list[int] | None = None):
         if value <= 0:
             raise ValueError("CPU load must be greater than 0")
         if value > self.system_cpus:
             raise ValueError(
-                f"CPU load cannot exceed system CPU count ({self.system_cpus})"
+                f"CPU load cannot exceed container CPU capacity ({self.system_cpus})"
             )
+        if cpus is not None:
+            unavailable = set(cpus) - os.sched_getaffinity(0)
+            if not cpus or unavailable:
+                raise ValueError(
+                    f"CPU set must be a subset of {sorted(os.sched_getaffinity(0))}"
+                )
+            if value > len(set(cpus)):
+                raise ValueError(
+                    f"CPU load cannot exceed the CPU set size ({len(set(cpus))})"
+                )
 
         if not os.path.exists(self.cpu_script_path):
             raise RuntimeError("CPU stress script is missing")
 
-        self.stop_cpu_load()
-        command = ["python3", self.cpu_script_path, str(value)]
-        try:
-            process = subprocess.Popen(command, preexec_fn=os.setsid)
-            self.cpu_processes.append(process)
+    def _from_unit(
+        self,
+        value: float,
+        unit: LoadUnit,
+        limit: float,
+        request: float | None,
+        name: str,
+    ) -> float:
+        """Convert a percentage of the container limit or request"""
+        if unit == LoadUnit.ABSOLUTE:
+            return value
+        if unit == LoadUnit.PERCENT_LIMIT:
+            return value * limit / 100
+        if request is None:
+            raise ValueError(
+                f"{name} request is unknown, set CONTAINER_{name.upper()}_REQUEST to use "
+                "percent_request"
+            )
+        return value * request / 100
+
+    def _cpu_cores(self, value: float, unit: LoadUnit | None) -> float:
+        unit = LoadUnit(unit or self.cpu_unit)
+        cores = self._from_unit(
+            value, unit, self.system_cpus, self.capacity.cpu_request(), "CPU"
+        )
+        return round(cores, 3)
+
+    def _memory_mb(self, value: float, unit: LoadUnit | None) -> int:
+        unit = LoadUnit(unit or self.memory_unit)
+        return int(
+            self._from_unit(
+                value,
+                unit,
+                self.system_memory,
+                self.capacity.memory_request_mb(),
+                "Memory",
+            )
+        )
+
+    def _set_cpu_load(
+        self,
+        value: float,
+        feedback: bool | None = None,
+        workload: CPUWorkload | None = None,
+        placement: CPUPlacement | None = None,
+        cpus: list[int] | None = None,
+    ):
+        """Retarget the worker pool without touching a running ramp
+
+        Without an explicit workload the running pool keeps its current one.
+        """
+        if feedback is None:
+            feedback = self.cpu_feedback
+        placement = CPUPlacement(placement or self.cpu_placement)
+        cpus = sorted(set(cpus)) if cpus else None
+        with self._cpu_lock:
+            if value <= 0 and not self.cpu_processes:
+                self.cpu_requested = 0
+                return
+            if workload is None and self.cpu_processes:
+                workload = self._cpu_pool_workload
+            workload = CPUWorkload(workload or self.cpu_workload)
+            self._cpu_pool().send(
+                cpu=value,
+                feedback=feedback,
+                workload=workload.value,
+                placement=placement.value,
+                cpus=cpus,
+            )
+            self._cpu_pool_workload = workload
             self.cpu_requested = value
-        except Exception as e:
-            raise RuntimeError(f"Failed to start CPU stress: {e}")
+
+    def resolve_cpu_load(
+        self,
+        value: float,
+        unit: LoadUnit | None = None,
+        cpus: list[int] | None = None,
+    ) -> float:
+        """Convert a CPU target to cores and check it fits the container"""
+        cores = self._cpu_cores(value, unit)
+        if cores > 0:
+            self._validate_cpu_load(cores, cpus)
+        return cores
+
+    def set_cpu_target(
+        self,
+        value: float,
+        feedback: bool | None = None,
+        workload: CPUWorkload | None = None,
+        placement: CPUPlacement | None = None,
+        cpus: list[int] | None = None,
+    ):
+        """Apply a resolved CPU setpoint from an external scheduler
+
+        Cancels any running ramp; 0 idles the worker pool instead of being
+        rejected.
+        """
+        self._cancel_cpu_ramp()
+        self._set_cpu_load(value, feedback, workload, placement, cpus)
 
     def stop_memory_load(self):
-        if self.memory_process:
-            try:
-                self.memory_process.terminate()
+        self._cancel_memory_ramp()
+        with self._memory_lock:
+            if self.memory_process:
+                self.memory_process.stop()
                 self.memory_process = None
+            self.memory_requested = 0
 
-                for timer in self.memory_timers:
-                    timer.cancel()
-                self.memory_timers.clear()
-                self.memory_requested = 0
-            except Exception as e:
-                raise RuntimeError(f"Failed to terminate memory stress: {e}")
+    def _cancel_memory_ramp(self):
+        # Joins the ramp thread, so it must not be called with the lock held
+        ramp, self.memory_ramp = self.memory_ramp, None
+        if ramp is not None:
+            ramp.cancel()
 
-    def add_memory_load(self, value: int):
-        """Add memory load with validation"""
+    def add_memory_load(
+        self,
+        value: int,
+        mode: MemoryMode | None = None,
+        dirty_rate: float | None = None,
+        unit: LoadUnit | None = None,
+    ):
+        """Add memory load with validation
+
+        The mode controls page residency: reserved only, touched once,
+        continuously dirtied at `dirty_rate` MB/s, or advised as transparent
+        hugepages. The value is in MB, or a percentage of the container
+        memory limit or request depending on `unit`.
+        """
+        value = self._memory_mb(value, unit)
+        self._validate_memory_load(value)
+        mode, dirty_rate = self._memory_residency(mode, dirty_rate)
+        self._cancel_memory_ramp()
+        self._set_memory_load(value, mode, dirty_rate)
+
+    def _memory_residency(
+        self, mode: MemoryMode | None, dirty_rate: float | None
+    ) -> tuple[MemoryMode, float]:
+        """Resolve and validate the memory mode and dirty rate"""
+        mode = MemoryMode(mode or self.memory_mode)
+        if dirty_rate is None:
+            dirty_rate = self.memory_dirty_rate
+        if dirty_rate < 0:
+            raise ValueError("Dirty rate must be greater than or equal to 0")
+        if mode == MemoryMode.DIRTY and dirty_rate <= 0:
+            raise ValueError("Dirty mode requires a dirty rate greater than 0")
+        return mode, dirty_rate
+
+    def _validate_memory_load(self, value: int):
         if value <= 0:
             raise ValueError("Memory load must be greater than 0")
         if value > self.system_memory:
             raise ValueError(
-                f"Memory load cannot exceed system memory ({self.system_memory}MB)"
+                f"Memory load cannot exceed container memory ({self.system_memory}MB)"
             )
 
         if not os.path.exists(self.memory_script_path):
             raise RuntimeError("Memory stress script is missing")
 
-        self.stop_memory_load()
-        command = ["python3", self.memory_script_path, str(value)]
+    def _memory_holder(self) -> WorkerProcess:
+        """Return the running memory holder, spawning it on first use"""
+        if self.memory_process and self.memory_process.is_alive():
+            return self.memory_process
+        if self.memory_process:
+            self.memory_process.stop()
         try:
-            self.memory_process = subprocess.Popen(command)
-            self.memory_requested = value
+            self.memory_process = WorkerProcess(self.memory_script_path)
         except Exception as e:
             raise RuntimeError(f"Failed to start memory stress: {e}")
+        return self.memory_process
 
-    def dynamic_memory_load(
-        self, start_value: int, end_value: int, duration: int, stop_at_end: bool = False
+    def _set_memory_load(
+        self,
+        value: int,
+        mode: MemoryMode = MemoryMode.TOUCH,
+        dirty_rate: float = 0,
     ):
-        """Dynamic memory load with validation"""
-        if duration <= 0 or duration > self.max_duration:
-            raise ValueError(
-                f"Duration must be between 1 and {self.max_duration} seconds"
-            )
-        if end_value < start_value:
-            raise ValueError("End value must be greater than start value")
+        """Resize the memory holder without touching a running ramp
 
-        try:
-            start_value = start_value
-            end_value = end_value
-            duration = duration
-        except ValueError as e:
-            raise ValueError(
-                "Arguments 'start_value', 'end_value', 'duration' have to be integers."
-            ) from e
-        num_intervals = duration // 10
+        The holder keeps memory as fixed-size chunks and only allocates or
+        releases the difference with its current size.
+        """
+        with self._memory_lock:
+            if value <= 0 and not self.memory_process:
+                self.memory_requested = 0
+                return
+            self._memory_holder().send(
+                mb=max(value, 0), mode=mode.value, dirty_rate=dirty_rate
+            )
+            self.memory_requested = max(value, 0)
 
-        if num_intervals < 1:
-            num_intervals = 1
-        increment = (end_value - start_value) / num_intervals
-        global memory_requested
-        memory_requested = start_value
+    def resolve_memory_load(
+        self,
+        value: float,
+        unit: LoadUnit | None = None,
+        mode: MemoryMode | None = None,
+        dirty_rate: float | None = None,
+    ) -> int:
+        """Convert a memory target to MB and check it fits the container"""
+        self._memory_residency(mode, dirty_rate)
+        mb = self._memory_mb(value, unit)
+        if mb > 0:
+            self._validate_memory_load(mb)
+        return mb
+
+    def set_memory_target(
+        self,
+        value: int,
+        mode: MemoryMode | None = None,
+        dirty_rate: float | None = None,
+    ):
+        """Apply a resolved memory setpoint from an external scheduler"""
+        mode, dirty_rate = self._memory_residency(mode, dirty_rate)
+        self._cancel_memory_ramp()
+        self._set_memory_load(value, mode, dirty_rate)
 
-        def apply_dynamic_memory_load(interval_num):
-            global memory_requested
-            current_memory = min(
-                start_value + increment * (interval_num + 1), end_value
+    def _validate_ramp(self, start_value: float, end_value: float, duration: int):
+        if duration <= 0 or duration > self.max_duration:
+            raise ValueError(
+                f"Duration must be between 1 and {self.max_duration} seconds"
             )
-            self.add_memory_load(int(current_memory))
+        if start_value < 0 or end_value < 0:
+            raise ValueError("Start and end values must be greater than or equal to 0")
 
-            if interval_num + 1 < num_intervals:
-                timer = Timer(10, apply_dynamic_memory_load, [interval_num + 1])
-                self.memory_timers.append(timer)
-                timer.start()
-            elif stop_at_end:
-                stop_timer = Timer(10, self.stop_memory_load)
-                stop_timer.start()
+    def dynamic_memory_load(
+        self,
+        start_value: int,
+        end_value: int,
+        duration: int,
+        stop_at_end: bool = False,
+        shape: RampShape = RampShape.LINEAR,
+        resolution: float = 1.0,
+        steps: int = 10,
+        cycles: float = 1,
+        hold: int = 0,
+        mode: MemoryMode | None = None,
+        dirty_rate: float | None = None,
+        unit: LoadUnit | None = None,
+    ):
+        """Dynamic memory load following a ramp shape"""
+        self._validate_ramp(start_value, end_value, duration)
+        start_value = self._memory_mb(start_value, unit)
+        end_value = self._memory_mb(end_value, unit)
+        if max(start_value, end_value) > 0:
+            self._validate_memory_load(max(start_value, end_value))
+        mode, dirty_rate = self._memory_residency(mode, dirty_rate)
+        ramp = Ramp(
+            start_value, end_value, duration, shape, resolution, steps, cycles, hold
+        )
 
-        apply_dynamic_memory_load(0)
+        self._cancel_memory_ramp()
+        self.memory_ramp = ramp
+        ramp.start(
+            lambda value: self._set_memory_load(int(value), mode, dirty_rate),
+            self.stop_memory_load if stop_at_end else None,
+        )
 
     def dynamic_cpu_load(
         self,
@@ -170,44 +474,419 @@ class LoadManager:
         end_value: float,
         duration: int,
         stop_at_end: bool = False,
+        feedback: bool | None = None,
+        shape: RampShape = RampShape.LINEAR,
+        resolution: float = 1.0,
+        steps: int = 10,
+        cycles: float = 1,
+        hold: int = 0,
+        workload: CPUWorkload | None = None,
+        placement: CPUPlacement | None = None,
+        cpus: list[int] | None = None,
+        unit: LoadUnit | None = None,
     ):
-        """Dynamic CPU load with validation"""
-        if duration <= 0 or duration > self.max_duration:
+        """Dynamic CPU load following a ramp shape"""
+        self._validate_ramp(start_value, end_value, duration)
+        start_value = self._cpu_cores(start_value, unit)
+        end_value = self._cpu_cores(end_value, unit)
+        if max(start_value, end_value) > 0:
+            self._validate_cpu_load(max(start_value, end_value), cpus)
+        ramp = Ramp(
+            start_value, end_value, duration, shape, resolution, steps, cycles, hold
+        )
+
+        self._cancel_cpu_ramp()
+        self.cpu_ramp = ramp
+        ramp.start(
+            lambda value: self._set_cpu_load(
+                value, feedback, workload, placement, cpus
+            ),
+            self.stop_cpu_load if stop_at_end else None,
+        )
+
+    def add_bandwidth_load(
+        self,
+        workers: int = 1,
+        level: CacheLevel = CacheLevel.DRAM,
+        pattern: BandwidthPattern = BandwidthPattern.COPY,
+        working_set_kb: int | None = None,
+        duration: int | None = None,
+    ):
+        """Start a memory-bandwidth load streaming over a sized working set
+
+        The working set is sized to fit in the given cache level, or to
+        overflow the caches for `dram`, unless `working_set_kb` is given;
+        either way the sets of all workers must fit in the container memory.
+        Workers report the achieved GB/s and ns per cache-line access.
+        """
+        if workers < 1 or workers > self.system_cpus:
+            raise ValueError(
+                f"Bandwidth workers must be between 1 and {self.system_cpus}"
+            )
+        if working_set_kb is None:
+            working_set_kb = cache_working_set(CacheLevel(level).value) // 1024
+        elif working_set_kb <= 0:
+            raise ValueError("Working set must be greater than 0")
+        # Every worker allocates its own working set
+        if workers * working_set_kb // 1024 > self.system_memory:
+            raise ValueError(
+                f"Working set cannot exceed container memory ({self.system_memory}MB)"
+            )
+        if duration is not None and (duration <= 0 or duration > self.max_duration):
             raise ValueError(
                 f"Duration must be between 1 and {self.max_duration} seconds"
             )
-        if end_value < start_value:
-            raise ValueError("End value must be greater than start value")
-
+        if not os.path.exists(self.bandwidth_script_path):
+            raise RuntimeError("Bandwidth stress script is missing")
+
+        args = [
+            "--workers",
+            str(workers),
+            "--level",
+            CacheLevel(level).value,
+            "--pattern",
+            BandwidthPattern(pattern).value,
+            "--working-set-kb",
+            str(working_set_kb),
+        ]
+        if duration:
+            args += ["--duration", str(duration)]
+
+        self.stop_bandwidth_load()
         try:
-            start_value = start_value
-            end_value = end_value
-            duration = duration
-        except ValueError as e:
+            self.bandwidth_process = WorkerProcess(self.bandwidth_script_path, *args)
+        except Exception as e:
+            raise RuntimeError(f"Failed to start bandwidth stress: {e}")
+
+    def stop_bandwidth_load(self):
+        if self.bandwidth_process:
+            self.bandwidth_process.stop()
+            self.bandwidth_process = None
+
+    def add_disk_load(
+        self,
+        pattern: DiskPattern = DiskPattern.RANDREAD,
+        block_size_kb: int = 4,
+        queue_depth: int = 1,
+        size_mb: int = 256,
+        path: str | None = None,
+        fsync: bool = False,
+        direct: bool = False,
+        duration: int | None = None,
+    ):
+        """Start a disk I/O load on a test file of at most `size_mb`
+
+        Each of the `queue_depth` threads keeps one synchronous I/O in flight.
+        Read patterns write the whole file first. The worker reports IOPS,
+        MB/s and latency percentiles and deletes the file when it stops.
+        """
+        path = path or self.disk_path
+        if block_size_kb < 1 or block_size_kb > 16384:
+            raise ValueError("Block size must be between 1 and 16384 KB")
+        if direct and block_size_kb % 4:
+            raise ValueError("Direct I/O needs a block size multiple of 4 KB")
+        if queue_depth < 1 or queue_depth > 256:
+            raise ValueError("Queue depth must be between 1 and 256")
+        if size_mb < 1 or size_mb > self.disk_max_size_mb:
             raise ValueError(
-                "Arguments 'start_value', 'end_value', 'duration'have to be integers."
-            ) from e
+                f"Disk load size must be between 1 and {self.disk_max_size_mb}MB"
+            )
+        if block_size_kb > size_mb * 1024:
+            raise ValueError("Block size cannot exceed the disk load size")
+        if not os.path.isdir(path):
+            raise ValueError(f"Disk load path {path} is not a directory")
+        free_mb = shutil.disk_usage(path).free // (1024 * 1024)
+        if size_mb > free_mb:
+            raise ValueError(
+                f"Disk load size exceeds the free space on {path} ({free_mb}MB)"
+            )
+        if duration is not None and (duration <= 0 or duration > self.max_duration):
+            raise ValueError(
+                f"Duration must be between 1 and {self.max_duration} seconds"
+            )
+        if not os.path.exists(self.disk_script_path):
+            raise RuntimeError("Disk stress script is missing")
+
+        args = [
+            "--pattern",
+            DiskPattern(pattern).value,
+            "--block-size-kb",
+            str(block_size_kb),
+            "--queue-depth",
+            str(queue_depth),
+            "--size-mb",
+            str(size_mb),
+            "--path",
+            path,
+        ]
+        if fsync:
+            args.append("--fsync")
+        if direct:
+            args.append("--direct")
+        if duration:
+            args += ["--duration", str(duration)]
+
+        self.stop_disk_load()
+        try:
+            self.disk_process = WorkerProcess(self.disk_script_path, *args)
+        except Exception as e:
+            raise RuntimeError(f"Failed to start disk stress: {e}")
 
-        num_intervals = duration // 10
+    def stop_disk_load(self):
+        if self.disk_process:
+            self.disk_process.stop()
+            self.disk_process = None
 
-        if num_intervals < 1:
-            num_intervals = 1
-        increment = (end_value - start_value) / num_intervals
-        global cpu_requested
-        cpu_requested = start_value
+    def add_network_load(
+        self,
+        protocol: NetworkProtocol = NetworkProtocol.TCP,
+        mode: NetworkMode = NetworkMode.LOOPBACK,
+        host: str | None = None,
+        port: int | None = None,
+        message_size: int = 64 * 1024,
+        connections: int = 1,
+        rate_mbps: float | None = None,
+        duration: int | None = None,
+    ):
+        """Start a TCP or UDP throughput load
+
+        `loopback` runs the senders against a receiver in the same worker,
+        `send` targets a peer (another instance in `receive` mode) and
+        `receive` only listens on `port`. `rate_mbps` is shared by all
+        connections, unset sends as fast as possible.
+        """
+        protocol = NetworkProtocol(protocol)
+        mode = NetworkMode(mode)
+        port = port or self.network_port
+        max_message = MAX_DATAGRAM if protocol == NetworkProtocol.UDP else 4 * 1024**2
+        if message_size < 1 or message_size > max_message:
+            raise ValueError(f"Message size must be between 1 and {max_message} bytes")
+        if connections < 1 or connections > MAX_CONNECTIONS:
+            raise ValueError(f"Connections must be between 1 and {MAX_CONNECTIONS}")
+        if rate_mbps is not None and rate_mbps <= 0:
+            raise ValueError("Target bandwidth must be greater than 0")
+        if port < 1 or port > 65535:
+            raise ValueError("Port must be between 1 and 65535")
+        if mode == NetworkMode.SEND and not host:
+            raise ValueError("A peer host is required in send mode")
+        if duration is not None and (duration <= 0 or duration > self.max_duration):
+            raise ValueError(
+                f"Duration must be between 1 and {self.max_duration} seconds"
+            )
+        if not os.path.exists(self.network_script_path):
+            raise RuntimeError("Network stress script is missing")
+
+        args = [
+            "--protocol",
+            protocol.value,
+            "--mode",
+            mode.value,
+            "--port",
+            str(port),
+            "--message-size",
+            str(message_size),
+            "--connections",
+            str(connections),
+        ]
+        if host:
+            args += ["--host", host]
+        if rate_mbps:
+            args += ["--rate-mbps", str(rate_mbps)]
+        if duration:
+            args += ["--duration", str(duration)]
+
+        self.stop_network_load()
+        try:
+            self.network_process = WorkerProcess(self.network_script_path, *args)
+        except Exception as e:
+            raise RuntimeError(f"Failed to start network stress: {e}")
 
-        def apply_dynamic_cpu_load(interval_num):
-            global cpu_requested
-            current_cpu = min(start_value + increment * (interval_num + 1), end_value)
-            self.add_cpu_load(current_cpu)
+    def stop_network_load(self):
+        if self.network_process:
+            self.network_process.stop()
+            self.network_process = None
 
-            if interval_num + 1 < num_intervals:
-                timer = Timer(10, apply_dynamic_cpu_load, [interval_num + 1])
-                self.cpu_timers.append(timer)
-                timer.start()
+    def add_http_load(
+        self,
+        url: str,
+        rate: float,
+        arrival: HttpArrival = HttpArrival.CONSTANT,
+        connections: int = 10,
+        method: HttpMethod = HttpMethod.GET,
+        headers: dict[str, str] | None = None,
+        body: str | None = None,
+        timeout: float = 10,
+        duration: int | None = None,
+    ):
+        """Start an open-loop HTTP load of `rate` requests per second
+
+        Requests are scheduled at constant or Poisson intervals whatever the
+        response times, over a pool of `connections` keep-alive connections.
+        A URL starting with `/` targets this instance.
+        """
+        if url.startswith("/"):
+            url = self.self_url + url
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("URL must be an absolute http(s) URL or a path")
+        headers = headers or {}
+        texts = (url, *headers.keys(), *headers.values())
+        if any("\r" in text or "\n" in text for text in texts):
+            raise ValueError("URL and headers cannot contain line breaks")
+        if any(not name or ":" in name for name in headers):
+            raise ValueError("Invalid header name")
+        if rate <= 0 or rate > MAX_HTTP_RATE:
+            raise ValueError(f"Rate must be between 0 and {MAX_HTTP_RATE} requests/s")
+        if connections < 1 or connections > MAX_HTTP_CONNECTIONS:
+            raise ValueError(
+                f"Connections must be between 1 and {MAX_HTTP_CONNECTIONS}"
+            )
+        if timeout <= 0:
+            raise ValueError("Timeout must be greater than 0")
+        if duration is not None and (duration <= 0 or duration > self.max_duration):
+            raise ValueError(
+                f"Duration must be between 1 and {self.max_duration} seconds"
+            )
+        if not os.path.exists(self.http_script_path):
+            raise RuntimeError("HTTP stress script is missing")
+
+        args = [
+            "--url",
+            url,
+            "--rate",
+            str(rate),
+            "--arrival",
+            HttpArrival(arrival).value,
+            "--connections",
+            str(connections),
+            "--method",
+            HttpMethod(method).value,
+            "--timeout",
+            str(timeout),
+        ]
+        for name, value in headers.items():
+            args += ["--header", f"{name}: {value}"]
+        if body is not None:
+            args += ["--body", body]
+        if duration:
+            args += ["--duration", str(duration)]
+
+        self.stop_http_load()
+        try:
+            self.http_process = WorkerProcess(self.http_script_path, *args)
+        except Exception as e:
+            raise RuntimeError(f"Failed to start HTTP stress: {e}")
 
-            elif stop_at_end:
-                stop_timer = Timer(10, self.stop_cpu_load)
-                stop_timer.start()
+    def stop_http_load(self):
+        if self.http_process:
+            self.http_process.stop()
+            self.http_process = None
 
-        apply_dynamic_cpu_load(0)
+    def add_churn_load(
+        self,
+        rate: float,
+        host: str | None = None,
+        port: int | None = None,
+        hold_ms: float = 0,
+        linger_zero: bool = False,
+        timeout: float = 5,
+        duration: int | None = None,
+    ):
+        """Start a load opening and closing `rate` TCP connections per second
+
+        Without `host` the worker connects to its own local listener. Each
+        connection stays open `hold_ms` and is closed by the client, leaving
+        it in TIME_WAIT, or reset when `linger_zero` is set.
+        """
+        if rate <= 0 or rate > MAX_CHURN_RATE:
+            raise ValueError(
+                f"Rate must be between 0 and {MAX_CHURN_RATE} connections/s"
+            )
+        if host and not port:
+            raise ValueError("A port is required with a target host")
+        if port is not None and (port < 1 or port > 65535):
+            raise ValueError("Port must be between 1 and 65535")
+        if hold_ms < 0 or hold_ms > MAX_CHURN_HOLD_MS:
+            raise ValueError(f"Hold time must be between 0 and {MAX_CHURN_HOLD_MS}ms")
+        if timeout <= 0:
+            raise ValueError("Timeout must be greater than 0")
+        if duration is not None and (duration <= 0 or duration > self.max_duration):
+            raise ValueError(
+                f"Duration must be between 1 and {self.max_duration} seconds"
+            )
+        if not os.path.exists(self.churn_script_path):
+            raise RuntimeError("Churn stress script is missing")
+
+        args = [
+            "--rate",
+            str(rate),
+            "--hold-ms",
+            str(hold_ms),
+            "--timeout",
+            str(timeout),
+        ]
+        if host:
+            args += ["--host", host, "--port", str(port)]
+        if linger_zero:
+            args.append("--linger-zero")
+        if duration:
+            args += ["--duration", str(duration)]
+
+        self.stop_churn_load()
+        try:
+            self.churn_process = WorkerProcess(self.churn_script_path, *args)
+        except Exception as e:
+            raise RuntimeError(f"Failed to start churn stress: {e}")
+
+    def stop_churn_load(self):
+        if self.churn_process:
+            self.churn_process.stop()
+            self.churn_process = None
+
+    def _worker_pids(self) -> dict[str, int | None]:
+        """Root process of each running load, sampled with its children"""
+        processes = {
+            "cpu": self.cpu_processes[0] if self.cpu_processes else None,
+            "memory": self.memory_process,
+            "bandwidth": self.bandwidth_process,
+            "disk": self.disk_process,
+            "network": self.network_process,
+            "http": self.http_process,
+            "churn": self.churn_process,
+        }
+        return {name: p.pid if p else None for name, p in processes.items()}
+
+    @property
+    def cpu_stats(self) -> dict:
+        """Latest report of the CPU worker pool"""
+        return self.cpu_processes[0].stats if self.cpu_processes else {}
+
+    @property
+    def cpu_ramp_error(self) -> str | None:
+        """Error that stopped the current CPU ramp early"""
+        return self.cpu_ramp.error if self.cpu_ramp else None
+
+    @property
+    def memory_ramp_error(self) -> str | None:
+        """Error that stopped the current memory ramp early"""
+        return self.memory_ramp.error if self.memory_ramp else None
+
+    @property
+    def bandwidth_active(self) -> bool:
+        return bool(self.bandwidth_process and self.bandwidth_process.is_alive())
+
+    @property
+    def disk_active(self) -> bool:
+        return bool(self.disk_process and self.disk_process.is_alive())
+
+    @property
+    def network_active(self) -> bool:
+        return bool(self.network_process and self.network_process.is_alive())
+
+    @property
+    def http_active(self) -> bool:
+        return bool(self.http_process and self.http_process.is_alive())
+
+    @property
+    def churn_active(self) -> bool:
+        return bool(self.churn_process and self.churn_process.is_alive())
@@ -0,0 +1,150 @@
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Callable
+
+import psutil
+
+from .capacity import CgroupCapacity
+
+MB = 1024 * 1024
+
+
+class LoadSampler:
+    """Background sampler of the load actually consumed by the workers
+
+    Every `interval` seconds the CPU time and RSS of each worker process tree
+    are summed, along with the container totals read from cgroups, and the
+    sample is appended to a ring buffer of `history_size` entries.
+    psutil.Process handles are cached across samples so that each sample
+    only costs one cpu_times/memory_info read per process.
+    """
+
+    def __init__(
+        self,
+        roots: Callable[[], dict[str, int | None]],
+        requested: Callable[[], dict],
+        capacity: CgroupCapacity,
+        interval: float = 1.0,
+        history_size: int = 600,
+    ):
+        if interval <= 0:
+            raise ValueError("Sample interval must be greater than 0")
+        if history_size < 1:
+            raise ValueError("History size must be at least 1")
+        self.roots = roots
+        self.requested = requested
+        self.capacity = capacity
+        self.interval = interval
+        self.history = deque(maxlen=history_size)
+        self._handles: dict[int, psutil.Process] = {}
+        self._cpu_times: dict[int, float] = {}
+        self._container_cpu = None
+        self._last = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            # The thread only holds a weak reference so that the owner of the
+            # sampler can still be garbage collected
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(weakref.ref(self), self._stopped, self.interval),
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    @staticmethod
+    def _run(ref: weakref.ref, stopped: threading.Event, interval: float):
+        next_sample = time.monotonic()
+        while True:
+            sampler = ref()
+            if sampler is None:
+                return
+            sampler.sample()
+            del sampler
+            next_sample += interval
+            if stopped.wait(max(0.0, next_sample - time.monotonic())):
+                return
+
+    def _handle(self, pid: int) -> psutil.Process:
+        handle = self._handles.get(pid)
+        if handle is None:
+            handle = self._handles[pid] = psutil.Process(pid)
+        return handle
+
+    def _tree(self, pid: int) -> list[psutil.Process]:
+        """Cached handles of a worker process and its descendants"""
+        try:
+            root = self._handle(pid)
+            return [root] + [self._handle(child.pid) for child in root.children(True)]
+        except psutil.Error:
+            return []
+
+    def sample(self) -> dict:
+        """Take one sample and append it to the history"""
+        now = time.monotonic()
+        elapsed = now - self._last if self._last is not None else None
+        self._last = now
+
+        seen = set()
+        loads = {}
+        for name, pid in self.roots().items():
+            cpu_seconds, rss = 0.0, 0
+            for process in self._tree(pid) if pid else []:
+                try:
+                    with process.oneshot():
+                        times = process.cpu_times()
+                        rss += process.memory_info().rss
+                except psutil.Error:
+                    continue
+                total = times.user + times.system
+                # New processes only count from their second sample
+                cpu_seconds += total - self._cpu_times.get(process.pid, total)
+                self._cpu_times[process.pid] = total
+                seen.add(process.pid)
+            loads[name] = {
+                "cpu": round(cpu_seconds / elapsed, 3) if elapsed else None,
+                "rss_mb": rss // MB,
+            }
+
+        for pid in set(self._handles) - seen:
+            self._handles.pop(pid, None)
+            self._cpu_times.pop(pid, None)
+
+        container_cpu = None
+        usage = self.capacity.cpu_usage_seconds()
+        if usage is not None and self._container_cpu is not None and elapsed:
+            container_cpu = round((usage - self._container_cpu) / elapsed, 3)
+        self._container_cpu = usage
+
+        measured_cpu = [load["cpu"] for load in loads.values() if load["cpu"]]
+        sample = {
+            "timestamp": round(time.time(), 3),
+            **self.requested(),
+            "cpu_measured": round(sum(measured_cpu), 3) if elapsed else None,
+            "memory_measured": sum(load["rss_mb"] for load in loads.values()),
+            "container_cpu": container_cpu,
+            "container_memory": self.capacity.memory_usage_mb(),
+            "loads": loads,
+        }
+        self.history.append(sample)
+        return sample
+
+    @property
+    def latest(self) -> dict:
+        return self.history[-1] if self.history else {}
+
+    def series(self, seconds: float | None = None) -> list[dict]:
+        """Samples of the last `seconds` seconds, oldest first"""
+        samples = list(self.history)
+        if seconds is None:
+            return samples
+        since = time.time() - seconds
+        return [sample for sample in samples if sample["timestamp"] >= since]
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import TextIO
+from ..models.schemas import LogOverflowPolicy
+from .histogram import LatencyHistogram
+from .log_sinks import LogSink, StreamSink
+
+# Fill ratio above which the sample policy starts thinning the lines
+SAMPLE_THRESHOLD = 0.5
+FLUSH_TIMEOUT = 5.0
+
+
+def on_event_loop() -> bool:
+    """Whether the caller is running an asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class LogEmitter:
+    """Bounded log buffer drained to a sink by a dedicated writer thread
+
+    Callers only format lines and append them to the buffer; the writer
+    thread does the write and flush, coalescing everything queued since its
+    last write, and records how long each write took. When the buffer holds `max_lines` lines the overflow policy
+    applies: `block` waits for room, `drop` discards the new lines, and
+    `sample` keeps one chunk in `1 / sample_rate` once the buffer is half
+    full, dropping the rest.
+    """
+
+    def __init__(
+        self,
+        stream: LogSink | TextIO,
+        max_lines: int = 10000,
+        policy: LogOverflowPolicy = LogOverflowPolicy.BLOCK,
+        sample_rate: float = 0.1,
+    ):
+        if max_lines < 1:
+            raise ValueError("Log queue size must be at least 1")
+        if not 0 < sample_rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1")
+        # Plain text streams such as stderr are wrapped
+        self.sink = stream if isinstance(stream, LogSink) else StreamSink(stream)
+        self.max_lines = max_lines
+        self.policy = LogOverflowPolicy(policy)
+        self.sample_every = max(1, round(1 / sample_rate))
+
+        # Written lines per level and bytes, updated by the writer thread only
+        self.lines: dict[str, int] = {}
+        self.bytes_written = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.write_errors = 0
+        self.latency = LatencyHistogram()
+
+        self._chunks = deque()
+        self._queued = 0
+        self._sampled = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _offer(self, text: str, count: int, level: str, wait: bool) -> int | None:
+        """Queue the lines if the policy lets them in now, with the lock held
+
+        Returns the lines accepted, or None when the block policy has to wait
+        for room.
+        """
+        full = self._queued and self._queued + count > self.max_lines
+        if full and self.policy == LogOverflowPolicy.BLOCK and wait:
+            if not self._closed:
+                return None
+        elif full:
+            self.dropped += count
+            return 0
+        elif (
+            self.policy == LogOverflowPolicy.SAMPLE
+            and self._queued >= self.max_lines * SAMPLE_THRESHOLD
+        ):
+            self._sampled += 1
+            if self._sampled % self.sample_every:
+                self.dropped += count
+                return 0
+        self._chunks.append((text, count, level))
+        self._queued += count
+        self.max_depth = max(self.max_depth, self._queued)
+        self._cond.notify_all()
+        return count
+
+    def submit(
+        self, text: str, count: int = 1, level: str = "INFO", wait: bool = True
+    ) -> int:
+        """Queue `count` formatted lines, returns how many were accepted
+
+        With `wait=False` the block policy drops the lines instead of waiting.
+        Waiting blocks the calling thread: code running on the event loop
+        uses `asubmit` instead.
+        """
+        with self._cond:
+            accepted = self._offer(text, count, level, wait)
+            while accepted is None:
+                self._cond.wait()
+                accepted = self._offer(text, count, level, wait)
+        return accepted
+
+    async def asubmit(self, text: str, count: int = 1, level: str = "INFO") -> int:
+        """Queue `count` formatted lines from the event loop
+
+        When the block policy has to wait for room, the wait happens in a
+        worker thread, so the caller is held back without stalling the loop.
+        """
+        with self._cond:
+            accepted = self._offer(text, count, level, True)
+        if accepted is None:
+            accepted = await asyncio.to_thread(self.submit, text, count, level)
+        return accepted
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._chunks and not self._closed:
+                    # Wake up while idle if the sink buffers lines
+                    if not self._cond.wait(self.sink.flush_interval):
+                        break
+                chunks = list(self._chunks)
+                self._chunks.clear()
+                closed = self._closed
+
+            # I/O happens outside the lock so producers never wait on it
+            if not chunks:
+                try:
+                    if closed:
+                        self.sink.close()
+                    else:
+                        self.sink.flush()
+                except (OSError, ValueError):
+                    self.write_errors += 1
+                if closed:
+                    return
+                continue
+
+            start = time.perf_counter()
+            try:
+                self.sink.write_chunks(chunks)
+                self.sink.flush()
+                written = True
+            except (OSError, ValueError):
+                self.write_errors += 1
+                written = False
+            self.latency.record(time.perf_counter() - start)
+
+            with self._cond:
+                for text, count, level in chunks:
+                    self._queued -= count
+                    # Lines of a failed write are lost, they count as dropped
+                    if not written:
+                        self.dropped += count
+                        continue
+                    self.lines[level] = self.lines.get(level, 0) + count
+                    self.bytes_written += (
+                        len(text) if text.isascii() else len(text.encode())
+                    )
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = FLUSH_TIMEOUT) -> bool:
+        """Wait until every queued line is written"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._queued == 0, timeout)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def queued(self) -> int:
+        """Lines waiting for the writer thread"""
+        return self._queued
+
+    def stats(self) -> dict:
+        return {
+            "sink": self.sink.name,
+            "policy": self.policy.value,
+            "max_lines": self.max_lines,
+            "queued": self.queued,
+            "max_depth": self.max_depth,
+            "written": sum(self.lines.values()),
+            "bytes_written": self.bytes_written,
+            "dropped": self.dropped,
+            "write_errors": self.write_errors,
+            "write_latency": self.latency.to_dict(),
+            **self.sink.stats(),
+        }
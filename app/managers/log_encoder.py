@@ -0,0 +1,115 @@
+import json
+import time
+from ..models.schemas import LogFormat
+
+# Compiled templates kept per encoder, the cache is reset when full
+MAX_TEMPLATES = 1024
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class TimestampCache:
+    """logging.Formatter.formatTime output, computed once per millisecond
+
+    The local date and time is only formatted when the second changes, the
+    milliseconds are appended when the millisecond changes. The cached value
+    is a single tuple so concurrent callers always read a consistent pair.
+    """
+
+    def __init__(self):
+        self._second = (None, "")
+        self._millisecond = (None, "")
+
+    def format(self, created: float | None = None) -> str:
+        if created is None:
+            created = time.time()
+        second = int(created)
+        key = second * 1000 + int((created - second) * 1000)
+        cached_key, text = self._millisecond
+        if key == cached_key:
+            return text
+
+        cached_second, prefix = self._second
+        if second != cached_second:
+            prefix = time.strftime(TIME_FORMAT, time.localtime(created))
+            self._second = (second, prefix)
+        text = f"{prefix},{key - second * 1000:03d}"
+        self._millisecond = (key, text)
+        return text
+
+
+class LogEncoder:
+    """Fast-path encoder for the JSON and plaintext log formats
+
+    Everything but the timestamp is static for a given level, service and
+    message, so it is escaped once into a prefix and a suffix; encoding a
+    line is then two concatenations around the cached timestamp. Lines of a
+    batch share their timestamp and are produced by repeating one line.
+    Output is identical to JsonFormatter and PlainTextFormatter.
+    """
+
+    def __init__(self, format_type: LogFormat, clock: TimestampCache | None = None):
+        self.format_type = LogFormat(format_type)
+        self.clock = clock or TimestampCache()
+        self._templates: dict[tuple, tuple[str, str, str]] = {}
+        self._heads: dict[tuple, tuple[str, str]] = {}
+
+    def _compile(self, level: str, service, message: str) -> tuple[str, str, str]:
+        if self.format_type == LogFormat.JSON:
+            prefix = '{"timestamp": "'
+            suffix = (
+                f'", "level": {json.dumps(level)}, "service": {json.dumps(service)}'
+                f', "message": {json.dumps(message)}}}'
+            )
+        else:
+            prefix = ""
+            suffix = f" | {level} | {service} | {message}"
+        template = (prefix, suffix, suffix + "\n")
+
+        if len(self._templates) >= MAX_TEMPLATES:
+            self._templates.clear()
+        self._templates[(level, service, message)] = template
+        return template
+
+    def line(self, level: str, service, message: str, created=None) -> str:
+        """One line without its terminator"""
+        template = self._templates.get((level, service, message))
+        if template is None:
+            template = self._compile(level, service, message)
+        return template[0] + self.clock.format(created) + template[1]
+
+    def encode(
+        self, level: str, service, message: str, count: int = 1, created=None
+    ) -> str:
+        """`count` newline-terminated lines"""
+        template = self._templates.get((level, service, message))
+        if template is None:
+            template = self._compile(level, service, message)
+        return (template[0] + self.clock.format(created) + template[2]) * count
+
+    def _head(self, level: str, service) -> tuple[str, str]:
+        """Static parts around the timestamp, before a generated body"""
+        if self.format_type == LogFormat.JSON:
+            head = (
+                '{"timestamp": "',
+                f'", "level": {json.dumps(level)}, "service": {json.dumps(service)}, ',
+            )
+        else:
+            head = ("", f" | {level} | {service} | ")
+        if len(self._heads) >= MAX_TEMPLATES:
+            self._heads.clear()
+        self._heads[(level, service)] = head
+        return head
+
+    def encode_bodies(
+        self, level: str, service, bodies: list[str], created=None
+    ) -> str:
+        """One line per pre-rendered body, sharing the same timestamp
+
+        Bodies come from a PayloadGenerator for the same format and carry
+        their own terminator.
+        """
+        if not bodies:
+            return ""
+        head = self._heads.get((level, service)) or self._head(level, service)
+        start = head[0] + self.clock.format(created) + head[1]
+        return start + start.join(bodies)
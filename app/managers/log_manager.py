@@ -1,31 +1,260 @@
 import logging
-import json
 from datetime import datetime, UTC
 import time
 import os
-from ..models.schemas import LogRequest, LogFormat
+import sys
+from ..models.schemas import (
+    LogRequest,
+    LogFormat,
+    LogOverflowPolicy,
+    LogSinkConfig,
+    LogSinkType,
+)
+from .log_emitter import LogEmitter, on_event_loop
+from .log_encoder import LogEncoder
+from .log_payload import PayloadGenerator
+from .log_sinks import make_sink, sink_name
 import asyncio
+import uuid
 
+# Token bucket of the rate-driven floods
+FLOOD_TICK = 0.01
+FLOOD_BURST = 0.1  # seconds of lines the bucket can hold
+MAX_LOG_RATE = 100_000
+# Finished log jobs kept for GET /log/jobs
+MAX_JOBS = 50
+# Payload generators kept for reuse across requests
+MAX_GENERATORS = 16
+MAX_STREAMS = 64
+MAX_SINKS = 16
 
-class JsonFormatter(logging.Formatter):
-    """Custom formatter for JSON logs"""
+# Log job kinds
+RECURRING = "recurring"
+FLOOD = "flood"
+AUTOMATIC = "automatic"
+
+
+class EncodingFormatter(logging.Formatter):
+    """Formatter delegating to a LogEncoder"""
+
+    format_type = LogFormat.JSON
+
+    def __init__(self, encoder: LogEncoder | None = None):
+        super().__init__()
+        self.encoder = encoder or LogEncoder(self.format_type)
 
     def format(self, record):
-        return json.dumps(
-            {
-                "timestamp": self.formatTime(record),
-                "level": record.levelname,
-                "service": getattr(record, "service", "-"),
-                "message": record.getMessage(),
-            }
+        return self.encoder.line(
+            record.levelname,
+            getattr(record, "service", "-"),
+            record.getMessage(),
+            record.created,
         )
 
 
-class PlainTextFormatter(logging.Formatter):
+class JsonFormatter(EncodingFormatter):
+    """Custom formatter for JSON logs"""
+
+    format_type = LogFormat.JSON
+
+
+class PlainTextFormatter(EncodingFormatter):
     """Custom formatter for plain text logs"""
 
-    def format(self, record):
-        return f"{self.formatTime(record)} | {record.levelname} | {getattr(record, 'service', '-')} | {record.getMessage()}"
+    format_type = LogFormat.PLAINTEXT
+
+
+class LogStream:
+    """Named log output with its own encoder and sink
+
+    The encoder is built once for the stream format, so streams in
+    different formats write concurrently without reconfiguring anything.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        format_type: LogFormat,
+        sink: LogEmitter,
+        builtin: bool = False,
+    ):
+        self.name = name
+        self.format_type = LogFormat(format_type)
+        self.sink = sink
+        self.builtin = builtin
+        self.formatter = (
+            JsonFormatter()
+            if self.format_type == LogFormat.JSON
+            else PlainTextFormatter()
+        )
+        self.encoder = self.formatter.encoder
+        self.created_at = round(time.time(), 3)
+        self.emitted = 0
+        self.dropped = 0
+
+    def _count(self, count: int, accepted: int) -> int:
+        self.emitted += accepted
+        self.dropped += count - accepted
+        return accepted
+
+    def _encode(self, level: str, service, message: str, count: int, generator):
+        if generator is None:
+            return self.encoder.encode(level, service, message, count)
+        return self.encoder.encode_bodies(level, service, generator.bodies(count))
+
+    def emit_record(self, record: logging.LogRecord, wait: bool = True) -> int:
+        text = self.formatter.format(record) + "\n"
+        return self._count(1, self.sink.submit(text, 1, record.levelname, wait))
+
+    async def aemit_record(self, record: logging.LogRecord) -> int:
+        """Like `emit_record`, waiting for room without stalling the event loop"""
+        text = self.formatter.format(record) + "\n"
+        return self._count(1, await self.sink.asubmit(text, 1, record.levelname))
+
+    def emit_lines(
+        self,
+        level: str,
+        service,
+        message: str,
+        count: int,
+        wait: bool = True,
+        generator: PayloadGenerator | None = None,
+    ) -> int:
+        """Queue `count` lines as one chunk, returns the lines accepted
+
+        Skips LogRecord creation entirely: the encoder renders one line and
+        repeats it, or renders the bodies drawn from `generator`.
+        """
+        if count < 1:
+            return 0
+        text = self._encode(level, service, message, count, generator)
+        return self._count(count, self.sink.submit(text, count, level, wait))
+
+    async def aemit_lines(
+        self,
+        level: str,
+        service,
+        message: str,
+        count: int,
+        generator: PayloadGenerator | None = None,
+    ) -> int:
+        """Like `emit_lines`, waiting for room without stalling the event loop"""
+        if count < 1:
+            return 0
+        text = self._encode(level, service, message, count, generator)
+        return self._count(count, await self.sink.asubmit(text, count, level))
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "format": self.format_type.value,
+            "sink": self.sink.sink.name,
+            "builtin": self.builtin,
+            "created_at": self.created_at,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+        }
+
+
+class QueueingHandler(logging.Handler):
+    """Handler routing each record to its log stream
+
+    Records name their stream in `record.stream`; the others go to the
+    default stream. The stream formats the record in the caller and queues
+    the line, the write itself is done by the sink writer thread. A record
+    logged from the event loop never waits for room in the queue: when it is
+    full the line counts as dropped by its stream.
+    """
+
+    def __init__(self, streams: dict[str, LogStream], default: str):
+        super().__init__()
+        self.streams = streams
+        self.default = default
+
+    def emit(self, record):
+        # Already queued by LogManager, which only logs it for the other handlers
+        if getattr(record, "queued", False):
+            return
+        try:
+            stream = self.streams.get(getattr(record, "stream", None))
+            (stream or self.streams[self.default]).emit_record(
+                record, wait=not on_event_loop()
+            )
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        for sink in {id(s.sink): s.sink for s in self.streams.values()}.values():
+            sink.flush()
+
+
+class LogJob:
+    """Background log emission tracked until it ends or is cancelled"""
+
+    kind = RECURRING
+
+    def __init__(self, log_data: LogRequest, stream: str, kind: str | None = None):
+        self.id = uuid.uuid4().hex[:8]
+        self.kind = kind or self.kind
+        self.stream = stream
+        self.level = log_data.level.upper()
+        self.message = log_data.message
+        self.interval = log_data.interval
+        self.rate = 1 / log_data.interval if log_data.interval else None
+        self.duration = log_data.duration
+        self.started_at = round(time.time(), 3)
+        self.elapsed = 0.0
+        self.emitted = 0
+        # Lines not written because of an error or a full log queue
+        self.failed = 0
+        self.last_error = None
+        self.active = True
+        self.cancelled = False
+        self.task = None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "stream": self.stream,
+            "level": self.level,
+            "message": self.message,
+            "interval": self.interval,
+            "rate": self.rate,
+            "duration": self.duration,
+            "active": self.active,
+            "cancelled": self.cancelled,
+            "started_at": self.started_at,
+            "elapsed": round(self.elapsed, 3),
+            "emitted": self.emitted,
+            "failed": self.failed,
+            "last_error": self.last_error,
+            "achieved_rate": (
+                round(self.emitted / self.elapsed, 1) if self.elapsed else 0.0
+            ),
+        }
+
+
+class LogFlood(LogJob):
+    """Rate-driven log emission and the rate it actually achieved"""
+
+    kind = FLOOD
+
+    def __init__(self, log_data: LogRequest, stream: str):
+        super().__init__(log_data, stream)
+        self.rate = log_data.rate
+        self.dropped = 0
+
+    def to_dict(self) -> dict:
+        expected = self.rate * self.elapsed
+        return {
+            **super().to_dict(),
+            "dropped": self.dropped,
+            "shortfall": max(0, int(expected - self.emitted)),
+            "shortfall_ratio": (
+                round(max(0.0, 1 - self.emitted / expected), 4) if expected else 0.0
+            ),
+        }
 
 
 class LogManager:
@@ -33,38 +262,170 @@ class LogManager:
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)
 
-        self.text_formatter = PlainTextFormatter()
-        self.json_formatter = JsonFormatter()
+        self.queue_size = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+        self.overflow_policy = LogOverflowPolicy(
+            os.getenv("LOG_OVERFLOW_POLICY", "block")
+        )
+        self.sample_rate = float(os.getenv("LOG_SAMPLE_RATE", 0.1))
+        self.file_dir = os.path.abspath(os.getenv("LOG_FILE_DIR", "/tmp/stressed-logs"))
 
-        self._setup_handler(LogFormat.JSON)
+        # Sink of the streams writing to stderr, the others are created on use
+        self.emitter = LogEmitter(
+            sys.stderr, self.queue_size, self.overflow_policy, self.sample_rate
+        )
+        self.sinks: dict[str, LogEmitter] = {"stderr": self.emitter}
+        self._sink_configs: dict[str, LogSinkConfig] = {"stderr": LogSinkConfig()}
+
+        # One builtin stream per format, used by requests naming no stream
+        self.streams: dict[str, LogStream] = {
+            format_type.value: LogStream(
+                format_type.value, format_type, self.emitter, builtin=True
+            )
+            for format_type in LogFormat
+        }
+        self.json_formatter = self.streams[LogFormat.JSON.value].formatter
+        self.text_formatter = self.streams[LogFormat.PLAINTEXT.value].formatter
+
+        self._setup_handler()
         self.current_format = LogFormat.JSON
 
         # Store references to automatic log tasks
         self._automatic_log_tasks = []
+        # Every background job, tracked the same way
+        self.jobs: dict[str, LogJob] = {}
+        self._generators: dict[tuple, PayloadGenerator] = {}
 
         # Start automatic logging if enabled
         if os.getenv("ENABLE_AUTOMATIC_LOGS", "false").lower() == "true":
             self._start_automatic_logs()
 
-    def _setup_handler(self, format_type: LogFormat):
-        """Configure a new handler with the specified format"""
+    def _setup_handler(self):
+        """Install the handler routing records to their stream, once"""
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
 
-        self.handler = logging.StreamHandler()
+        self.handler = QueueingHandler(self.streams, LogFormat.JSON.value)
         self.handler.setLevel(logging.DEBUG)
-
-        formatter = (
-            self.json_formatter
-            if format_type == LogFormat.JSON
-            else self.text_formatter
-        )
-        self.handler.setFormatter(formatter)
+        # Formatter of the default stream
+        self.handler.setFormatter(self.json_formatter)
 
         self.logger.addHandler(self.handler)
 
-    def _validate_interval_duration(self, interval: int | None, duration: int | None):
+    def __del__(self):
+        for sink in self.sinks.values():
+            sink.close()
+
+    def get_sink(self, config: LogSinkConfig) -> LogEmitter:
+        """Sink writing to the destination of `config`, created on first use
+
+        Streams writing to the same destination share its sink, so its lines
+        are never interleaved by two writers.
+        """
+        if config.type == LogSinkType.FILE:
+            path = os.path.normpath(os.path.join(self.file_dir, config.path))
+            if not path.startswith(self.file_dir + os.sep):
+                raise ValueError("Log file path must stay inside LOG_FILE_DIR")
+            config = config.model_copy(update={"path": path})
+        name = sink_name(config)
+        if name in self.sinks:
+            if config != self._sink_configs[name]:
+                raise ValueError(f"Log sink {name} exists with other options")
+            return self.sinks[name]
+        if len(self.sinks) >= MAX_SINKS:
+            raise ValueError(f"Cannot create more than {MAX_SINKS} log sinks")
+        try:
+            sink = make_sink(config)
+        except OSError as e:
+            raise ValueError(f"Cannot open log sink {name}: {e}")
+        self.sinks[name] = LogEmitter(
+            sink, self.queue_size, self.overflow_policy, self.sample_rate
+        )
+        self._sink_configs[name] = config
+        return self.sinks[name]
+
+    def get_stream(self, name: str) -> LogStream:
+        if name not in self.streams:
+            raise KeyError(f"Unknown log stream: {name}")
+        return self.streams[name]
+
+    def create_stream(
+        self, name: str, format_type: LogFormat, sink: LogSinkConfig | None = None
+    ) -> LogStream:
+        if name in self.streams:
+            raise ValueError(f"Log stream {name} already exists")
+        if len(self.streams) >= MAX_STREAMS:
+            raise ValueError(f"Cannot create more than {MAX_STREAMS} log streams")
+        emitter = self.get_sink(sink) if sink else self.emitter
+        self.streams[name] = LogStream(name, format_type, emitter)
+        return self.streams[name]
+
+    def delete_stream(self, name: str) -> LogStream:
+        """Delete a stream, refused while running jobs still write to it"""
+        stream = self.get_stream(name)
+        if stream.builtin:
+            raise ValueError(f"Log stream {name} is builtin")
+        users = [
+            job.id
+            for job in self.jobs.values()
+            if job.active and not job.cancelled and job.stream == name
+        ]
+        if users:
+            raise ValueError(
+                f"Log stream {name} is used by running jobs: {', '.join(users)}"
+            )
+        return self.streams.pop(name)
+
+    def _stream(self, log_data: LogRequest) -> LogStream:
+        """Stream named by a request, or the builtin stream of its format
+
+        A request with its own sink gets a stream per format and sink.
+        """
+        if log_data.stream:
+            if log_data.sink:
+                raise ValueError("Use either stream or sink")
+            return self.get_stream(log_data.stream)
+        if log_data.sink:
+            emitter = self.get_sink(log_data.sink)
+            name = f"{log_data.format.value}@{emitter.sink.name}"
+            if name not in self.streams:
+                self.create_stream(name, log_data.format, log_data.sink)
+            return self.streams[name]
+        return self.streams[log_data.format.value]
+
+    @property
+    def lines_emitted(self) -> dict[str, int]:
+        """Lines written per level, over every sink"""
+        lines = {}
+        for sink in self.sinks.values():
+            for level, count in sink.lines.items():
+                lines[level] = lines.get(level, 0) + count
+        return lines
+
+    @property
+    def bytes_emitted(self) -> int:
+        return sum(sink.bytes_written for sink in self.sinks.values())
+
+    @property
+    def lines_dropped(self) -> int:
+        return sum(sink.dropped for sink in self.sinks.values())
+
+    def _validate_interval_duration(
+        self, interval: int | None, duration: int | None, rate: float | None = None
+    ):
         """check parameters"""
+        if rate is not None:
+            if interval is not None:
+                raise ValueError("Use either interval or rate")
+            if duration is None:
+                raise ValueError("Duration must be set when rate is provided")
+            if rate <= 0 or rate > MAX_LOG_RATE:
+                raise ValueError(
+                    f"Rate must be between 0 and {MAX_LOG_RATE} lines per second"
+                )
+            if duration < 1:
+                raise ValueError("Duration must be greater than 0")
+            return
+
         if interval is not None and duration is None:
             raise ValueError("Duration must be set when interval is provided")
 
@@ -99,60 +460,220 @@ class LogManager:
 
         # Setup recurring logs if needed
         if log_data.interval and log_data.duration:
-            task_recurring = asyncio.create_task(
-                self._create_recurring_logs(
-                    log_data, log_data.interval, log_data.duration
-                )
-            )
-            self._automatic_log_tasks.append(task_recurring)
+            job = self._start_recurring(log_data, AUTOMATIC)
+            self._automatic_log_tasks.append(job.task)
 
     async def create_log(self, log_data: LogRequest) -> dict | str:
         """Create log"""
         level = getattr(logging, log_data.level.upper())
 
-        self._validate_interval_duration(log_data.interval, log_data.duration)
+        self._validate_interval_duration(
+            log_data.interval, log_data.duration, log_data.rate
+        )
+        # Fail before starting anything if the stream does not exist
+        self._stream(log_data)
+
+        if log_data.rate:
+            flood = self._start_flood(log_data)
+            return {
+                "message": "Log flood started",
+                "id": flood.id,
+                "rate": flood.rate,
+                "duration": flood.duration,
+            }
 
         if log_data.interval and log_data.duration:
-            asyncio.create_task(
-                self._create_recurring_logs(
-                    log_data, log_data.interval, log_data.duration
-                )
-            )
+            job = self._start_recurring(log_data)
             return {
                 "message": "Recurring log creation started",
+                "id": job.id,
                 "interval": log_data.interval,
                 "duration": log_data.duration,
             }
 
         return await self._create_single_log(log_data, level)
 
+    @property
+    def floods(self) -> list[LogFlood]:
+        return [job for job in self.jobs.values() if isinstance(job, LogFlood)]
+
+    def _track(self, job: LogJob, coro) -> LogJob:
+        """Run a job coroutine as a task and keep the job until trimmed"""
+        job.task = asyncio.create_task(coro)
+        job.task.add_done_callback(lambda _: self._finished(job))
+        self.jobs[job.id] = job
+        finished = [key for key, other in self.jobs.items() if not other.active]
+        for key in finished[: max(0, len(self.jobs) - MAX_JOBS)]:
+            del self.jobs[key]
+        return job
+
+    def _finished(self, job: LogJob):
+        job.active = False
+
+    def _start_recurring(self, log_data: LogRequest, kind: str = RECURRING) -> LogJob:
+        job = LogJob(log_data, self._stream(log_data).name, kind)
+        return self._track(
+            job,
+            self._create_recurring_logs(
+                log_data, log_data.interval, log_data.duration, job
+            ),
+        )
+
+    def _start_flood(self, log_data: LogRequest) -> LogFlood:
+        flood = LogFlood(log_data, self._stream(log_data).name)
+        return self._track(flood, self._flood(flood, log_data))
+
+    def get_job(self, job_id: str) -> LogJob:
+        if job_id not in self.jobs:
+            raise KeyError(f"Unknown log job: {job_id}")
+        return self.jobs[job_id]
+
+    def cancel_job(self, job_id: str) -> LogJob:
+        job = self.get_job(job_id)
+        if not job.active:
+            raise ValueError(f"Log job {job_id} is not running")
+        job.cancelled = True
+        job.task.cancel()
+        return job
+
+    def cancel_jobs(self) -> list[LogJob]:
+        """Cancel every running job"""
+        running = [
+            job for job in self.jobs.values() if job.active and not job.cancelled
+        ]
+        return [self.cancel_job(job.id) for job in running]
+
+    async def _flood(self, flood: LogFlood, log_data: LogRequest):
+        """Emit log_data.rate lines per second for log_data.duration seconds
+
+        A token bucket refilled at the target rate decides how many lines to
+        write at each wake-up; they are queued as one batch. The bucket only
+        holds FLOOD_BURST seconds of lines, so when emission cannot keep up
+        the missing lines are dropped and show up as shortfall. Batches never
+        wait for room in the log queue: lines it refuses are dropped too.
+        """
+        loop = asyncio.get_running_loop()
+        level = log_data.level.upper()
+        service = log_data.service or "-"
+        stream = self._stream(log_data)
+        generator = self._generator(log_data, stream.format_type)
+        capacity = max(1.0, flood.rate * FLOOD_BURST)
+        start = last = loop.time()
+        end = start + flood.duration
+        tokens = 1.0
+        while True:
+            now = min(loop.time(), end)
+            tokens = min(capacity, tokens + (now - last) * flood.rate)
+            last = now
+            batch = int(tokens)
+            if batch:
+                accepted = stream.emit_lines(
+                    level, service, log_data.message, batch, False, generator
+                )
+                tokens -= batch
+                flood.emitted += accepted
+                flood.dropped += batch - accepted
+            flood.elapsed = now - start
+            if now >= end:
+                break
+            await asyncio.sleep(max(FLOOD_TICK, (1 - tokens) / flood.rate))
+
     async def _create_recurring_logs(
-        self, log_data: LogRequest, interval: int, duration: int
+        self,
+        log_data: LogRequest,
+        interval: int,
+        duration: int,
+        job: LogJob | None = None,
     ):
         """Create logs at regular intervals"""
-        end_time = time.time() + duration
+        start = time.time()
+        end_time = start + duration
+        level = getattr(logging, log_data.level.upper())
         while time.time() < end_time:
-            await self._create_single_log(
-                log_data, getattr(logging, log_data.level.upper())
-            )
+            try:
+                accepted = await self._write_single_log(log_data, level)
+                error = None if accepted else "Log line dropped by a full log queue"
+            except Exception as e:
+                accepted, error = False, str(e)
+            if job:
+                if accepted:
+                    job.emitted += 1
+                else:
+                    job.failed += 1
+                    job.last_error = error
+                job.elapsed = time.time() - start
             await asyncio.sleep(interval)
+        if job:
+            job.elapsed = min(time.time() - start, duration)
+
+    def _generator(
+        self, log_data: LogRequest, format_type: LogFormat
+    ) -> PayloadGenerator | None:
+        """Payload generator of a request, reused while its options match"""
+        if log_data.payload is None:
+            return None
+        key = (log_data.payload.model_dump_json(), log_data.message, format_type)
+        if key not in self._generators:
+            if len(self._generators) >= MAX_GENERATORS:
+                self._generators.clear()
+            self._generators[key] = PayloadGenerator(
+                log_data.payload, log_data.message, format_type
+            )
+        return self._generators[key]
+
+    async def emit(self, log_data: LogRequest, count: int = 1) -> int:
+        """Queue `count` log lines, returns the lines accepted
+
+        With the block policy it waits for room in the log queue.
+        """
+        stream = self._stream(log_data)
+        return await stream.aemit_lines(
+            log_data.level.upper(),
+            log_data.service or "-",
+            log_data.message,
+            count,
+            self._generator(log_data, stream.format_type),
+        )
+
+    async def _write_single_log(
+        self, log_data: LogRequest, level: int, timestamp: str | None = None
+    ) -> bool:
+        """Queue one log line, returns whether the log queue accepted it
+
+        The record is queued on its stream first, waiting for room with the
+        block policy, then handed to the logger so other handlers see it too.
+        """
+        stream = self._stream(log_data)
+        if log_data.payload:
+            return await self.emit(log_data) > 0
+        record = self.logger.makeRecord(
+            self.logger.name,
+            level,
+            __file__,
+            0,
+            log_data.message,
+            None,
+            None,
+            extra={
+                "service": log_data.service or "-",
+                "timestamp": timestamp or datetime.now(UTC).isoformat(),
+                "stream": stream.name,
+                "queued": True,
+            },
+        )
+        accepted = await stream.aemit_record(record)
+        self.logger.handle(record)
+        return accepted > 0
 
     async def _create_single_log(self, log_data: LogRequest, level: int) -> dict | str:
         """Create a single log"""
         try:
             timestamp = datetime.now(UTC).isoformat()
 
-            if log_data.format != self.current_format:
-                self._setup_handler(log_data.format)
-                self.current_format = log_data.format
-
-            self.logger.log(
-                level,
-                log_data.message,
-                extra={"service": log_data.service or "-", "timestamp": timestamp},
-            )
+            stream = self._stream(log_data)
+            await self._write_single_log(log_data, level, timestamp)
 
-            if log_data.format == LogFormat.PLAINTEXT:
+            if stream.format_type == LogFormat.PLAINTEXT:
                 service_part = log_data.service if log_data.service else "-"
                 return f"{timestamp} | {log_data.level.upper()} | {service_part} | {log_data.message}"
 
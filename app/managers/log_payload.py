@@ -0,0 +1,156 @@
+import json
+import math
+import random
+from ..models.schemas import LogFormat, LogPayload, LogSizeDistribution
+
+# Pre-rendered bodies a generator draws from
+POOL_SIZE = 512
+# Filler text is sliced out of one corpus, large enough for the largest message
+CORPUS_SIZE = 2 * 65536
+
+WORDS = (
+    "request processed handler cache miss upstream timeout retry session user "
+    "order payment queue worker batch commit index shard replica latency token "
+    "connection pool socket header payload checksum snapshot lease leader"
+).split()
+UTF8_WORDS = (
+    "données",
+    "größe",
+    "naïve",
+    "日志",
+    "请求",
+    "ошибка",
+    "κόμβος",
+    "🚀",
+    "✓",
+)
+EXCEPTIONS = ("ValueError", "KeyError", "TimeoutError", "ConnectionResetError")
+MODULES = ("api", "handlers", "service", "repository", "client", "pool", "codec")
+FUNCTIONS = ("handle", "dispatch", "process", "fetch", "decode", "execute", "send")
+
+FIELDS = {
+    "method": lambda rng: rng.choice(("GET", "GET", "GET", "POST", "PUT", "DELETE")),
+    "path": lambda rng: f"/api/v1/{rng.choice(WORDS)}/{rng.randint(1, 9999)}",
+    "status": lambda rng: rng.choice((200,) * 8 + (201, 204, 304, 400, 404, 500, 503)),
+    "duration_ms": lambda rng: round(rng.lognormvariate(3, 1), 2),
+    "user_id": lambda rng: f"user-{rng.randint(1, 10000)}",
+    "host": lambda rng: f"node-{rng.randint(1, 50)}",
+    "region": lambda rng: rng.choice(("eu-west-1", "us-east-1", "ap-south-1")),
+    "client_ip": lambda rng: f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+    "bytes": lambda rng: rng.randint(0, 1 << 20),
+    "trace_id": lambda rng: f"{rng.getrandbits(64):016x}",
+    "retry": lambda rng: rng.randint(0, 3),
+    "cached": lambda rng: rng.random() < 0.3,
+}
+
+
+class PayloadGenerator:
+    """Synthetic log bodies drawn from a pool rendered up front
+
+    The pool holds POOL_SIZE bodies, each the padded message, an optional
+    stack trace and the structured fields, already escaped for the output
+    format. Producing a batch is a random draw from the pool; only the
+    high-cardinality key is rendered per line, so its values are not bounded
+    by the pool size.
+    """
+
+    def __init__(
+        self,
+        payload: LogPayload,
+        message: str,
+        format_type: LogFormat,
+        pool_size: int = POOL_SIZE,
+    ):
+        self.payload = payload
+        self.message = message
+        self.format_type = LogFormat(format_type)
+        self.rng = random.Random(payload.seed)
+        self._corpus = self._make_corpus()
+
+        closing = "}\n" if self.format_type == LogFormat.JSON else "\n"
+        self._pool = [self._body() for _ in range(pool_size)]
+        self._closed_pool = [body + closing for body in self._pool]
+        if self.format_type == LogFormat.JSON:
+            self._key_prefix = f", {json.dumps(payload.cardinality_key)}: " + '"'
+            self._key_closing = '"' + closing
+        else:
+            self._key_prefix = f" {payload.cardinality_key}="
+            self._key_closing = closing
+
+    def _make_corpus(self) -> bytes:
+        words = []
+        size = 0
+        while size < CORPUS_SIZE:
+            if self.rng.random() < self.payload.utf8_ratio:
+                word = self.rng.choice(UTF8_WORDS)
+            else:
+                word = self.rng.choice(WORDS)
+            words.append(word)
+            size += len(word.encode()) + 1
+        return " ".join(words).encode()
+
+    def _size(self) -> int:
+        payload = self.payload
+        if payload.distribution == LogSizeDistribution.UNIFORM:
+            size = self.rng.randint(payload.min_size, payload.max_size)
+        elif payload.distribution == LogSizeDistribution.LOGNORMAL:
+            # mu chosen so the mean of the distribution is `size`
+            mu = math.log(max(1, payload.size)) - payload.sigma**2 / 2
+            size = int(self.rng.lognormvariate(mu, payload.sigma))
+        else:
+            size = payload.size
+        return min(max(size, payload.min_size), payload.max_size)
+
+    def _padded_message(self) -> str:
+        missing = self._size() - len(self.message.encode()) - 1
+        if missing <= 0:
+            return self.message
+        start = self.rng.randrange(len(self._corpus) - missing)
+        end = start + missing
+        filler = self._corpus[start:end].decode("utf-8", "ignore")
+        return f"{self.message} {filler}"
+
+    def _stack_trace(self) -> str:
+        lines = ["Traceback (most recent call last):"]
+        for _ in range(self.rng.randint(3, 15)):
+            module = self.rng.choice(MODULES)
+            lines.append(
+                f'  File "/app/{module}.py", line {self.rng.randint(1, 900)}, '
+                f"in {self.rng.choice(FUNCTIONS)}"
+            )
+        lines.append(f"{self.rng.choice(EXCEPTIONS)}: {self.rng.choice(WORDS)} failed")
+        return "\n".join(lines)
+
+    def _fields(self) -> dict:
+        fields = {}
+        for name in self.payload.field_names():
+            if name in FIELDS:
+                fields[name] = FIELDS[name](self.rng)
+            else:
+                fields[name] = self.rng.randint(0, 1 << 16)
+        return fields
+
+    def _body(self) -> str:
+        """One body: padded message, stack trace and fields, unterminated"""
+        message = self._padded_message()
+        if self.rng.random() < self.payload.stack_trace_ratio:
+            message = f"{message}\n{self._stack_trace()}"
+        fields = self._fields()
+        if self.format_type == LogFormat.JSON:
+            # Non-ASCII stays raw UTF-8 so backends see multi-byte input
+            body = f'"message": {json.dumps(message, ensure_ascii=False)}'
+            if fields:
+                body += ", " + json.dumps(fields)[1:-1]
+            return body
+        return " ".join([message] + [f"{key}={value}" for key, value in fields.items()])
+
+    def bodies(self, count: int) -> list[str]:
+        """`count` newline-terminated bodies"""
+        if not self.payload.cardinality:
+            return self.rng.choices(self._closed_pool, k=count)
+        keys = self.rng.choices(range(self.payload.cardinality), k=count)
+        prefix, closing = self._key_prefix, self._key_closing
+        return [
+            f"{body}{prefix}{key:x}{closing}"
+            for body, key in zip(self.rng.choices(self._pool, k=count), keys)
+        ]
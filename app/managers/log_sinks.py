@@ -0,0 +1,242 @@
+import os
+import socket
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import TextIO
+from ..models.schemas import LogSinkConfig, LogSinkType, SyslogProtocol
+
+SYSLOG_SEVERITIES = {"DEBUG": 7, "INFO": 6, "WARNING": 4, "ERROR": 3, "CRITICAL": 2}
+# Largest syslog message sent over UDP, longer lines are truncated
+MAX_DATAGRAM = 65000
+
+
+class LogSink(ABC):
+    """Destination of the lines written by a LogEmitter writer thread
+
+    Sinks implement `write`; `write_chunks` joins the queued chunks into one
+    write unless a sink needs them apart. Sinks are only used from the writer
+    thread. `flush_interval`, when set, makes the writer call `flush()` while
+    idle so buffered lines still go out when the traffic stops.
+    """
+
+    kind = "stream"
+    flush_interval: float | None = None
+
+    @property
+    def name(self) -> str:
+        return self.kind
+
+    def write_chunks(self, chunks: list[tuple[str, int, str]]):
+        """Write queued (text, line count, level) chunks"""
+        self.write("".join(text for text, _, _ in chunks))
+
+    @abstractmethod
+    def write(self, text: str):
+        """Write newline-terminated lines"""
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def stats(self) -> dict:
+        return {}
+
+
+class StreamSink(LogSink):
+    """Text stream such as stderr, flushed after every write"""
+
+    def __init__(self, stream: TextIO, kind: str = "stderr"):
+        self.stream = stream
+        self.kind = kind
+
+    def write(self, text: str):
+        self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+class BufferedStdoutSink(LogSink):
+    """Stdout written in blocks of `flush_bytes`, or every `flush_interval`"""
+
+    kind = "stdout"
+
+    def __init__(self, flush_bytes: int, flush_interval: float, stream=None):
+        self.stream = stream or sys.stdout.buffer
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.buffer = bytearray()
+        self.flushes = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, text: str):
+        self.buffer += text.encode()
+        if len(self.buffer) >= self.flush_bytes:
+            self._drain()
+
+    def flush(self):
+        if self.buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+            self._drain()
+
+    def close(self):
+        if self.buffer:
+            self._drain()
+
+    def _drain(self):
+        self.stream.write(self.buffer)
+        self.stream.flush()
+        self.buffer.clear()
+        self.flushes += 1
+        self._last_flush = time.monotonic()
+
+    def stats(self) -> dict:
+        return {"buffered_bytes": len(self.buffer), "flushes": self.flushes}
+
+
+class RotatingFileSink(LogSink):
+    """File rotated to `path.1` .. `path.N` once it reaches `max_bytes`"""
+
+    kind = "file"
+
+    def __init__(self, path: str, max_bytes: int, backups: int, fsync: bool = False):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.fsync = fsync
+        self.rotations = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    @property
+    def name(self) -> str:
+        return f"file:{self.path}"
+
+    def _open(self):
+        self.file = open(self.path, "ab")
+        self.size = self.file.tell()
+
+    def _rotate(self):
+        self.file.close()
+        if self.backups:
+            for index in range(self.backups - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.truncate(self.path, 0)
+        self.rotations += 1
+        self._open()
+
+    def write(self, text: str):
+        data = text.encode()
+        if self.size and self.size + len(data) > self.max_bytes:
+            self._rotate()
+        self.file.write(data)
+        self.size += len(data)
+
+    def flush(self):
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def stats(self) -> dict:
+        return {"file_bytes": self.size, "rotations": self.rotations}
+
+
+class SyslogSink(LogSink):
+    """RFC 5424 messages to a syslog listener over UDP or TCP
+
+    Every line is one message with the severity of its level. UDP sends a
+    datagram per line; TCP frames messages with a newline and reconnects
+    after an error on the next write.
+    """
+
+    kind = "syslog"
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        protocol: SyslogProtocol = SyslogProtocol.UDP,
+        facility: int = 1,
+        app_name: str = "stressed",
+    ):
+        self.host = host
+        self.port = port
+        self.protocol = SyslogProtocol(protocol)
+        self.facility = facility
+        self.header = f"1 - {socket.gethostname()} {app_name} {os.getpid()} - - "
+        self.messages = 0
+        self.sock = None
+
+    @property
+    def name(self) -> str:
+        return f"syslog:{self.protocol.value}://{self.host}:{self.port}"
+
+    def _socket(self) -> socket.socket:
+        if self.sock is None:
+            if self.protocol == SyslogProtocol.UDP:
+                self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            else:
+                self.sock = socket.create_connection((self.host, self.port), timeout=5)
+        return self.sock
+
+    def write_chunks(self, chunks: list[tuple[str, int, str]]):
+        messages = []
+        for text, _, level in chunks:
+            pri = self.facility * 8 + SYSLOG_SEVERITIES.get(level, 6)
+            prefix = f"<{pri}>{self.header}"
+            messages += [prefix + line for line in text.splitlines()]
+        try:
+            sock = self._socket()
+            if self.protocol == SyslogProtocol.UDP:
+                for message in messages:
+                    sock.sendto(message.encode()[:MAX_DATAGRAM], (self.host, self.port))
+            else:
+                sock.sendall("".join(m + "\n" for m in messages).encode())
+        except OSError:
+            self.close()
+            raise
+        self.messages += len(messages)
+
+    def write(self, text: str):
+        self.write_chunks([(text, text.count("\n"), "INFO")])
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def stats(self) -> dict:
+        return {"messages": self.messages}
+
+
+def sink_name(config: LogSinkConfig) -> str:
+    """Name identifying the destination of a sink configuration"""
+    if config.type == LogSinkType.FILE:
+        return f"file:{config.path}"
+    if config.type == LogSinkType.SYSLOG:
+        return f"syslog:{config.protocol.value}://{config.host}:{config.port}"
+    return config.type.value
+
+
+def make_sink(config: LogSinkConfig) -> LogSink:
+    if config.type == LogSinkType.STDOUT:
+        return BufferedStdoutSink(config.flush_bytes, config.flush_interval)
+    if config.type == LogSinkType.FILE:
+        return RotatingFileSink(
+            config.path, config.max_bytes, config.backups, config.fsync
+        )
+    if config.type == LogSinkType.SYSLOG:
+        return SyslogSink(config.host, config.port, config.protocol, config.facility)
+    return StreamSink(sys.stderr)
@@ -0,0 +1,116 @@
+import math
+import threading
+import time
+from typing import Callable
+from ..models.schemas import RampShape
+
+MIN_RESOLUTION = 0.1
+EXPONENTIAL_RATE = 4.0
+
+
+class Ramp:
+    """Load curve from start_value to end_value, sampled at a fixed resolution
+
+    Linear, exponential and step shapes go from start to end over the
+    duration; sine and sawtooth shapes oscillate between both values for the
+    given number of cycles. The final value is held for ``hold`` seconds.
+    """
+
+    def __init__(
+        self,
+        start_value: float,
+        end_value: float,
+        duration: float,
+        shape: RampShape = RampShape.LINEAR,
+        resolution: float = 1.0,
+        steps: int = 10,
+        cycles: float = 1,
+        hold: float = 0,
+    ):
+        if resolution < MIN_RESOLUTION:
+            raise ValueError(f"Resolution must be at least {MIN_RESOLUTION} seconds")
+        if shape == RampShape.STEP and steps < 2:
+            raise ValueError("Step shape needs at least 2 steps")
+        if cycles <= 0:
+            raise ValueError("Cycles must be greater than 0")
+        if hold < 0:
+            raise ValueError("Hold must be greater than or equal to 0")
+
+        self.start_value = start_value
+        self.end_value = end_value
+        self.duration = duration
+        self.shape = RampShape(shape)
+        self.resolution = resolution
+        self.steps = steps
+        self.cycles = cycles
+        self.hold = hold
+        # Message of the exception that ended the ramp early, if any
+        self.error: str | None = None
+        self._cancelled = threading.Event()
+        self._thread = None
+
+    def value_at(self, elapsed: float) -> float:
+        """Load value after `elapsed` seconds"""
+        progress = min(max(elapsed / self.duration, 0.0), 1.0)
+        if self.shape == RampShape.EXPONENTIAL:
+            ratio = math.expm1(EXPONENTIAL_RATE * progress) / math.expm1(
+                EXPONENTIAL_RATE
+            )
+        elif self.shape == RampShape.STEP:
+            ratio = min(math.floor(progress * self.steps), self.steps - 1) / (
+                self.steps - 1
+            )
+        elif self.shape == RampShape.SINE:
+            ratio = (1 - math.cos(2 * math.pi * self.cycles * progress)) / 2
+        elif self.shape == RampShape.SAWTOOTH:
+            ratio = (self.cycles * progress) % 1.0 if progress < 1.0 else 1.0
+        else:
+            ratio = progress
+        return self.start_value + (self.end_value - self.start_value) * ratio
+
+    def start(
+        self,
+        apply: Callable[[float], None],
+        on_end: Callable[[], None] | None = None,
+    ):
+        """Apply the first value now, then follow the curve in a thread"""
+        apply(self.value_at(0))
+        self._thread = threading.Thread(
+            target=self._run, args=(apply, on_end), daemon=True
+        )
+        self._thread.start()
+
+    def cancel(self):
+        """Stop the ramp and wait for a tick in progress to finish
+
+        Called from the ramp thread itself, typically by `on_end`, it only
+        flags the ramp as cancelled.
+        """
+        self._cancelled.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self, apply: Callable[[float], None], on_end):
+        origin = time.monotonic()
+        tick = 1
+        while True:
+            elapsed = min(tick * self.resolution, self.duration)
+            if self._cancelled.wait(origin + elapsed - time.monotonic()):
+                return
+            try:
+                apply(self.value_at(elapsed))
+            except Exception as e:
+                self.error = str(e)
+                return
+            if elapsed >= self.duration:
+                break
+            tick += 1
+
+        if self._cancelled.wait(self.hold):
+            return
+        if on_end is not None:
+            on_end()
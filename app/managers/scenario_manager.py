@@ -0,0 +1,319 @@
+import asyncio
+import functools
+import json
+import time
+import uuid
+from ..models.schemas import LogRequest, Scenario, ScenarioPhase
+from .lifecycle_manager import LifecycleManager
+from .load_manager import LoadManager
+from .log_manager import LogManager
+from .ramp import Ramp
+
+try:
+    import yaml
+except ImportError:  # YAML scenarios are optional
+    yaml = None
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+# Finished runs kept for GET /scenarios
+MAX_HISTORY = 20
+
+
+class PhasePlan:
+    """Scenario phase with its timing and load values resolved"""
+
+    def __init__(
+        self,
+        phase: ScenarioPhase,
+        start: float,
+        cpu: tuple[float, float] | None,
+        memory: tuple[int, int] | None,
+    ):
+        self.phase = phase
+        self.start = start
+        self.end = start + phase.duration
+        self.cpu_ramp = self._ramp(phase.cpu, cpu)
+        self.memory_ramp = self._ramp(phase.memory, memory)
+        self.state = PENDING
+        self.logs_emitted = 0
+
+    def _ramp(self, load, values) -> Ramp | None:
+        if load is None:
+            return None
+        return Ramp(
+            values[0],
+            values[1],
+            self.phase.duration,
+            load.shape,
+            steps=load.steps,
+            cycles=load.cycles,
+        )
+
+    @staticmethod
+    def value(ramp: Ramp, offset: float) -> float:
+        """Ramp value `offset` seconds into the phase"""
+        if ramp.duration == 0:
+            return ramp.end_value
+        return ramp.value_at(offset)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.phase.name,
+            "start": self.start,
+            "end": self.end,
+            "state": self.state,
+        }
+
+
+class ScenarioRun:
+    def __init__(self, scenario: Scenario, plans: list[PhasePlan]):
+        self.id = uuid.uuid4().hex[:8]
+        self.scenario = scenario
+        self.plans = plans
+        self.duration = max(plan.end for plan in plans)
+        self.state = PENDING
+        self.started_at = None
+        self.elapsed = 0.0
+        self.max_lag = 0.0
+        self.error = None
+        self.targets = {"cpu": None, "memory": None}
+        self.task = None
+
+    @property
+    def active(self) -> bool:
+        return self.state in (PENDING, RUNNING)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.scenario.name,
+            "state": self.state,
+            "started_at": self.started_at,
+            "elapsed": round(self.elapsed, 3),
+            "duration": self.duration,
+            "max_lag": round(self.max_lag, 4),
+            "error": self.error,
+            "cpu_target": self.targets["cpu"],
+            "memory_target": self.targets["memory"],
+            "phases": [plan.to_dict() for plan in self.plans],
+        }
+
+
+class ScenarioManager:
+    """Runs declarative multi-phase scenarios with one asyncio scheduler
+
+    The scheduler wakes on absolute deadlines: every `resolution` seconds and
+    exactly at each phase start and end. Load curves are sampled from the
+    same clock, so a scenario replays the same shape whatever the client.
+    Submitting a scenario cancels the one running. Load changes spawn and
+    stop worker processes, so they run in the default executor and never
+    hold the event loop.
+    """
+
+    def __init__(
+        self,
+        load_manager: LoadManager,
+        log_manager: LogManager,
+        lifecycle_manager: LifecycleManager,
+    ):
+        self.load_manager = load_manager
+        self.log_manager = log_manager
+        self.lifecycle_manager = lifecycle_manager
+        self.runs: dict[str, ScenarioRun] = {}
+
+    @staticmethod
+    def parse(body: bytes, content_type: str = "application/json") -> Scenario:
+        """Parse a JSON or YAML scenario document"""
+        if "yaml" in content_type:
+            if yaml is None:
+                raise ValueError("YAML scenarios require PyYAML")
+            try:
+                data = yaml.safe_load(body)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML scenario: {e}")
+        else:
+            try:
+                data = json.loads(body)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON scenario: {e}")
+        return Scenario.model_validate(data)
+
+    def _plan(self, scenario: Scenario) -> list[PhasePlan]:
+        """Resolve phase timings and validate load values up front"""
+        plans = []
+        cursor = 0.0
+        for phase in scenario.phases:
+            if phase.duration > self.load_manager.max_duration:
+                raise ValueError(
+                    f"Phase duration cannot exceed {self.load_manager.max_duration} seconds"
+                )
+            start = phase.at if phase.at is not None else cursor
+            if phase.logs and phase.logs.stream:
+                try:
+                    self.log_manager.get_stream(phase.logs.stream)
+                except KeyError as e:
+                    raise ValueError(e.args[0])
+            cpu = memory = None
+            if phase.cpu:
+                cpu = tuple(
+                    self.load_manager.resolve_cpu_load(
+                        value, phase.cpu.unit, phase.cpu.cpus
+                    )
+                    for value in (phase.cpu.start, phase.cpu.end)
+                )
+            if phase.memory:
+                memory = tuple(
+                    self.load_manager.resolve_memory_load(
+                        value,
+                        phase.memory.unit,
+                        phase.memory.mode,
+                        phase.memory.dirty_rate,
+                    )
+                    for value in (phase.memory.start, phase.memory.end)
+                )
+            plans.append(PhasePlan(phase, start, cpu, memory))
+            cursor = start + phase.duration
+        return plans
+
+    def start(self, scenario: Scenario) -> ScenarioRun:
+        """Validate a scenario and schedule it on the running event loop"""
+        run = ScenarioRun(scenario, self._plan(scenario))
+        previous = [other.task for other in self.runs.values() if other.active]
+        for task in previous:
+            task.cancel()
+        run.task = asyncio.get_running_loop().create_task(self._run(run, previous))
+        run.task.add_done_callback(lambda _: self._finished(run))
+        self.runs[run.id] = run
+
+        finished = [key for key, other in self.runs.items() if not other.active]
+        for key in finished[: max(0, len(self.runs) - MAX_HISTORY)]:
+            del self.runs[key]
+        return run
+
+    def _finished(self, run: ScenarioRun):
+        # A task cancelled before its first step never ran _run
+        if run.active:
+            run.state = CANCELLED
+
+    def get(self, run_id: str) -> ScenarioRun:
+        if run_id not in self.runs:
+            raise KeyError(f"Unknown scenario: {run_id}")
+        return self.runs[run_id]
+
+    def cancel(self, run_id: str) -> ScenarioRun:
+        run = self.get(run_id)
+        if not run.active:
+            raise ValueError(f"Scenario {run_id} is not running")
+        run.task.cancel()
+        return run
+
+    async def _load(self, method, *args):
+        """Call a blocking load manager method in the default executor"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(method, *args))
+
+    async def _run(self, run: ScenarioRun, previous: list[asyncio.Task] = ()):
+        # Let a replaced scenario stop its loads before driving them again
+        if previous:
+            await asyncio.wait(previous)
+        loop = asyncio.get_running_loop()
+        origin = loop.time()
+        run.state = RUNNING
+        run.started_at = round(time.time(), 3)
+        resolution = run.scenario.resolution
+        boundaries = sorted({t for plan in run.plans for t in (plan.start, plan.end)})
+        elapsed = 0.0
+        try:
+            while True:
+                delay = origin + elapsed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    run.max_lag = max(run.max_lag, -delay)
+                run.elapsed = elapsed
+                for plan in run.plans:
+                    await self._advance(run, plan, elapsed)
+                if all(plan.state == COMPLETED for plan in run.plans):
+                    break
+                # Next grid tick, or the next phase boundary if it comes first
+                tick = (int(elapsed / resolution + 1e-9) + 1) * resolution
+                elapsed = min([tick] + [t for t in boundaries if t > elapsed])
+            run.state = COMPLETED
+        except asyncio.CancelledError:
+            run.state = CANCELLED
+            raise
+        except Exception as e:
+            run.state = FAILED
+            run.error = str(e)
+        finally:
+            if run.scenario.stop_at_end:
+                await self._stop_loads(run)
+
+    async def _advance(self, run: ScenarioRun, plan: PhasePlan, elapsed: float):
+        """Apply what a phase requires at `elapsed` seconds"""
+        if elapsed < plan.start or plan.state == COMPLETED:
+            return
+        phase = plan.phase
+        if plan.state == PENDING:
+            plan.state = RUNNING
+            await self._enter(run, phase)
+
+        offset = min(elapsed, plan.end) - plan.start
+        if plan.cpu_ramp:
+            value = round(plan.value(plan.cpu_ramp, offset), 3)
+            if value != run.targets["cpu"]:
+                await self._load(
+                    self.load_manager.set_cpu_target,
+                    value,
+                    phase.cpu.feedback,
+                    phase.cpu.workload,
+                    phase.cpu.placement,
+                    phase.cpu.cpus,
+                )
+                run.targets["cpu"] = value
+        if plan.memory_ramp:
+            value = int(plan.value(plan.memory_ramp, offset))
+            if value != run.targets["memory"]:
+                await self._load(
+                    self.load_manager.set_memory_target,
+                    value,
+                    phase.memory.mode,
+                    phase.memory.dirty_rate,
+                )
+                run.targets["memory"] = value
+        if phase.logs:
+            due = int(phase.logs.rate * offset) - plan.logs_emitted
+            if due > 0:
+                # The block policy holds the phase back until the queue has room
+                await self.log_manager.emit(
+                    LogRequest(**phase.logs.model_dump(exclude={"rate"})), due
+                )
+                plan.logs_emitted += due
+
+        if elapsed >= plan.end:
+            plan.state = COMPLETED
+
+    async def _enter(self, run: ScenarioRun, phase: ScenarioPhase):
+        """Instant actions of a phase: stops and probe changes"""
+        if "cpu" in phase.stop:
+            await self._load(self.load_manager.stop_cpu_load)
+            run.targets["cpu"] = None
+        if "memory" in phase.stop:
+            await self._load(self.load_manager.stop_memory_load)
+            run.targets["memory"] = None
+        if phase.probes:
+            for probe, status in phase.probes.model_dump(exclude_none=True).items():
+                self.lifecycle_manager.set_probe_status(probe, status)
+
+    async def _stop_loads(self, run: ScenarioRun):
+        if any(plan.cpu_ramp for plan in run.plans):
+            await self._load(self.load_manager.stop_cpu_load)
+            run.targets["cpu"] = None
+        if any(plan.memory_ramp for plan in run.plans):
+            await self._load(self.load_manager.stop_memory_load)
+            run.targets["memory"] = None
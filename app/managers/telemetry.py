@@ -0,0 +1,97 @@
+import asyncio
+import json
+import time
+from typing import Callable
+
+
+class RateMeter:
+    """Per-second rate of a monotonically increasing counter"""
+
+    def __init__(self):
+        self._last = None
+
+    def rate(self, total: float) -> float | None:
+        now = time.monotonic()
+        last, self._last = self._last, (now, total)
+        if last is None or now <= last[0]:
+            return None
+        return round((total - last[1]) / (now - last[0]), 3)
+
+
+class TelemetryBroadcaster:
+    """One producer task fanning telemetry snapshots out to subscribers
+
+    The snapshot is taken and serialised once per tick whatever the number of
+    subscribers. Each subscriber gets a bounded queue and receives every Nth
+    event for an interval of N ticks; a subscriber that does not keep up loses
+    its oldest events instead of slowing the producer down. The producer runs
+    only while there are subscribers. A failing snapshot skips its tick and is
+    counted in `errors` rather than ending the stream.
+    """
+
+    def __init__(
+        self,
+        snapshot: Callable[[], dict],
+        interval: float = 1.0,
+        queue_size: int = 16,
+    ):
+        if interval <= 0:
+            raise ValueError("Telemetry interval must be greater than 0")
+        self.snapshot = snapshot
+        self.interval = interval
+        self.queue_size = queue_size
+        self.ticks = 0
+        self.errors = 0
+        self._subscribers: dict[asyncio.Queue, int] = {}
+        self._producer: asyncio.Task | None = None
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def ticks_per_event(self, interval: float | None = None) -> int:
+        """Producer ticks between two events sent every `interval` seconds"""
+        if interval is not None and interval < self.interval:
+            raise ValueError(f"Interval must be at least {self.interval} seconds")
+        return max(1, round((interval or self.interval) / self.interval))
+
+    def subscribe(self, interval: float | None = None) -> asyncio.Queue:
+        """Register a subscriber receiving an event every `interval` seconds"""
+        every = self.ticks_per_event(interval)
+        queue = asyncio.Queue(self.queue_size)
+        self._subscribers[queue] = every
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._producer is None
+            or self._producer.done()
+            or self._producer.get_loop() is not loop
+        ):
+            self._producer = loop.create_task(self._produce())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.pop(queue, None)
+        if not self._subscribers and self._producer is not None:
+            self._producer.cancel()
+            self._producer = None
+
+    async def _produce(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while self._subscribers:
+            try:
+                event = json.dumps(self.snapshot())
+            except Exception:
+                self.errors += 1
+                event = None
+            if event is not None:
+                self.ticks += 1
+                for queue, every in list(self._subscribers.items()):
+                    if self.ticks % every:
+                        continue
+                    if queue.full():
+                        queue.get_nowait()
+                    queue.put_nowait(event)
+            next_tick += self.interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
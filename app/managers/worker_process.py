@@ -0,0 +1,61 @@
+import json
+import os
+import signal
+import subprocess
+import threading
+
+
+class WorkerProcess:
+    """Long-lived stress script driven by JSON commands on its stdin
+
+    The script is started once in its own process group and retargeted in
+    place by writing one JSON command per line. It reports its state as JSON
+    lines on stdout; the latest report is kept in ``stats``.
+    """
+
+    def __init__(self, script_path: str, *args: str):
+        self.args = ["python3", script_path, *args]
+        self.stats = {}
+        self.process = subprocess.Popen(
+            self.args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            preexec_fn=os.setsid,
+        )
+        self._reader = threading.Thread(target=self._read_reports, daemon=True)
+        self._reader.start()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def send(self, **command):
+        """Push a new target to the running script"""
+        try:
+            self.process.stdin.write(json.dumps(command) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, ValueError) as e:
+            raise RuntimeError(f"Worker process {self.pid} is not running: {e}")
+
+    def stop(self):
+        """Terminate the whole process group of the script"""
+        try:
+            os.killpg(os.getpgid(self.pid), signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        except Exception as e:
+            raise RuntimeError(f"Failed to terminate process {self.pid}: {e}")
+        self.process.wait()
+        self.process.stdin.close()
+
+    def _read_reports(self):
+        for line in self.process.stdout:
+            try:
+                self.stats = json.loads(line)
+            except ValueError:
+                continue
@@ -0,0 +1,35 @@
+import asyncio
+from fastapi.responses import JSONResponse
+from .managers.fault_manager import FaultManager
+
+
+class FaultInjectionMiddleware:
+    """ASGI middleware delaying or failing requests matched by a fault rule
+
+    The delay is an asyncio sleep, so a slowed request holds no worker while
+    it waits. An injected error is answered after the delay without calling
+    the endpoint.
+    """
+
+    def __init__(self, app, fault_manager: FaultManager):
+        self.app = app
+        self.fault_manager = fault_manager
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        fault = self.fault_manager.inject(scope["method"], scope["path"])
+        if fault is None:
+            return await self.app(scope, receive, send)
+
+        delay, status = fault
+        if delay:
+            await asyncio.sleep(delay)
+        if status is None:
+            return await self.app(scope, receive, send)
+        response = JSONResponse(
+            {"detail": "Injected fault"},
+            status_code=status,
+            headers={"X-Injected-Fault": "error"},
+        )
+        await response(scope, receive, send)
@@ -1,15 +1,85 @@
 from .schemas import (
+    BandwidthLoadRequest,
+    BandwidthPattern,
+    CacheLevel,
+    ChurnLoadRequest,
+    CPULoadRequest,
+    CPUPlacement,
+    CPUWorkload,
+    DiskLoadRequest,
+    DiskPattern,
     DynamicCPULoadRequest,
     DynamicMemoryLoadRequest,
+    FaultDistribution,
+    FaultRule,
+    HttpArrival,
+    HttpLoadRequest,
+    HttpMethod,
     LoadRequest,
+    LoadUnit,
+    LogOverflowPolicy,
+    LogPayload,
+    LogSinkConfig,
+    LogSinkType,
+    LogSizeDistribution,
+    LogStreamRequest,
+    MemoryLoadRequest,
+    MemoryMode,
+    NetworkLoadRequest,
+    NetworkMode,
+    NetworkProtocol,
     ProbeRequest,
+    RampShape,
+    Scenario,
+    ScenarioCPULoad,
+    ScenarioLoad,
+    ScenarioLogs,
+    ScenarioMemoryLoad,
+    ScenarioPhase,
+    ScenarioProbes,
+    SyslogProtocol,
     TerminateRequest,
 )
 
 __all__ = [
+    "BandwidthLoadRequest",
+    "BandwidthPattern",
+    "CacheLevel",
+    "ChurnLoadRequest",
+    "CPULoadRequest",
+    "CPUPlacement",
+    "CPUWorkload",
+    "DiskLoadRequest",
+    "DiskPattern",
     "DynamicCPULoadRequest",
     "DynamicMemoryLoadRequest",
+    "FaultDistribution",
+    "FaultRule",
+    "HttpArrival",
+    "HttpLoadRequest",
+    "HttpMethod",
     "LoadRequest",
+    "LoadUnit",
+    "LogOverflowPolicy",
+    "LogPayload",
+    "LogSinkConfig",
+    "LogSinkType",
+    "LogSizeDistribution",
+    "LogStreamRequest",
+    "MemoryLoadRequest",
+    "MemoryMode",
+    "NetworkLoadRequest",
+    "NetworkMode",
+    "NetworkProtocol",
     "ProbeRequest",
+    "RampShape",
+    "Scenario",
+    "ScenarioCPULoad",
+    "ScenarioLoad",
+    "ScenarioLogs",
+    "ScenarioMemoryLoad",
+    "ScenarioPhase",
+    "ScenarioProbes",
+    "SyslogProtocol",
     "TerminateRequest",
 ]
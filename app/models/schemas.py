@@ -1,30 +1,280 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional
 from enum import Enum
 
 
-class DynamicCPULoadRequest(BaseModel):
+class RampShape(str, Enum):
+    """Curve followed by a dynamic load"""
+
+    LINEAR = "linear"
+    EXPONENTIAL = "exponential"
+    STEP = "step"
+    SINE = "sine"
+    SAWTOOTH = "sawtooth"
+
+
+class LoadUnit(str, Enum):
+    """Unit of a load target"""
+
+    ABSOLUTE = "absolute"
+    PERCENT_LIMIT = "percent_limit"
+    PERCENT_REQUEST = "percent_request"
+
+
+class RampOptions(BaseModel):
+    shape: RampShape = Field(RampShape.LINEAR, description="Ramp curve shape")
+    resolution: float = Field(
+        1.0, ge=0.1, description="Seconds between two load updates"
+    )
+    steps: int = Field(10, ge=2, description="Number of levels of the step shape")
+    cycles: float = Field(
+        1, gt=0, description="Number of periods of the sine and sawtooth shapes"
+    )
+    hold: int = Field(
+        0, ge=0, description="Seconds to hold the last value before stopping"
+    )
+
+
+class MemoryMode(str, Enum):
+    """Residency of the pages held by the memory load"""
+
+    RESERVE = "reserve"
+    TOUCH = "touch"
+    DIRTY = "dirty"
+    THP = "thp"
+
+
+class CPUWorkload(str, Enum):
+    """Operation repeated by the CPU workers"""
+
+    SPIN = "spin"
+    INT = "int"
+    FLOAT = "float"
+    HASH = "hash"
+    ZLIB = "zlib"
+    JSON = "json"
+    POINTER = "pointer"
+
+
+class CPUPlacement(str, Enum):
+    """Placement policy of the CPU workers"""
+
+    NONE = "none"
+    SPREAD = "spread"
+    PACK = "pack"
+    NUMA = "numa"
+
+
+class DynamicCPULoadRequest(RampOptions):
     start_value: float = Field(..., ge=0, description="Starting load")
     end_value: float = Field(..., ge=0, description="Ending load")
     duration: int = Field(1, ge=1, description="Duration in secondes")
     stop_at_end: bool = Field(
         False, description="Whether to stop load after completion"
     )
+    feedback: bool | None = Field(
+        None, description="Correct the load from measured CPU consumption"
+    )
+    workload: CPUWorkload | None = Field(
+        None, description="Operation repeated by the CPU workers"
+    )
+    placement: CPUPlacement | None = Field(
+        None, description="Worker pinning policy (spread, pack or numa)"
+    )
+    cpus: list[int] | None = Field(
+        None, description="CPU set the workers are restricted to (optional)"
+    )
+    unit: LoadUnit | None = Field(
+        None,
+        description="Target unit: absolute, percent_limit or percent_request",
+    )
 
 
-class DynamicMemoryLoadRequest(BaseModel):
+class DynamicMemoryLoadRequest(RampOptions):
     start_value: int = Field(..., ge=0, description="Starting load")
     end_value: int = Field(..., ge=0, description="Ending load")
     duration: int = Field(1, ge=1, description="Duration in secondes")
     stop_at_end: bool = Field(
         False, description="Whether to stop load after completion"
     )
+    mode: MemoryMode | None = Field(None, description="Page residency mode")
+    dirty_rate: float | None = Field(
+        None, ge=0, description="MB/s rewritten in dirty mode"
+    )
+    unit: LoadUnit | None = Field(
+        None,
+        description="Target unit: absolute, percent_limit or percent_request",
+    )
 
 
 class LoadRequest(BaseModel):
     value: float = Field(
         ..., ge=0, description="Load value (CPU cores or MB of memory)"
     )
+    unit: LoadUnit | None = Field(
+        None,
+        description="Target unit: absolute, percent_limit or percent_request",
+    )
+
+
+class CPULoadRequest(LoadRequest):
+    feedback: bool | None = Field(
+        None, description="Correct the load from measured CPU consumption"
+    )
+    workload: CPUWorkload | None = Field(
+        None, description="Operation repeated by the CPU workers"
+    )
+    placement: CPUPlacement | None = Field(
+        None, description="Worker pinning policy (spread, pack or numa)"
+    )
+    cpus: list[int] | None = Field(
+        None, description="CPU set the workers are restricted to (optional)"
+    )
+
+
+class MemoryLoadRequest(LoadRequest):
+    mode: MemoryMode | None = Field(None, description="Page residency mode")
+    dirty_rate: float | None = Field(
+        None, ge=0, description="MB/s rewritten in dirty mode"
+    )
+
+
+class CacheLevel(str, Enum):
+    """Memory hierarchy level targeted by the bandwidth load"""
+
+    L1 = "l1"
+    L2 = "l2"
+    L3 = "l3"
+    DRAM = "dram"
+
+
+class BandwidthPattern(str, Enum):
+    """Access pattern of the bandwidth load"""
+
+    COPY = "copy"
+    READ = "read"
+    WRITE = "write"
+
+
+class BandwidthLoadRequest(BaseModel):
+    workers: int = Field(1, ge=1, description="Number of worker processes")
+    level: CacheLevel = Field(
+        CacheLevel.DRAM, description="Cache level the working set is sized for"
+    )
+    pattern: BandwidthPattern = Field(
+        BandwidthPattern.COPY, description="Streaming access pattern"
+    )
+    working_set_kb: int | None = Field(
+        None, ge=1, description="Working set per worker in KB, overrides level"
+    )
+    duration: int | None = Field(
+        None, ge=1, description="Duration in secondes (optional)"
+    )
+
+
+class DiskPattern(str, Enum):
+    """I/O pattern of the disk load, named after fio's rw modes"""
+
+    READ = "read"
+    WRITE = "write"
+    RANDREAD = "randread"
+    RANDWRITE = "randwrite"
+    RANDRW = "randrw"
+
+
+class DiskLoadRequest(BaseModel):
+    pattern: DiskPattern = Field(DiskPattern.RANDREAD, description="I/O pattern")
+    block_size_kb: int = Field(4, ge=1, description="Size of each I/O in KB")
+    queue_depth: int = Field(1, ge=1, description="Number of I/Os kept in flight")
+    size_mb: int = Field(256, ge=1, description="Size of the test file in MB")
+    path: str | None = Field(
+        None, description="Directory of the test file, DISK_LOAD_PATH by default"
+    )
+    fsync: bool = Field(False, description="fdatasync after every write")
+    direct: bool = Field(False, description="Bypass the page cache with O_DIRECT")
+    duration: int | None = Field(
+        None, ge=1, description="Duration in secondes (optional)"
+    )
+
+
+class NetworkProtocol(str, Enum):
+    TCP = "tcp"
+    UDP = "udp"
+
+
+class NetworkMode(str, Enum):
+    """Side of the network load run by this instance"""
+
+    LOOPBACK = "loopback"
+    SEND = "send"
+    RECEIVE = "receive"
+
+
+class NetworkLoadRequest(BaseModel):
+    protocol: NetworkProtocol = Field(NetworkProtocol.TCP, description="Transport")
+    mode: NetworkMode = Field(
+        NetworkMode.LOOPBACK, description="Local pair, sender to a peer or receiver"
+    )
+    host: str | None = Field(None, description="Peer host in send mode")
+    port: int | None = Field(
+        None, ge=1, le=65535, description="Peer or listening port, NETWORK_LOAD_PORT"
+    )
+    message_size: int = Field(65536, ge=1, description="Bytes per send")
+    connections: int = Field(1, ge=1, description="Parallel connections")
+    rate_mbps: float | None = Field(
+        None, gt=0, description="Target total bandwidth in Mbit/s (optional)"
+    )
+    duration: int | None = Field(
+        None, ge=1, description="Duration in secondes (optional)"
+    )
+
+
+class HttpArrival(str, Enum):
+    """Inter-arrival times of the open-loop HTTP load"""
+
+    CONSTANT = "constant"
+    POISSON = "poisson"
+
+
+class HttpMethod(str, Enum):
+    GET = "GET"
+    POST = "POST"
+    PUT = "PUT"
+    PATCH = "PATCH"
+    DELETE = "DELETE"
+    HEAD = "HEAD"
+
+
+class HttpLoadRequest(BaseModel):
+    url: str = Field(..., description="Target URL, or a path on this instance")
+    rate: float = Field(..., gt=0, description="Requests per second")
+    arrival: HttpArrival = Field(
+        HttpArrival.CONSTANT, description="Constant or Poisson arrivals"
+    )
+    connections: int = Field(10, ge=1, description="Keep-alive connection pool size")
+    method: HttpMethod = Field(HttpMethod.GET, description="Request method")
+    headers: dict[str, str] = Field(default_factory=dict, description="Extra headers")
+    body: str | None = Field(None, description="Request body")
+    timeout: float = Field(10, gt=0, description="Timeout of a request in seconds")
+    duration: int | None = Field(
+        None, ge=1, description="Duration in secondes (optional)"
+    )
+
+
+class ChurnLoadRequest(BaseModel):
+    rate: float = Field(..., gt=0, description="New connections per second")
+    host: str | None = Field(
+        None, description="Target host, a local listener when unset"
+    )
+    port: int | None = Field(None, ge=1, le=65535, description="Target port")
+    hold_ms: float = Field(0, ge=0, description="Time each connection stays open")
+    linger_zero: bool = Field(
+        False, description="Reset connections instead of leaving TIME_WAIT"
+    )
+    timeout: float = Field(5, gt=0, description="Connect timeout in seconds")
+    duration: int | None = Field(
+        None, ge=1, description="Duration in secondes (optional)"
+    )
 
 
 class ProbeRequest(BaseModel):
@@ -36,6 +286,46 @@ class TerminateRequest(BaseModel):
     seconds: int = Field(0, ge=0, description="Delay before termination in seconds")
 
 
+class FaultDistribution(str, Enum):
+    """Distribution of the latency injected into matching requests"""
+
+    FIXED = "fixed"
+    NORMAL = "normal"
+    LOGNORMAL = "lognormal"
+    BIMODAL = "bimodal"
+
+
+class FaultRule(BaseModel):
+    route: str = Field(
+        ..., pattern="^/", description="Request path, or a glob such as /load/*"
+    )
+    methods: list[HttpMethod] | None = Field(
+        None, description="Methods the rule applies to, all when unset"
+    )
+    distribution: FaultDistribution = Field(
+        FaultDistribution.FIXED, description="Latency distribution"
+    )
+    latency_ms: float = Field(
+        0, ge=0, description="Fixed latency, mean (normal) or median (lognormal)"
+    )
+    stddev_ms: float = Field(0, ge=0, description="Standard deviation (normal)")
+    sigma: float = Field(0.5, gt=0, description="Shape of the lognormal distribution")
+    slow_ms: float = Field(0, ge=0, description="Latency of the slow path (bimodal)")
+    slow_ratio: float = Field(
+        0, ge=0, le=1, description="Share of requests on the slow path (bimodal)"
+    )
+    error_rate: float = Field(
+        0, ge=0, le=1, description="Share of requests answered with status_code"
+    )
+    status_code: int = Field(500, ge=400, le=599, description="Injected error status")
+
+    @model_validator(mode="after")
+    def check_distribution(self):
+        if self.distribution == FaultDistribution.BIMODAL and not self.slow_ratio:
+            raise ValueError("The bimodal distribution needs a slow_ratio")
+        return self
+
+
 class LogResponse(BaseModel):
     status_code: int = Field(..., description="Code HTTP de la réponse")
     detail: str = Field(..., description="Description détaillée de l'erreur")
@@ -59,6 +349,143 @@ class LogFormat(str, Enum):
     PLAINTEXT = "plaintext"
 
 
+class LogOverflowPolicy(str, Enum):
+    """Behaviour of the log queue when it is full"""
+
+    BLOCK = "block"
+    DROP = "drop"
+    SAMPLE = "sample"
+
+
+class LogSizeDistribution(str, Enum):
+    """Distribution of the generated message sizes"""
+
+    FIXED = "fixed"
+    UNIFORM = "uniform"
+    LOGNORMAL = "lognormal"
+
+
+# Keys every log line carries, and the structured fields of a payload in order
+LOG_LINE_KEYS = ("timestamp", "level", "service", "message")
+PAYLOAD_FIELDS = (
+    "method",
+    "path",
+    "status",
+    "duration_ms",
+    "user_id",
+    "host",
+    "region",
+    "client_ip",
+    "bytes",
+    "trace_id",
+    "retry",
+    "cached",
+)
+
+
+class LogPayload(BaseModel):
+    """Synthetic payload generated around the log message
+
+    The message is padded with filler text up to a size drawn from
+    `distribution`, then followed by random structured fields.
+    """
+
+    distribution: LogSizeDistribution = Field(
+        LogSizeDistribution.FIXED, description="Message size distribution"
+    )
+    size: int = Field(
+        256, ge=0, le=65536, description="Message size in bytes (mean for lognormal)"
+    )
+    min_size: int = Field(
+        0, ge=0, le=65536, description="Smallest message in bytes (uniform)"
+    )
+    max_size: int = Field(65536, ge=0, le=65536, description="Largest message in bytes")
+    sigma: float = Field(
+        1.0, gt=0, le=4, description="Standard deviation of the log of the size"
+    )
+    fields: int = Field(0, ge=0, le=50, description="Random structured fields")
+    cardinality: int = Field(
+        0, ge=0, description="Distinct values of the high-cardinality key"
+    )
+    cardinality_key: str = Field(
+        "request_id", min_length=1, description="High-cardinality key name"
+    )
+    stack_trace_ratio: float = Field(
+        0, ge=0, le=1, description="Share of lines carrying a multiline stack trace"
+    )
+    utf8_ratio: float = Field(
+        0, ge=0, le=1, description="Share of non-ASCII words in the filler text"
+    )
+    seed: int | None = Field(None, description="Random seed (optional)")
+
+    @model_validator(mode="after")
+    def check_sizes(self):
+        if self.min_size > self.max_size:
+            raise ValueError("min_size cannot exceed max_size")
+        if self.distribution == LogSizeDistribution.UNIFORM:
+            return self
+        if self.size > self.max_size:
+            raise ValueError("size cannot exceed max_size")
+        return self
+
+    @model_validator(mode="after")
+    def check_cardinality_key(self):
+        key = self.cardinality_key
+        if self.cardinality and (key in LOG_LINE_KEYS or key in self.field_names()):
+            raise ValueError(f"cardinality_key {key} collides with a generated field")
+        return self
+
+    def field_names(self) -> list[str]:
+        """Names of the structured fields, in the order they are generated"""
+        return [
+            PAYLOAD_FIELDS[i] if i < len(PAYLOAD_FIELDS) else f"field_{i}"
+            for i in range(self.fields)
+        ]
+
+
+class LogSinkType(str, Enum):
+    """Destination the log lines are written to"""
+
+    STDERR = "stderr"
+    STDOUT = "stdout"
+    FILE = "file"
+    SYSLOG = "syslog"
+
+
+class SyslogProtocol(str, Enum):
+    UDP = "udp"
+    TCP = "tcp"
+
+
+class LogSinkConfig(BaseModel):
+    """Log sink options, each sink type reads its own fields"""
+
+    type: LogSinkType = Field(LogSinkType.STDERR, description="Sink type")
+    flush_bytes: int = Field(
+        65536, ge=1, le=16 * 1024 * 1024, description="stdout: bytes per write"
+    )
+    flush_interval: float = Field(
+        0.1,
+        gt=0,
+        le=60,
+        description="stdout: seconds before a partial block is written",
+    )
+    path: str = Field(
+        "app.log", min_length=1, description="file: path relative to LOG_FILE_DIR"
+    )
+    max_bytes: int = Field(
+        10 * 1024 * 1024, ge=1024, description="file: size triggering a rotation"
+    )
+    backups: int = Field(3, ge=0, le=100, description="file: rotated files kept")
+    fsync: bool = Field(False, description="file: fsync after every write")
+    host: str = Field("127.0.0.1", description="syslog: listener host")
+    port: int = Field(514, ge=1, le=65535, description="syslog: listener port")
+    protocol: SyslogProtocol = Field(
+        SyslogProtocol.UDP, description="syslog: transport"
+    )
+    facility: int = Field(1, ge=0, le=23, description="syslog: facility code")
+
+
 class LogRequest(BaseModel):
     """Request schema for log creation"""
 
@@ -72,6 +499,18 @@ class LogRequest(BaseModel):
     duration: int | None = Field(
         None, description="Log sending duration in seconds (optional)"
     )
+    rate: float | None = Field(
+        None, description="Lines per second for a log flood (optional)"
+    )
+    payload: LogPayload | None = Field(
+        None, description="Synthetic payload generator options (optional)"
+    )
+    stream: str | None = Field(
+        None, description="Log stream to write to, its format wins (optional)"
+    )
+    sink: LogSinkConfig | None = Field(
+        None, description="Sink to write to instead of stderr (optional)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -84,3 +523,132 @@ class LogRequest(BaseModel):
                 "duration": 60,
             }
         }
+
+
+class LogStreamRequest(BaseModel):
+    """Request schema for log stream creation"""
+
+    name: str = Field(
+        ...,
+        pattern=r"^[a-z0-9][a-z0-9_.-]{0,63}$",
+        description="Stream name used by the `stream` field of log requests",
+    )
+    format: LogFormat = Field(default=LogFormat.JSON, description="Output format")
+    sink: LogSinkConfig | None = Field(
+        None, description="Sink of the stream, stderr by default (optional)"
+    )
+
+
+class ScenarioLoad(BaseModel):
+    """Load curve followed during a scenario phase
+
+    `value` holds a constant load; `start` and `end` follow a ramp over the
+    phase duration.
+    """
+
+    value: float | None = Field(None, ge=0, description="Constant load")
+    start: float | None = Field(None, ge=0, description="Load at phase start")
+    end: float | None = Field(None, ge=0, description="Load at phase end")
+    shape: RampShape = Field(RampShape.LINEAR, description="Ramp curve shape")
+    steps: int = Field(10, ge=2, description="Number of levels of the step shape")
+    cycles: float = Field(
+        1, gt=0, description="Number of periods of the sine and sawtooth shapes"
+    )
+    unit: LoadUnit | None = Field(
+        None,
+        description="Target unit: absolute, percent_limit or percent_request",
+    )
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if self.value is not None:
+            if self.start is not None or self.end is not None:
+                raise ValueError("Use either value or start/end")
+            self.start = self.end = self.value
+        elif self.start is None or self.end is None:
+            raise ValueError("Either value or both start and end are required")
+        return self
+
+
+class ScenarioCPULoad(ScenarioLoad):
+    feedback: bool | None = Field(
+        None, description="Correct the load from measured CPU consumption"
+    )
+    workload: CPUWorkload | None = Field(
+        None, description="Operation repeated by the CPU workers"
+    )
+    placement: CPUPlacement | None = Field(
+        None, description="Worker pinning policy (spread, pack or numa)"
+    )
+    cpus: list[int] | None = Field(
+        None, description="CPU set the workers are restricted to (optional)"
+    )
+
+
+class ScenarioMemoryLoad(ScenarioLoad):
+    mode: MemoryMode | None = Field(None, description="Page residency mode")
+    dirty_rate: float | None = Field(
+        None, ge=0, description="MB/s rewritten in dirty mode"
+    )
+
+
+class ScenarioLogs(BaseModel):
+    """Logs emitted at a steady rate during a scenario phase"""
+
+    rate: float = Field(..., gt=0, description="Log lines per second")
+    message: str = Field("Scenario log message", description="Log message")
+    level: LogLevel = Field(LogLevel.INFO, description="Log level")
+    service: str | None = Field(None, description="Service name (optional)")
+    format: LogFormat = Field(LogFormat.JSON, description="Output format")
+    payload: LogPayload | None = Field(
+        None, description="Synthetic payload generator options (optional)"
+    )
+    stream: str | None = Field(None, description="Log stream (optional)")
+
+
+class ScenarioProbes(BaseModel):
+    readiness: str | None = Field(None, pattern="^(ok|error)$")
+    liveness: str | None = Field(None, pattern="^(ok|error)$")
+
+
+class ScenarioPhase(BaseModel):
+    """Timed step of a scenario
+
+    A phase starts at `at` seconds from the scenario start, or when the
+    previous phase ends. Probe changes and stops apply at the phase start;
+    load curves and logs run for the phase duration, after which the last
+    load value is held until another phase changes it.
+    """
+
+    name: str | None = Field(None, description="Phase name")
+    at: float | None = Field(
+        None, ge=0, description="Start offset in seconds (default: sequential)"
+    )
+    duration: float = Field(0, ge=0, description="Duration in secondes")
+    cpu: ScenarioCPULoad | None = Field(None, description="CPU load curve")
+    memory: ScenarioMemoryLoad | None = Field(None, description="Memory load curve")
+    logs: ScenarioLogs | None = Field(None, description="Logs to emit")
+    probes: ScenarioProbes | None = Field(None, description="Probe states to set")
+    stop: list[str] = Field(
+        [], description="Loads to stop at the phase start (cpu, memory)"
+    )
+
+    @model_validator(mode="after")
+    def check_stop(self):
+        unknown = set(self.stop) - {"cpu", "memory"}
+        if unknown:
+            raise ValueError(f"Unknown loads to stop: {sorted(unknown)}")
+        return self
+
+
+class Scenario(BaseModel):
+    """Declarative multi-phase load scenario"""
+
+    name: str = Field("scenario", description="Scenario name")
+    resolution: float = Field(
+        0.1, ge=0.05, description="Seconds between two scheduler ticks"
+    )
+    stop_at_end: bool = Field(
+        True, description="Stop the loads driven by the scenario when it ends"
+    )
+    phases: list[ScenarioPhase] = Field(..., min_length=1)
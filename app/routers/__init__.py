@@ -1,6 +1,18 @@
+from .faults import router as faults_router
 from .load import router as load_router
+from .metrics import router as metrics_router
 from .probes import router as probes_router
+from .scenarios import router as scenarios_router
 from .system import router as system_router
+from .telemetry import router as telemetry_router
 
 # This makes imports cleaner in main.py
-__all__ = ["load_router", "probes_router", "system_router"]
+__all__ = [
+    "faults_router",
+    "load_router",
+    "metrics_router",
+    "probes_router",
+    "scenarios_router",
+    "system_router",
+    "telemetry_router",
+]
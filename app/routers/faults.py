@@ -0,0 +1,35 @@
+from fastapi import APIRouter, HTTPException
+from ..models.schemas import FaultRule
+from ..managers.fault_manager import FaultManager
+
+router = APIRouter(prefix="/faults", tags=["Fault Injection"])
+fault_manager = FaultManager()
+
+
+@router.get("")
+async def get_faults():
+    """Get the fault rules and what they injected"""
+    return fault_manager.to_dict()
+
+
+@router.post("")
+async def set_fault(rule: FaultRule):
+    """Add or replace the fault rule of a route"""
+    try:
+        fault_manager.set_rule(rule)
+        return {"message": f"Fault rule set for {rule.route}"}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.delete("")
+async def delete_faults(route: str | None = None):
+    """Delete the rule of a route, or every rule"""
+    if route is None:
+        fault_manager.clear()
+        return {"message": "Fault rules deleted"}
+    try:
+        fault_manager.delete_rule(route)
+        return {"message": f"Fault rule deleted for {route}"}
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
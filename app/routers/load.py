@@ -1,8 +1,14 @@
 from fastapi import APIRouter, HTTPException
 from ..models.schemas import (
+    BandwidthLoadRequest,
+    ChurnLoadRequest,
+    CPULoadRequest,
+    DiskLoadRequest,
     DynamicCPULoadRequest,
     DynamicMemoryLoadRequest,
-    LoadRequest,
+    HttpLoadRequest,
+    MemoryLoadRequest,
+    NetworkLoadRequest,
 )
 from ..managers.load_manager import LoadManager
 
@@ -19,9 +25,21 @@ async def start_dynamic_cpu_load(request: DynamicCPULoadRequest):
             request.end_value,
             request.duration,
             request.stop_at_end,
+            request.feedback,
+            request.shape,
+            request.resolution,
+            request.steps,
+            request.cycles,
+            request.hold,
+            request.workload,
+            request.placement,
+            request.cpus,
+            request.unit,
         )
         return {
-            "message": f"Progressive CPU load started: {request.start_value}-{request.end_value} over {request.duration} secondes."
+            "message": f"Progressive CPU load started: {request.start_value}-{request.end_value} over {request.duration} secondes.",
+            "shape": request.shape,
+            "resolution": request.resolution,
         }
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -30,15 +48,30 @@ async def start_dynamic_cpu_load(request: DynamicCPULoadRequest):
 
 
 @router.post("/cpu/start")
-async def add_cpu_load(request: LoadRequest):
+async def add_cpu_load(request: CPULoadRequest):
     """Add CPU load"""
     try:
-        load_manager.add_cpu_load(request.value)
-        return {"message": f"CPU load added: {request.value} CPUs"}
+        load_manager.add_cpu_load(
+            request.value,
+            request.feedback,
+            request.workload,
+            request.placement,
+            request.cpus,
+            request.unit,
+        )
+        return {"message": f"CPU load added: {load_manager.cpu_requested} CPUs"}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/cpu")
+async def get_cpu_load():
+    """Get CPU worker pool state and throughput"""
+    return {"active": bool(load_manager.cpu_processes), **load_manager.cpu_stats}
+
+
 @router.post("/cpu/stop")
 async def stop_cpu_load():
     """Stop CPU load"""
@@ -58,9 +91,19 @@ async def start_dynamic_memory_load(request: DynamicMemoryLoadRequest):
             request.end_value,
             request.duration,
             request.stop_at_end,
+            request.shape,
+            request.resolution,
+            request.steps,
+            request.cycles,
+            request.hold,
+            request.mode,
+            request.dirty_rate,
+            request.unit,
         )
         return {
-            "message": f"Progressive memory load started: {request.start_value}-{request.end_value} over {request.duration} secondes."
+            "message": f"Progressive memory load started: {request.start_value}-{request.end_value} over {request.duration} secondes.",
+            "shape": request.shape,
+            "resolution": request.resolution,
         }
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -69,11 +112,15 @@ async def start_dynamic_memory_load(request: DynamicMemoryLoadRequest):
 
 
 @router.post("/memory/start")
-async def add_memory_load(request: LoadRequest):
+async def add_memory_load(request: MemoryLoadRequest):
     """Add memory load"""
     try:
-        load_manager.add_memory_load(request.value)
-        return {"message": f"Memory load added: {request.value} MB"}
+        load_manager.add_memory_load(
+            request.value, request.mode, request.dirty_rate, request.unit
+        )
+        return {"message": f"Memory load added: {load_manager.memory_requested} MB"}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -88,12 +135,247 @@ async def stop_memory_load():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("")
-async def get_current_load():
-    """Get current CPU and memory load"""
+@router.post("/bandwidth/start")
+async def add_bandwidth_load(request: BandwidthLoadRequest):
+    """Start memory-bandwidth load"""
+    try:
+        load_manager.add_bandwidth_load(
+            request.workers,
+            request.level,
+            request.pattern,
+            request.working_set_kb,
+            request.duration,
+        )
+        return {
+            "message": f"Bandwidth load started: {request.workers} workers, {request.pattern.value} on {request.level.value}"
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/bandwidth/stop")
+async def stop_bandwidth_load():
+    """Stop memory-bandwidth load"""
+    try:
+        load_manager.stop_bandwidth_load()
+        return {"message": "Bandwidth load stopped"}
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/bandwidth")
+async def get_bandwidth_load():
+    """Get achieved memory bandwidth"""
+    stats = (
+        load_manager.bandwidth_process.stats if load_manager.bandwidth_process else {}
+    )
+    return {"active": load_manager.bandwidth_active, **stats}
+
+
+@router.post("/disk/start")
+async def add_disk_load(request: DiskLoadRequest):
+    """Start disk I/O load"""
+    try:
+        load_manager.add_disk_load(
+            request.pattern,
+            request.block_size_kb,
+            request.queue_depth,
+            request.size_mb,
+            request.path,
+            request.fsync,
+            request.direct,
+            request.duration,
+        )
+        return {
+            "message": f"Disk load started: {request.pattern.value}, {request.block_size_kb}KB blocks, queue depth {request.queue_depth}"
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/disk/stop")
+async def stop_disk_load():
+    """Stop disk I/O load"""
+    try:
+        load_manager.stop_disk_load()
+        return {"message": "Disk load stopped"}
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/disk")
+async def get_disk_load():
+    """Get achieved IOPS, throughput and I/O latency"""
+    stats = load_manager.disk_process.stats if load_manager.disk_process else {}
+    return {"active": load_manager.disk_active, **stats}
+
+
+@router.post("/network/start")
+async def add_network_load(request: NetworkLoadRequest):
+    """Start network throughput load"""
+    try:
+        load_manager.add_network_load(
+            request.protocol,
+            request.mode,
+            request.host,
+            request.port,
+            request.message_size,
+            request.connections,
+            request.rate_mbps,
+            request.duration,
+        )
+        return {
+            "message": f"Network load started: {request.protocol.value} {request.mode.value}, {request.connections} connections"
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/network/stop")
+async def stop_network_load():
+    """Stop network throughput load"""
+    try:
+        load_manager.stop_network_load()
+        return {"message": "Network load stopped"}
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/network")
+async def get_network_load():
+    """Get achieved network throughput and packet rate"""
+    stats = load_manager.network_process.stats if load_manager.network_process else {}
+    return {"active": load_manager.network_active, **stats}
+
+
+@router.post("/http/start")
+async def add_http_load(request: HttpLoadRequest):
+    """Start open-loop HTTP load"""
+    try:
+        load_manager.add_http_load(
+            request.url,
+            request.rate,
+            request.arrival,
+            request.connections,
+            request.method,
+            request.headers,
+            request.body,
+            request.timeout,
+            request.duration,
+        )
+        return {
+            "message": f"HTTP load started: {request.rate} req/s ({request.arrival.value}) on {request.url}"
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/http/stop")
+async def stop_http_load():
+    """Stop HTTP load"""
+    try:
+        load_manager.stop_http_load()
+        return {"message": "HTTP load stopped"}
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/http")
+async def get_http_load():
+    """Get achieved request rate, statuses and latency percentiles"""
+    stats = load_manager.http_process.stats if load_manager.http_process else {}
+    return {"active": load_manager.http_active, **stats}
+
+
+@router.post("/churn/start")
+async def add_churn_load(request: ChurnLoadRequest):
+    """Start connection churn load"""
+    try:
+        load_manager.add_churn_load(
+            request.rate,
+            request.host,
+            request.port,
+            request.hold_ms,
+            request.linger_zero,
+            request.timeout,
+            request.duration,
+        )
+        target = f"{request.host}:{request.port}" if request.host else "local listener"
+        return {
+            "message": f"Churn load started: {request.rate} connections/s to {target}"
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/churn/stop")
+async def stop_churn_load():
+    """Stop connection churn load"""
+    try:
+        load_manager.stop_churn_load()
+        return {"message": "Churn load stopped"}
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/churn")
+async def get_churn_load():
+    """Get achieved connection rate, connect latency and failures"""
+    stats = load_manager.churn_process.stats if load_manager.churn_process else {}
+    return {"active": load_manager.churn_active, **stats}
+
+
+@router.get("/capacity")
+async def get_capacity():
+    """Get the container CPU and memory capacity read from cgroups"""
+    return load_manager.capacity.to_dict()
+
+
+@router.get("/history")
+async def get_load_history(seconds: float | None = None):
+    """Get the measured vs requested load samples, oldest first"""
+    if seconds is not None and seconds <= 0:
+        raise HTTPException(status_code=400, detail="Seconds must be greater than 0")
+    return {
+        "interval": load_manager.sampler.interval,
+        "samples": load_manager.sampler.series(seconds),
+    }
+
+
+def load_status() -> dict:
+    """Requested load and the latest measured sample"""
+    latest = load_manager.sampler.latest
     return {
         "cpu_requested": load_manager.cpu_requested,
         "memory_requested": load_manager.memory_requested,
         "cpu_active": bool(load_manager.cpu_processes),
         "memory_active": load_manager.memory_process is not None,
+        "bandwidth_active": load_manager.bandwidth_active,
+        "disk_active": load_manager.disk_active,
+        "network_active": load_manager.network_active,
+        "http_active": load_manager.http_active,
+        "churn_active": load_manager.churn_active,
+        "cpu_ramp_error": load_manager.cpu_ramp_error,
+        "memory_ramp_error": load_manager.memory_ramp_error,
+        "cpu_measured": latest.get("cpu_measured"),
+        "memory_measured": latest.get("memory_measured"),
+        "container_cpu": latest.get("container_cpu"),
+        "container_memory": latest.get("container_memory"),
+        "sampled_at": latest.get("timestamp"),
     }
+
+
+@router.get("")
+async def get_current_load():
+    """Get requested and measured CPU and memory load"""
+    return load_status()
@@ -1,5 +1,5 @@
-from fastapi import APIRouter
-from app.models.schemas import LogRequest
+from fastapi import APIRouter, HTTPException
+from app.models.schemas import LogRequest, LogStreamRequest
 from app.managers.log_manager import LogManager
 
 router = APIRouter()
@@ -9,4 +9,95 @@ log_manager = LogManager()
 @router.post("/log/")
 async def create_log(log_data: LogRequest):
     """Create Log"""
-    return await log_manager.create_log(log_data)
+    try:
+        return await log_manager.create_log(log_data)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/log/floods")
+async def get_log_floods():
+    """Get target and achieved rates of recent log floods"""
+    return [flood.to_dict() for flood in log_manager.floods]
+
+
+@router.get("/log/jobs")
+async def list_log_jobs(active: bool | None = None):
+    """List log jobs with their emitted lines and rates"""
+    return [
+        job.to_dict()
+        for job in log_manager.jobs.values()
+        if active is None or job.active == active
+    ]
+
+
+@router.get("/log/jobs/{job_id}")
+async def get_log_job(job_id: str):
+    """Get one log job"""
+    try:
+        return log_manager.get_job(job_id).to_dict()
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+
+
+@router.delete("/log/jobs/{job_id}")
+async def cancel_log_job(job_id: str):
+    """Cancel a running log job"""
+    try:
+        job = log_manager.cancel_job(job_id)
+        return {"message": f"Log job {job.id} cancelled", **job.to_dict()}
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.delete("/log/jobs")
+async def cancel_log_jobs():
+    """Cancel every running log job"""
+    jobs = log_manager.cancel_jobs()
+    return {"message": f"{len(jobs)} log jobs cancelled", "ids": [j.id for j in jobs]}
+
+
+@router.get("/log/queue")
+async def get_log_queue():
+    """Get the log queue state and overflow counters"""
+    return log_manager.emitter.stats()
+
+
+@router.post("/log/streams")
+async def create_log_stream(stream_data: LogStreamRequest):
+    """Create a named log stream with its own format"""
+    try:
+        stream = log_manager.create_stream(
+            stream_data.name, stream_data.format, stream_data.sink
+        )
+        return {"message": f"Log stream {stream.name} created", **stream.to_dict()}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/log/streams")
+async def list_log_streams():
+    """List log streams and the lines each emitted"""
+    return [stream.to_dict() for stream in log_manager.streams.values()]
+
+
+@router.delete("/log/streams/{name:path}")
+async def delete_log_stream(name: str):
+    """Delete a log stream"""
+    try:
+        stream = log_manager.delete_stream(name)
+        return {"message": f"Log stream {stream.name} deleted", **stream.to_dict()}
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/log/sinks")
+async def list_log_sinks():
+    """List log sinks with their write latency and bytes written"""
+    return [sink.stats() for sink in log_manager.sinks.values()]
@@ -0,0 +1,222 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from .faults import fault_manager
+from .load import load_manager
+from .log_router import log_manager
+from .probes import lifecycle_manager
+
+router = APIRouter(tags=["Metrics"])
+
+MB = 1024 * 1024
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def _escape(value) -> str:
+    """Escape a label value as the text format requires"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict) -> str:
+    text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+    return f"{{{text}}}" if labels else ""
+
+
+def _family(name: str, kind: str, help_text: str, samples) -> list[str]:
+    """Render one metric family in the Prometheus text format
+
+    `samples` is a list of (labels, value) pairs; samples without a value are
+    skipped.
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        if value is not None:
+            lines.append(f"{name}{_labels(labels)} {value}")
+    return lines
+
+
+def _summary(name: str, help_text: str, samples) -> list[str]:
+    """Render a summary family as its `_sum` and `_count` series
+
+    `samples` is a list of (labels, LatencyHistogram) pairs; only the running
+    totals are read, so no percentile is computed on scrape.
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} summary"]
+    for labels, histogram in samples:
+        lines.append(f"{name}_sum{_labels(labels)} {round(histogram.total, 6)}")
+        lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+    return lines
+
+
+def _mb_to_bytes(value):
+    return None if value is None else value * MB
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics for load, log and probe state
+
+    Only reads values already maintained by the managers: the latest sample of
+    the load sampler and the counters updated when logs are written or probes
+    change.
+    """
+    latest = load_manager.sampler.latest
+    loads = latest.get("loads", {})
+    active = {
+        "cpu": bool(load_manager.cpu_processes),
+        "memory": load_manager.memory_process is not None,
+        "bandwidth": load_manager.bandwidth_active,
+        "disk": load_manager.disk_active,
+        "network": load_manager.network_active,
+        "http": load_manager.http_active,
+        "churn": load_manager.churn_active,
+    }
+
+    probes = {
+        "readiness": lifecycle_manager.readiness_status,
+        "liveness": lifecycle_manager.liveness_status,
+    }
+
+    lines = []
+    lines += _family(
+        "stressed_cpu_requested_cores",
+        "gauge",
+        "CPU load requested in cores",
+        [({}, load_manager.cpu_requested)],
+    )
+    lines += _family(
+        "stressed_cpu_measured_cores",
+        "gauge",
+        "CPU consumed by the load workers in cores",
+        [({}, latest.get("cpu_measured"))],
+    )
+    lines += _family(
+        "stressed_cpu_capacity_cores",
+        "gauge",
+        "Usable CPUs of the container",
+        [({}, load_manager.system_cpus)],
+    )
+    lines += _family(
+        "stressed_memory_requested_bytes",
+        "gauge",
+        "Memory load requested in bytes",
+        [({}, _mb_to_bytes(load_manager.memory_requested))],
+    )
+    lines += _family(
+        "stressed_memory_measured_bytes",
+        "gauge",
+        "RSS of the load workers in bytes",
+        [({}, _mb_to_bytes(latest.get("memory_measured")))],
+    )
+    lines += _family(
+        "stressed_memory_capacity_bytes",
+        "gauge",
+        "Usable memory of the container in bytes",
+        [({}, _mb_to_bytes(load_manager.system_memory))],
+    )
+    lines += _family(
+        "stressed_container_cpu_cores",
+        "gauge",
+        "CPU consumed by the whole container in cores",
+        [({}, latest.get("container_cpu"))],
+    )
+    lines += _family(
+        "stressed_container_memory_bytes",
+        "gauge",
+        "Memory charged to the whole container in bytes",
+        [({}, _mb_to_bytes(latest.get("container_memory")))],
+    )
+    lines += _family(
+        "stressed_load_active",
+        "gauge",
+        "Whether a load is running",
+        [({"load": name}, int(value)) for name, value in active.items()],
+    )
+    lines += _family(
+        "stressed_worker_cpu_cores",
+        "gauge",
+        "CPU consumed by the worker process tree of a load in cores",
+        [({"load": name}, load["cpu"]) for name, load in loads.items()],
+    )
+    lines += _family(
+        "stressed_worker_rss_bytes",
+        "gauge",
+        "RSS of the worker process tree of a load in bytes",
+        [({"load": name}, load["rss_mb"] * MB) for name, load in loads.items()],
+    )
+    lines += _family(
+        "stressed_log_lines_total",
+        "counter",
+        "Log lines emitted",
+        [
+            ({"level": level.lower()}, count)
+            for level, count in sorted(log_manager.lines_emitted.items())
+        ],
+    )
+    lines += _family(
+        "stressed_log_bytes_total",
+        "counter",
+        "Log bytes emitted, UTF-8 encoded",
+        [({}, log_manager.bytes_emitted)],
+    )
+    lines += _family(
+        "stressed_log_dropped_total",
+        "counter",
+        "Log lines dropped by the log queue overflow policy",
+        [({}, log_manager.lines_dropped)],
+    )
+    sinks = log_manager.sinks.values()
+    lines += _family(
+        "stressed_log_queue_lines",
+        "gauge",
+        "Log lines waiting for the writer thread of a sink",
+        [({"sink": sink.sink.name}, sink.queued) for sink in sinks],
+    )
+    lines += _family(
+        "stressed_log_sink_bytes_total",
+        "counter",
+        "Log bytes written by a sink",
+        [({"sink": sink.sink.name}, sink.bytes_written) for sink in sinks],
+    )
+    lines += _summary(
+        "stressed_log_sink_write_seconds",
+        "Time spent writing and flushing a batch of log lines to a sink",
+        [({"sink": sink.sink.name}, sink.latency) for sink in sinks],
+    )
+    lines += _family(
+        "stressed_probe_healthy",
+        "gauge",
+        "Whether a probe currently reports success",
+        [
+            ({"probe": probe}, int(lifecycle_manager.is_healthy(status)))
+            for probe, status in probes.items()
+        ],
+    )
+    lines += _family(
+        "stressed_probe_flips_total",
+        "counter",
+        "Healthy/unhealthy transitions of a probe",
+        [({"probe": probe}, count) for probe, count in lifecycle_manager.flips.items()],
+    )
+    faults = fault_manager.stats
+    lines += _family(
+        "stressed_fault_requests_total",
+        "counter",
+        "Requests matched by a fault rule",
+        [({"route": route}, stats["requests"]) for route, stats in faults.items()],
+    )
+    lines += _family(
+        "stressed_fault_errors_total",
+        "counter",
+        "Error responses injected by a fault rule",
+        [({"route": route}, stats["errors"]) for route, stats in faults.items()],
+    )
+    lines += _family(
+        "stressed_fault_delay_seconds_total",
+        "counter",
+        "Latency injected by a fault rule",
+        [
+            ({"route": route}, round(stats["delay_seconds"], 6))
+            for route, stats in faults.items()
+        ],
+    )
+    return PlainTextResponse("\n".join(lines) + "\n", media_type=CONTENT_TYPE)
@@ -6,15 +6,19 @@ router = APIRouter(prefix="/probes", tags=["Health Probes"])
 lifecycle_manager = LifecycleManager()
 
 
-@router.get("")
-async def get_probes():
-    """Endpoint to get probe status"""
+def probe_status() -> dict:
     return {
         "readiness_status": lifecycle_manager.readiness_status,
         "liveness_status": lifecycle_manager.liveness_status,
     }
 
 
+@router.get("")
+async def get_probes():
+    """Endpoint to get probe status"""
+    return probe_status()
+
+
 @router.get("/readiness")
 async def readiness_probe():
     """Get readiness probe status"""
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import ValidationError
+from ..managers.scenario_manager import ScenarioManager
+from .load import load_manager
+from .log_router import log_manager
+from .probes import lifecycle_manager
+
+router = APIRouter(prefix="/scenarios", tags=["Scenarios"])
+scenario_manager = ScenarioManager(load_manager, log_manager, lifecycle_manager)
+
+
+@router.post("")
+async def start_scenario(request: Request):
+    """Start a scenario sent as JSON, or as YAML with a YAML content type"""
+    try:
+        scenario = scenario_manager.parse(
+            await request.body(), request.headers.get("content-type", "")
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422, detail=e.errors(include_url=False, include_context=False)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        run = scenario_manager.start(scenario)
+        return {"message": f"Scenario {scenario.name} started", **run.to_dict()}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("")
+async def list_scenarios():
+    """List running and recent scenarios"""
+    return [run.to_dict() for run in scenario_manager.runs.values()]
+
+
+@router.get("/{run_id}")
+async def get_scenario(run_id: str):
+    """Get the progress of a scenario"""
+    try:
+        return scenario_manager.get(run_id).to_dict()
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+
+
+@router.delete("/{run_id}")
+async def cancel_scenario(run_id: str):
+    """Cancel a running scenario"""
+    try:
+        run = scenario_manager.cancel(run_id)
+        return {"message": f"Scenario {run.scenario.name} cancelled", "id": run.id}
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,78 @@
+import os
+import time
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from ..managers.telemetry import RateMeter, TelemetryBroadcaster
+from .load import load_status
+from .log_router import log_manager
+from .probes import probe_status
+
+router = APIRouter(prefix="/telemetry", tags=["Telemetry"])
+
+lines_rate = RateMeter()
+bytes_rate = RateMeter()
+
+
+def snapshot() -> dict:
+    """Load, log-rate and probe state pushed to the stream subscribers"""
+    lines = sum(log_manager.lines_emitted.values())
+    return {
+        "timestamp": round(time.time(), 3),
+        "load": load_status(),
+        "logs": {
+            "lines_total": lines,
+            "bytes_total": log_manager.bytes_emitted,
+            "lines_per_sec": lines_rate.rate(lines),
+            "bytes_per_sec": bytes_rate.rate(log_manager.bytes_emitted),
+        },
+        "probes": probe_status(),
+    }
+
+
+broadcaster = TelemetryBroadcaster(
+    snapshot, float(os.getenv("TELEMETRY_INTERVAL", 1.0))
+)
+
+
+@router.get("/stream")
+async def stream_telemetry(interval: float | None = None, limit: int | None = None):
+    """Stream telemetry as Server-Sent Events
+
+    `interval` slows the stream down for this client (a multiple of the
+    producer interval); `limit` closes the stream after that many events.
+    """
+    if limit is not None and limit < 1:
+        raise HTTPException(status_code=400, detail="Limit must be greater than 0")
+    try:
+        broadcaster.ticks_per_event(interval)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def events():
+        # Subscribed once streaming starts, so a client gone before never leaks
+        queue = broadcaster.subscribe(interval)
+        sent = 0
+        try:
+            while limit is None or sent < limit:
+                data = await queue.get()
+                yield f"event: telemetry\ndata: {data}\n\n"
+                sent += 1
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("")
+async def get_telemetry():
+    """Get the stream settings and current number of subscribers"""
+    return {
+        "interval": broadcaster.interval,
+        "subscribers": broadcaster.subscribers,
+        "ticks": broadcaster.ticks,
+        "errors": broadcaster.errors,
+    }
@@ -0,0 +1,116 @@
+import argparse
+import ctypes
+import json
+import multiprocessing
+import threading
+import time
+
+from stress_common import watch_stdin  # met la racine du dépôt sur sys.path
+from app.managers.capacity import cache_working_set
+
+CACHE_LINE = 64
+REPORT_INTERVAL = 1.0
+MIN_PASS_BYTES = 1024 * 1024
+PATTERNS = ("copy", "read", "write")
+LEVELS = ("l1", "l2", "l3", "dram")
+
+
+def run_worker(pattern, size, moved):
+    """Parcourt le jeu de travail en boucle avec des opérations vectorisées.
+
+    copy : memcpy entre deux moitiés, read : memchr sur tout le tampon,
+    write : memset sur tout le tampon.
+    """
+    repeats = max(1, MIN_PASS_BYTES // size)
+    if pattern == "copy":
+        half = size // 2
+        src = memoryview(bytearray(b"\x01" * half))
+        dst = memoryview(bytearray(half))
+        while True:
+            for _ in range(repeats):
+                dst[:] = src
+            moved.value += 2 * half * repeats
+    elif pattern == "read":
+        buffer = bytearray(b"\x01" * size)
+        while True:
+            for _ in range(repeats):
+                buffer.find(b"\xff")
+            moved.value += size * repeats
+    else:
+        buffer = (ctypes.c_char * size).from_buffer(bytearray(size))
+        value = 0
+        while True:
+            for _ in range(repeats):
+                value = (value + 1) & 0xFF
+                ctypes.memset(buffer, value, size)
+            moved.value += size * repeats
+
+
+def stress_bandwidth(workers, pattern, size, duration, level):
+    counters = []
+    processes = []
+    for _ in range(workers):
+        moved = multiprocessing.RawValue("d", 0.0)
+        p = multiprocessing.Process(target=run_worker, args=(pattern, size, moved))
+        p.daemon = True
+        p.start()
+        counters.append(moved)
+        processes.append(p)
+
+    stop = threading.Event()
+    watch_stdin(stop)
+    started = last = time.monotonic()
+    last_bytes = 0.0
+    while not stop.wait(REPORT_INTERVAL):
+        now = time.monotonic()
+        total = sum(counter.value for counter in counters)
+        rate = (total - last_bytes) / (now - last)
+        accesses = rate / CACHE_LINE
+        print(
+            json.dumps(
+                {
+                    "pattern": pattern,
+                    "level": level,
+                    "working_set_kb": size // 1024,
+                    "workers": workers,
+                    "gbps": round(rate / 1e9, 3),
+                    "ns_per_access": (
+                        round(workers * 1e9 / accesses, 3) if accesses else None
+                    ),
+                    "total_gb": round(total / 1e9, 3),
+                    "elapsed": round(now - started, 1),
+                }
+            ),
+            flush=True,
+        )
+        last, last_bytes = now, total
+        if duration and now - started >= duration:
+            break
+    for p in processes:
+        p.terminate()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Charge de bande passante mémoire et de hiérarchie de caches."
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--pattern", choices=PATTERNS, default="copy")
+    parser.add_argument("--level", choices=LEVELS, default="dram")
+    parser.add_argument(
+        "--working-set-kb",
+        type=int,
+        default=None,
+        help="Taille du jeu de travail par worker, prioritaire sur --level",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=0, help="Durée en secondes (0 = infini)"
+    )
+    args = parser.parse_args()
+
+    size = (
+        args.working_set_kb * 1024
+        if args.working_set_kb
+        else cache_working_set(args.level)
+    )
+    stress_bandwidth(args.workers, args.pattern, size, args.duration, args.level)
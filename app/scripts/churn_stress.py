@@ -0,0 +1,246 @@
+import argparse
+import asyncio
+import errno
+import json
+import resource
+import socket
+import struct
+import sys
+import threading
+
+from stress_common import watch_stdin  # met la racine du dépôt sur sys.path
+from app.managers.histogram import LatencyHistogram
+
+REPORT_INTERVAL = 1.0
+# Connexions en cours au-delà desquelles les tentatives suivantes sont abandonnées
+MAX_OUTSTANDING = 10000
+PERCENTILES = (50, 99, 99.9)
+TCP_TABLES = ("/proc/net/tcp", "/proc/net/tcp6")
+TIME_WAIT = "06"
+CONNTRACK_COUNT = "/proc/sys/net/netfilter/nf_conntrack_count"
+PORT_RANGE = "/proc/sys/net/ipv4/ip_local_port_range"
+FAILURES = {
+    errno.ECONNREFUSED: "refused",
+    errno.EADDRNOTAVAIL: "no_port",
+    errno.EMFILE: "fd_limit",
+    errno.ENFILE: "fd_limit",
+    errno.ECONNRESET: "reset",
+    errno.ENETUNREACH: "unreachable",
+    errno.EHOSTUNREACH: "unreachable",
+}
+
+
+def time_wait_count():
+    """Sockets TCP en TIME_WAIT dans l'espace de noms réseau du conteneur."""
+    count = 0
+    for table in TCP_TABLES:
+        try:
+            with open(table) as f:
+                next(f, None)
+                count += sum(1 for line in f if line.split(None, 4)[3] == TIME_WAIT)
+        except OSError:
+            continue
+    return count
+
+
+def read_int(path):
+    try:
+        with open(path) as f:
+            return [int(value) for value in f.read().split()]
+    except (OSError, ValueError):
+        return None
+
+
+def raise_fd_limit():
+    """Chaque connexion ouverte consomme un descripteur : limite souple au maximum."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+class Churn:
+    """Ouvre et ferme des connexions TCP courtes à un rythme fixe, en boucle ouverte.
+
+    La fermeture normale laisse le socket client en TIME_WAIT et son port
+    éphémère réservé ; avec `linger_zero` la connexion est coupée par un RST,
+    sans TIME_WAIT.
+    """
+
+    def __init__(self, family, address, rate, hold, linger_zero, timeout):
+        self.family = family
+        self.address = address
+        self.rate = rate
+        self.hold = hold
+        self.linger_zero = linger_zero
+        self.timeout = timeout
+        self.tasks = set()
+        self.outstanding = 0
+        self.attempted = 0
+        self.connected = 0
+        self.dropped = 0
+        self.failures = {}
+        self.latency = LatencyHistogram()
+        self.latency_total = LatencyHistogram()
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while True:
+            now = loop.time()
+            while next_at <= now:
+                if self.outstanding >= MAX_OUTSTANDING:
+                    self.dropped += 1
+                else:
+                    self.outstanding += 1
+                    task = asyncio.create_task(self._connect())
+                    self.tasks.add(task)
+                    task.add_done_callback(self.tasks.discard)
+                next_at += 1 / self.rate
+            await asyncio.sleep(next_at - now)
+
+    async def _connect(self):
+        loop = asyncio.get_running_loop()
+        self.attempted += 1
+        sock = None
+        try:
+            sock = socket.socket(self.family, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            if self.linger_zero:
+                sock.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                )
+            started = loop.time()
+            await asyncio.wait_for(loop.sock_connect(sock, self.address), self.timeout)
+            self.latency.record(loop.time() - started)
+            self.connected += 1
+            if self.hold:
+                await asyncio.sleep(self.hold)
+        except asyncio.TimeoutError:
+            self._fail("timeout")
+        except OSError as e:
+            self._fail(FAILURES.get(e.errno, "other"))
+        finally:
+            if sock is not None:
+                sock.close()
+            self.outstanding -= 1
+
+    def _fail(self, kind):
+        self.failures[kind] = self.failures.get(kind, 0) + 1
+
+    def report(self):
+        """Histogramme de l'intervalle écoulé, ajouté ensuite au cumul."""
+        latency, self.latency = self.latency, LatencyHistogram()
+        self.latency_total.merge(latency)
+        return latency
+
+
+async def drain(reader, writer):
+    """Attend la fermeture par le client : le TIME_WAIT reste de son côté."""
+    try:
+        await reader.read()
+    except (OSError, asyncio.CancelledError):
+        # Arrêt de la charge avec des connexions encore ouvertes
+        pass
+    writer.close()
+
+
+async def stress_churn(host, port, rate, hold, linger_zero, timeout, duration):
+    raise_fd_limit()
+    loop = asyncio.get_running_loop()
+    server = None
+    if host is None:
+        server = await asyncio.start_server(drain, "127.0.0.1", 0, backlog=4096)
+        host, port = server.sockets[0].getsockname()[:2]
+    # Résolution unique : ni requête DNS ni temps de résolution par connexion
+    try:
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except OSError as e:
+        print(json.dumps({"error": f"Cannot resolve {host}: {e}"}), flush=True)
+        sys.exit(1)
+    family, _, _, _, address = infos[0]
+    churn = Churn(family, address, rate, hold, linger_zero, timeout)
+
+    stop = threading.Event()
+    watch_stdin(stop)
+    task = asyncio.create_task(churn.run())
+    port_range = read_int(PORT_RANGE)
+
+    started = last = loop.time()
+    previous = {"attempted": 0, "connected": 0}
+    while not stop.is_set():
+        await asyncio.sleep(REPORT_INTERVAL)
+        now = loop.time()
+        interval = now - last
+        conntrack = read_int(CONNTRACK_COUNT)
+        stats = {
+            "target": f"{host}:{port}",
+            "address": address[0],
+            "local_listener": server is not None,
+            "target_rate": rate,
+            "attempt_rate": round(
+                (churn.attempted - previous["attempted"]) / interval, 1
+            ),
+            "conn_per_s": round(
+                (churn.connected - previous["connected"]) / interval, 1
+            ),
+            "open": churn.outstanding,
+            "dropped": churn.dropped,
+            "failures": churn.failures,
+            "connect_latency": churn.report().to_dict(PERCENTILES),
+            "connect_latency_total": churn.latency_total.to_dict(PERCENTILES),
+            "time_wait": time_wait_count(),
+            "conntrack": conntrack[0] if conntrack else None,
+            "ephemeral_ports": (
+                port_range[1] - port_range[0] + 1 if port_range else None
+            ),
+            "elapsed": round(now - started, 1),
+        }
+        print(json.dumps(stats), flush=True)
+        previous.update(attempted=churn.attempted, connected=churn.connected)
+        last = now
+        if duration and now - started >= duration:
+            break
+    task.cancel()
+    if server is not None:
+        server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Charge de renouvellement de connexions TCP."
+    )
+    parser.add_argument(
+        "--host", default=None, help="Hôte cible (écouteur local si absent)"
+    )
+    parser.add_argument("--port", type=int, default=None, help="Port cible")
+    parser.add_argument(
+        "--rate", type=float, required=True, help="Connexions par seconde"
+    )
+    parser.add_argument(
+        "--hold-ms", type=float, default=0, help="Durée d'ouverture de chaque connexion"
+    )
+    parser.add_argument(
+        "--linger-zero", action="store_true", help="Fermeture par RST, sans TIME_WAIT"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=5, help="Délai maximal de connexion"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=0, help="Durée en secondes (0 = infini)"
+    )
+    args = parser.parse_args()
+
+    if args.host is not None and args.port is None:
+        print("Error: --port is required with --host.")
+        sys.exit(1)
+    asyncio.run(
+        stress_churn(
+            args.host,
+            args.port,
+            args.rate,
+            args.hold_ms / 1000,
+            args.linger_zero,
+            args.timeout,
+            args.duration,
+        )
+    )
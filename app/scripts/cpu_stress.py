@@ -1,56 +1,440 @@
+import argparse
+import glob
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import queue
+import random
 import sys
+import threading
 import time
-import multiprocessing
+import zlib
 
+import psutil
 
-def stress_single_cpu():
-    """Charge un CPU à 100% en utilisant une boucle intensive."""
-    while True:
-        pass
+import stress_common  # noqa: F401, met la racine du dépôt sur sys.path
+from app.managers.capacity import parse_cpulist
 
+PERIOD = 0.1
+CONTROL_INTERVAL = 0.5
+REPORT_INTERVAL = 1.0
+FEEDBACK_GAIN = 0.5
 
-def stress_fractional_cpu(fraction):
-    """Charge un CPU à une fraction spécifique."""
-    interval = 0.1
-    while True:
-        start = time.time()
-        while (time.time() - start) < fraction * interval:
-            pass
-        time.sleep(interval - fraction * interval)
+WORKLOADS = ("spin", "int", "float", "hash", "zlib", "json", "pointer")
+PLACEMENTS = ("none", "spread", "pack", "numa")
+SYSFS_CPU = "/sys/devices/system/cpu"
+SYSFS_NODE = "/sys/devices/system/node"
+
+
+def numa_nodes(allowed):
+    """CPUs autorisés de chaque nœud NUMA ; un seul nœud si sysfs est absent."""
+    nodes = {}
+    for path in sorted(glob.glob(os.path.join(SYSFS_NODE, "node[0-9]*"))):
+        try:
+            with open(os.path.join(path, "cpulist")) as f:
+                cpus = parse_cpulist(f.read()) & allowed
+        except OSError:
+            continue
+        if cpus:
+            nodes[int(os.path.basename(path)[4:])] = cpus
+    return nodes or {0: set(allowed)}
 
 
-def stress_cpu(cpu_count, fraction):
-    """Simule l'utilisation de CPU avec un nombre total de CPUs simulés."""
-    processes = []
+def core_of(cpu):
+    """Identifiant (socket, cœur) physique d'un CPU logique."""
+    topology = os.path.join(SYSFS_CPU, f"cpu{cpu}", "topology")
     try:
-        for _ in range(int(cpu_count)):
-            p = multiprocessing.Process(target=stress_single_cpu)
-            p.daemon = True
-            p.start()
-            processes.append(p)
-        if fraction > 0:
-            p = multiprocessing.Process(target=stress_fractional_cpu, args=(fraction,))
-            p.daemon = True
-            p.start()
-            processes.append(p)
-        for p in processes:
-            p.join()
-    except KeyboardInterrupt:
-        for p in processes:
-            p.terminate()
+        with open(os.path.join(topology, "physical_package_id")) as f:
+            package = int(f.read())
+        with open(os.path.join(topology, "core_id")) as f:
+            return package, int(f.read())
+    except OSError:
+        return 0, cpu
+
+
+def placement_sets(policy, allowed, count):
+    """Ensembles d'affinité des `count` premiers workers selon la politique.
+
+    - none : tous les CPUs autorisés, placement libre par l'ordonnanceur
+    - pack : un CPU par worker, en remplissant nœud, cœur puis hyperthreads
+    - spread : un CPU par worker, cœurs physiques d'abord, nœuds en alternance
+    - numa : chaque worker confiné à un nœud NUMA, nœuds remplis dans l'ordre
+    """
+    if policy == "none":
+        return [set(allowed)] * count
+    nodes = numa_nodes(allowed)
+    if policy == "numa":
+        per_node = []
+        for cpus in nodes.values():
+            per_node += [cpus] * len(cpus)
+        return [per_node[i % len(per_node)] for i in range(count)]
+
+    node_of = {cpu: node for node, cpus in nodes.items() for cpu in cpus}
+    cores = {}
+    for cpu in sorted(allowed):
+        cores.setdefault((node_of.get(cpu, 0), core_of(cpu)), []).append(cpu)
+    if policy == "pack":
+        order = [cpu for key in sorted(cores) for cpu in cores[key]]
+    else:
+        ranked = []
+        rank_in_node = {}
+        for (node, _), siblings in sorted(cores.items()):
+            index = rank_in_node.get(node, 0)
+            rank_in_node[node] = index + 1
+            for thread, cpu in enumerate(siblings):
+                ranked.append(((thread, index, node), cpu))
+        order = [cpu for _, cpu in sorted(ranked)]
+    return [{order[i % len(order)]} for i in range(count)]
+
+
+def make_kernel(workload):
+    """Construit l'opération unitaire répétée par un worker.
+
+    Chaque appel compte pour une opération dans le débit rapporté :
+    - spin : itération de boucle vide
+    - int : 1000 itérations d'un générateur congruentiel
+    - float : produit matriciel 64x64 (NumPy) ou produit scalaire de 4096 flottants
+    - hash : SHA-256 d'un bloc de 4 KB
+    - zlib : compression d'un bloc de texte de 16 KB
+    - json : encodage puis décodage d'un document d'une centaine de champs
+    - pointer : 1000 sauts dans une permutation aléatoire avec branchement
+    """
+    if workload == "int":
+
+        def kernel():
+            x = 1
+            for _ in range(1000):
+                x = (x * 1103515245 + 12345) & 0x7FFFFFFF
+            return x
+
+    elif workload == "float":
+        try:
+            import numpy
+
+            a = numpy.random.rand(64, 64)
+            b = numpy.random.rand(64, 64)
+
+            def kernel():
+                return a @ b
+
+        except ImportError:
+            a = [random.random() for _ in range(4096)]
+            b = [random.random() for _ in range(4096)]
+
+            def kernel():
+                return sum(x * y for x, y in zip(a, b))
+
+    elif workload == "hash":
+        block = os.urandom(4096)
+
+        def kernel():
+            return hashlib.sha256(block).digest()
+
+    elif workload == "zlib":
+        words = [f"word{random.randint(0, 500)}" for _ in range(3000)]
+        block = " ".join(words).encode()[:16384]
+
+        def kernel():
+            return zlib.compress(block, 6)
+
+    elif workload == "json":
+        document = {
+            f"field_{i}": {"id": i, "name": f"item-{i}", "tags": ["a", "b"]}
+            for i in range(100)
+        }
+
+        def kernel():
+            return json.loads(json.dumps(document))
+
+    elif workload == "pointer":
+        chain = list(range(1 << 16))
+        random.shuffle(chain)
+
+        def kernel():
+            i = odd = 0
+            for _ in range(1000):
+                i = chain[i]
+                if i & 1:
+                    odd += 1
+                else:
+                    odd -= 1
+            return odd
+
+    else:
+
+        def kernel():
+            pass
+
+    return kernel
+
+
+def run_worker(duty, wake, kind, ops, period=PERIOD):
+    """Occupe un CPU selon le rapport cyclique partagé avec le pool.
+
+    Un worker inactif (rapport nul) dort sur son évènement ; un changement de
+    cible le réveille immédiatement, sans attendre la fin de la période. La
+    phase active répète l'opération de la charge choisie et compte les
+    opérations effectuées.
+    """
+    current = kind.value
+    kernel = make_kernel(WORKLOADS[current])
+    while True:
+        target = duty.value
+        if kind.value != current:
+            current = kind.value
+            kernel = make_kernel(WORKLOADS[current])
+        if target <= 0:
+            wake.wait()
+            wake.clear()
+            continue
+        start = time.perf_counter()
+        busy_until = start + target * period
+        count = 0
+        while time.perf_counter() < busy_until:
+            if duty.value != target:
+                break
+            kernel()
+            count += 1
+        else:
+            remaining = start + period - time.perf_counter()
+            if remaining > 0 and wake.wait(remaining):
+                wake.clear()
+        ops.value += count
+
+
+class Worker:
+    """Processus de charge et valeurs partagées avec le pool."""
+
+    def __init__(self, workload):
+        self.duty = multiprocessing.RawValue("d", 0.0)
+        self.kind = multiprocessing.RawValue("i", WORKLOADS.index(workload))
+        self.ops = multiprocessing.RawValue("d", 0.0)
+        self.wake = multiprocessing.Event()
+        self.process = multiprocessing.Process(
+            target=run_worker, args=(self.duty, self.wake, self.kind, self.ops)
+        )
+        self.process.daemon = True
+        self.process.start()
+        self.handle = psutil.Process(self.process.pid)
+
+
+class CpuWorkerPool:
+    """Pool de workers créé une seule fois puis reciblé en place."""
+
+    def __init__(self, size):
+        self.workers = []
+        self.allowed = os.sched_getaffinity(0)
+        self.target = 0.0
+        self.feedback = False
+        self.workload = "spin"
+        self.placement = "none"
+        self.cpus = None
+        self.correction = 0.0
+        self.measured = 0.0
+        self.ops_rates = []
+        self._grow(size)
+        self._last_wall = time.perf_counter()
+        self._last_cpu = self._consumed()
+        self._last_ops = [worker.ops.value for worker in self.workers]
+
+    def _grow(self, size):
+        grown = len(self.workers) < size
+        while len(self.workers) < size:
+            self.workers.append(Worker(self.workload))
+        if grown and self.placement != "none":
+            self._place()
+
+    def retarget(
+        self, target, feedback=False, workload="spin", placement="none", cpus=None
+    ):
+        """Applique une nouvelle charge sans recréer de processus."""
+        if workload not in WORKLOADS:
+            raise ValueError(f"Unknown workload: {workload}")
+        if placement not in PLACEMENTS:
+            raise ValueError(f"Unknown placement: {placement}")
+        if cpus is not None and not set(cpus) <= self.allowed:
+            raise ValueError(f"CPUs {sorted(set(cpus) - self.allowed)} not allowed")
+        self._grow(math.ceil(target))
+        if placement != self.placement or cpus != self.cpus:
+            self.placement = placement
+            self.cpus = cpus
+            self._place()
+        if feedback != self.feedback or workload != self.workload:
+            self.correction = 0.0
+        self.target = target
+        self.feedback = feedback
+        self.workload = workload
+        for worker in self.workers:
+            worker.kind.value = WORKLOADS.index(workload)
+        self._apply()
+
+    def _place(self):
+        """Épingle chaque worker sur son ensemble de CPUs (sched_setaffinity)."""
+        allowed = set(self.cpus) if self.cpus else self.allowed
+        sets = placement_sets(self.placement, allowed, len(self.workers))
+        for worker, cpus in zip(self.workers, sets):
+            os.sched_setaffinity(worker.process.pid, cpus)
+
+    def _placement(self):
+        placement = []
+        for worker in self.workers:
+            try:
+                placement.append(
+                    {
+                        "pid": worker.process.pid,
+                        "affinity": sorted(os.sched_getaffinity(worker.process.pid)),
+                        "cpu": worker.handle.cpu_num(),
+                        "active": worker.duty.value > 0,
+                    }
+                )
+            except (OSError, psutil.NoSuchProcess):
+                continue
+        return placement
+
+    def _duties(self):
+        active = math.ceil(self.target)
+        if self.feedback and active:
+            self.correction = max(
+                -self.target, min(self.correction, active - self.target)
+            )
+            duties = [(self.target + self.correction) / active] * active
+        else:
+            full = int(self.target)
+            duties = [1.0] * full
+            if self.target - full > 0:
+                duties.append(self.target - full)
+        return duties + [0.0] * (len(self.workers) - len(duties))
+
+    def _apply(self):
+        for worker, value in zip(self.workers, self._duties()):
+            if worker.duty.value != value:
+                worker.duty.value = value
+                worker.wake.set()
+
+    def _consumed(self):
+        total = 0.0
+        for worker in self.workers:
+            try:
+                times = worker.handle.cpu_times()
+                total += times.user + times.system
+            except psutil.NoSuchProcess:
+                continue
+        return total
+
+    def control(self):
+        """Mesure la consommation réelle et corrige en mode boucle fermée."""
+        now = time.perf_counter()
+        consumed = self._consumed()
+        elapsed = now - self._last_wall
+        self.measured = (consumed - self._last_cpu) / elapsed
+        ops = [worker.ops.value for worker in self.workers]
+        previous = self._last_ops + [0.0] * (len(ops) - len(self._last_ops))
+        self.ops_rates = [(o - p) / elapsed for o, p in zip(ops, previous)]
+        self._last_wall, self._last_cpu, self._last_ops = now, consumed, ops
+        if self.feedback and self.target > 0:
+            self.correction += FEEDBACK_GAIN * (self.target - self.measured)
+            self._apply()
+
+    def status(self):
+        return {
+            "target": self.target,
+            "measured": round(self.measured, 3),
+            "feedback": self.feedback,
+            "workload": self.workload,
+            "workers": len(self.workers),
+            "duty": [round(worker.duty.value, 3) for worker in self.workers],
+            "ops_per_sec": round(sum(self.ops_rates), 1),
+            "worker_ops_per_sec": [round(rate, 1) for rate in self.ops_rates],
+            "placement_policy": self.placement,
+            "cpus": self.cpus,
+            "placement": self._placement(),
+        }
+
+    def run(self, commands):
+        """Boucle principale : commandes, régulation et rapports d'état."""
+        next_control = time.monotonic() + CONTROL_INTERVAL
+        next_report = time.monotonic()
+        while True:
+            timeout = max(0.0, min(next_control, next_report) - time.monotonic())
+            try:
+                command = commands.get(timeout=timeout)
+                if command is None:
+                    return
+                self.retarget(
+                    float(command.get("cpu", 0)),
+                    bool(command.get("feedback")),
+                    command.get("workload", "spin"),
+                    command.get("placement", "none"),
+                    command.get("cpus"),
+                )
+                next_report = time.monotonic()
+            except queue.Empty:
+                pass
+            except ValueError as e:
+                print(f"Invalid command: {e}", file=sys.stderr)
+            now = time.monotonic()
+            if now >= next_control:
+                self.control()
+                next_control = now + CONTROL_INTERVAL
+            if now >= next_report:
+                print(json.dumps(self.status()), flush=True)
+                next_report = now + REPORT_INTERVAL
+
+
+def read_commands(commands):
+    """Lit les commandes JSON sur stdin ; EOF arrête le pool."""
+    for line in sys.stdin:
+        try:
+            commands.put(json.loads(line))
+        except ValueError:
+            print(f"Invalid command: {line.strip()}", file=sys.stderr)
+    commands.put(None)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python cpu_stress.py <cpu_load>")
-        print("<cpu_load> can be a fractional value (e.g., 2.5 for 2 CPUs + 50%).")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Pool de charge CPU piloté par des commandes JSON sur stdin "
+        '(ex: {"cpu": 2.5, "feedback": false, "workload": "hash"}).'
+    )
+    parser.add_argument(
+        "cpu_load",
+        type=float,
+        nargs="?",
+        default=0.0,
+        help="Charge initiale, fractionnaire (ex: 2.5 pour 2 CPUs + 50%%)",
+    )
+    parser.add_argument(
+        "--feedback",
+        action="store_true",
+        help="Corrige la charge en continu d'après la consommation mesurée",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Nombre de workers créés au démarrage",
+    )
+    parser.add_argument("--workload", choices=WORKLOADS, default="spin")
+    parser.add_argument("--placement", choices=PLACEMENTS, default="none")
+    parser.add_argument(
+        "--cpus",
+        type=lambda text: sorted(parse_cpulist(text)),
+        default=None,
+        help="CPUs utilisables par les workers (ex: 0-3,8)",
+    )
+    args = parser.parse_args()
 
-    cpu_load = float(sys.argv[1])
-    if cpu_load <= 0:
+    if args.cpu_load < 0:
         print("Error: CPU load must be greater than 0.")
         sys.exit(1)
 
-    full_cpus = int(cpu_load)
-    fractional_cpu = cpu_load - full_cpus
-    stress_cpu(full_cpus, fractional_cpu)
+    pool = CpuWorkerPool(args.workers)
+    pool.retarget(
+        args.cpu_load, args.feedback, args.workload, args.placement, args.cpus
+    )
+
+    commands = queue.Queue()
+    threading.Thread(target=read_commands, args=(commands,), daemon=True).start()
+    pool.run(commands)
@@ -0,0 +1,231 @@
+import argparse
+import itertools
+import json
+import mmap
+import os
+import random
+import signal
+import sys
+import threading
+import time
+
+from stress_common import watch_stdin  # met la racine du dépôt sur sys.path
+from app.managers.histogram import LatencyHistogram
+
+REPORT_INTERVAL = 1.0
+PATTERNS = ("read", "write", "randread", "randwrite", "randrw")
+ALIGNMENT = 4096
+PREFILL_CHUNK = 1024 * 1024
+MB = 1024 * 1024
+# Attente après une erreur d'E/S, doublée à chaque échec consécutif
+ERROR_BACKOFF = 0.001
+MAX_BACKOFF = 1.0
+# Échecs consécutifs après lesquels un thread abandonne
+MAX_CONSECUTIVE_ERRORS = 20
+
+
+class IoThread:
+    """État d'un thread d'E/S : compteurs et histogramme de l'intervalle courant."""
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.errors = 0
+        self.last_error = None
+        self.stopped = False
+        self.histogram = LatencyHistogram()
+        self.lock = threading.Lock()
+
+    def record(self, seconds):
+        with self.lock:
+            self.histogram.record(seconds)
+
+    def swap(self):
+        """Histogramme de l'intervalle écoulé, remplacé par un histogramme vide."""
+        with self.lock:
+            current, self.histogram = self.histogram, LatencyHistogram()
+        return current
+
+
+def prefill(path, size):
+    """Écrit réellement le fichier (pas de trous) puis le sort du page cache."""
+    block = os.urandom(PREFILL_CHUNK)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o600)
+    try:
+        written = 0
+        while written < size:
+            written += os.write(fd, block[: min(PREFILL_CHUNK, size - written)])
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def run_io(state, fd, pattern, block_size, blocks, sequence, fsync, stop):
+    """Boucle d'un thread : une E/S synchrone à la fois (profondeur 1 par thread).
+
+    Le tampon vient de mmap, donc aligné sur la page comme l'exige O_DIRECT.
+    """
+    buffer = mmap.mmap(-1, block_size)
+    buffer.write(os.urandom(block_size))
+    rng = random.Random()
+    sequential = not pattern.startswith("rand")
+    failures = 0
+    while not stop.is_set():
+        block = next(sequence) % blocks if sequential else rng.randrange(blocks)
+        offset = block * block_size
+        if pattern == "randrw":
+            write = rng.random() < 0.5
+        else:
+            write = pattern in ("write", "randwrite")
+        start = time.perf_counter()
+        try:
+            if write:
+                os.pwrite(fd, buffer, offset)
+                if fsync:
+                    os.fdatasync(fd)
+                state.writes += 1
+            else:
+                os.preadv(fd, [buffer], offset)
+                state.reads += 1
+        except OSError as e:
+            state.errors += 1
+            state.last_error = str(e)
+            failures += 1
+            if failures >= MAX_CONSECUTIVE_ERRORS:
+                state.stopped = True
+                return
+            # Erreur persistante (disque plein, support en panne) : pas de boucle serrée
+            stop.wait(min(ERROR_BACKOFF * 2**failures, MAX_BACKOFF))
+            continue
+        failures = 0
+        state.record(time.perf_counter() - start)
+
+
+def report(pattern, block_size, queue_depth, states, totals, interval, elapsed):
+    reads = sum(state.reads for state in states)
+    writes = sum(state.writes for state in states)
+    histogram = LatencyHistogram()
+    for state in states:
+        # Un nouvel histogramme par intervalle, l'ancien s'ajoute au cumul
+        histogram.merge(state.swap())
+    totals["histogram"].merge(histogram)
+
+    read_ops = reads - totals["reads"]
+    write_ops = writes - totals["writes"]
+    totals["reads"], totals["writes"] = reads, writes
+    latency = histogram.to_dict(percentiles=(50, 99, 99.9))
+    return {
+        "pattern": pattern,
+        "block_size_kb": block_size // 1024,
+        "queue_depth": queue_depth,
+        "iops": round((read_ops + write_ops) / interval, 1),
+        "read_iops": round(read_ops / interval, 1),
+        "write_iops": round(write_ops / interval, 1),
+        "mbps": round((read_ops + write_ops) * block_size / interval / MB, 2),
+        "read_mbps": round(read_ops * block_size / interval / MB, 2),
+        "write_mbps": round(write_ops * block_size / interval / MB, 2),
+        "latency": latency,
+        "latency_total": totals["histogram"].to_dict(percentiles=(50, 99, 99.9)),
+        "errors": sum(state.errors for state in states),
+        "last_error": next(
+            (state.last_error for state in states if state.last_error), None
+        ),
+        "stopped_threads": sum(state.stopped for state in states),
+        "total_gb": round((reads + writes) * block_size / 1e9, 3),
+        "elapsed": round(elapsed, 1),
+    }
+
+
+def stress_disk(pattern, block_size, queue_depth, size, path, fsync, direct, duration):
+    file_path = os.path.join(path, f"stressed-disk-{os.getpid()}.dat")
+    stop = threading.Event()
+    # SIGTERM (arrêt par le LoadManager) passe par le finally qui supprime le fichier
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        if pattern in ("read", "randread", "randrw"):
+            prefill(file_path, size)
+        flags = os.O_RDWR | os.O_CREAT
+        if direct:
+            flags |= os.O_DIRECT
+        try:
+            fd = os.open(file_path, flags, 0o600)
+        except OSError as e:
+            print(json.dumps({"error": f"Cannot open {file_path}: {e}"}), flush=True)
+            sys.exit(1)
+
+        blocks = max(1, size // block_size)
+        sequence = itertools.count()
+        states = [IoThread() for _ in range(queue_depth)]
+        for state in states:
+            threading.Thread(
+                target=run_io,
+                args=(state, fd, pattern, block_size, blocks, sequence, fsync, stop),
+                daemon=True,
+            ).start()
+        watch_stdin(stop)
+
+        totals = {"reads": 0, "writes": 0, "histogram": LatencyHistogram()}
+        started = last = time.monotonic()
+        while not stop.wait(REPORT_INTERVAL):
+            now = time.monotonic()
+            stats = report(
+                pattern,
+                block_size,
+                queue_depth,
+                states,
+                totals,
+                now - last,
+                now - started,
+            )
+            stats.update(file_mb=size // MB, fsync=fsync, direct=direct)
+            print(json.dumps(stats), flush=True)
+            last = now
+            if duration and now - started >= duration:
+                break
+            if all(state.stopped for state in states):
+                sys.exit(1)
+        stop.set()
+    finally:
+        try:
+            os.unlink(file_path)
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Charge d'E/S disque.")
+    parser.add_argument("--pattern", choices=PATTERNS, default="randread")
+    parser.add_argument("--block-size-kb", type=int, default=4)
+    parser.add_argument(
+        "--queue-depth", type=int, default=1, help="E/S en vol simultanées (threads)"
+    )
+    parser.add_argument(
+        "--size-mb", type=int, default=256, help="Taille maximale du fichier de test"
+    )
+    parser.add_argument("--path", default="/tmp", help="Répertoire du fichier de test")
+    parser.add_argument(
+        "--fsync", action="store_true", help="fdatasync après chaque écriture"
+    )
+    parser.add_argument(
+        "--direct", action="store_true", help="O_DIRECT, contourne le page cache"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=0, help="Durée en secondes (0 = infini)"
+    )
+    args = parser.parse_args()
+
+    block_size = args.block_size_kb * 1024
+    if args.direct and block_size % ALIGNMENT:
+        print("Error: O_DIRECT needs a block size multiple of 4 KB.")
+        sys.exit(1)
+    stress_disk(
+        args.pattern,
+        block_size,
+        args.queue_depth,
+        args.size_mb * MB,
+        args.path,
+        args.fsync,
+        args.direct,
+        args.duration,
+    )
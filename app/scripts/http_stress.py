@@ -0,0 +1,277 @@
+import argparse
+import asyncio
+import json
+import random
+import ssl
+import threading
+from urllib.parse import urlsplit
+
+from stress_common import watch_stdin  # met la racine du dépôt sur sys.path
+from app.managers.histogram import LatencyHistogram
+
+REPORT_INTERVAL = 1.0
+ARRIVALS = ("constant", "poisson")
+METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD")
+# Requêtes en attente d'une connexion au-delà desquelles les suivantes sont abandonnées
+MAX_OUTSTANDING = 10000
+PERCENTILES = (50, 99, 99.9)
+
+
+class Connection:
+    """Connexion HTTP/1.1 keep-alive, rouverte après une erreur ou un `close`."""
+
+    def __init__(self, host, port, ssl_context):
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.reader = None
+        self.writer = None
+
+    async def open(self):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl_context
+            )
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+    async def request(self, raw, head):
+        """Envoie une requête pré-encodée et lit toute la réponse, renvoie le statut."""
+        self.writer.write(raw)
+        status_line = await self.reader.readline()
+        parts = status_line.split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith(b"HTTP/"):
+            raise ValueError(f"Invalid status line {status_line[:64]!r}")
+        status = int(parts[1])
+
+        length, chunked, close = None, False, parts[0] == b"HTTP/1.0"
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.partition(b":")
+            name, value = name.strip().lower(), value.strip().lower()
+            if name == b"content-length":
+                length = int(value)
+            elif name == b"transfer-encoding":
+                chunked = b"chunked" in value
+            elif name == b"connection":
+                close = value == b"close"
+
+        if head or status in (204, 304) or 100 <= status < 200:
+            pass
+        elif chunked:
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if not size:
+                    while (await self.reader.readline()) not in (b"\r\n", b""):
+                        pass
+                    break
+                await self.reader.readexactly(size + 2)
+        elif length is not None:
+            await self.reader.readexactly(length)
+        else:
+            await self.reader.read()
+            close = True
+        if close:
+            self.close()
+        return status
+
+
+class Generator:
+    """Générateur en boucle ouverte : les arrivées ne dépendent pas des réponses.
+
+    La latence part de l'instant d'envoi prévu et non de l'envoi effectif, ce
+    qui inclut l'attente d'une connexion libre (correction de l'omission
+    coordonnée). Le temps de service, depuis l'envoi effectif, est suivi à part.
+    """
+
+    def __init__(self, url, method, headers, body, rate, arrival, connections, timeout):
+        parts = urlsplit(url)
+        https = parts.scheme == "https"
+        port = parts.port or (443 if https else 80)
+        context = ssl.create_default_context() if https else None
+        self.pool = asyncio.Queue()
+        for _ in range(connections):
+            self.pool.put_nowait(Connection(parts.hostname, port, context))
+
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        payload = (body or "").encode()
+        lines = [
+            f"{method} {target} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            "User-Agent: stressed-pod",
+            "Accept: */*",
+            *(f"{name}: {value}" for name, value in headers),
+        ]
+        if payload or method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(payload)}")
+        self.raw = ("\r\n".join(lines) + "\r\n\r\n").encode() + payload
+        self.head = method == "HEAD"
+
+        self.rate = rate
+        self.arrival = arrival
+        self.timeout = timeout
+        self.rng = random.Random()
+        self.tasks = set()
+        self.outstanding = 0
+        self.sent = 0
+        self.completed = 0
+        self.dropped = 0
+        self.statuses = {}
+        self.errors = {}
+        self.latency = LatencyHistogram()
+        self.latency_total = LatencyHistogram()
+        self.service_total = LatencyHistogram()
+
+    def _gap(self):
+        if self.arrival == "poisson":
+            return self.rng.expovariate(self.rate)
+        return 1 / self.rate
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while True:
+            now = loop.time()
+            while next_at <= now:
+                if self.outstanding >= MAX_OUTSTANDING:
+                    self.dropped += 1
+                else:
+                    self.outstanding += 1
+                    task = asyncio.create_task(self._request(next_at))
+                    self.tasks.add(task)
+                    task.add_done_callback(self.tasks.discard)
+                next_at += self._gap()
+            await asyncio.sleep(next_at - now)
+
+    async def _request(self, intended):
+        loop = asyncio.get_running_loop()
+        conn = await self.pool.get()
+        started = loop.time()
+        self.sent += 1
+        try:
+            status = await self._send(conn)
+        finally:
+            self.outstanding -= 1
+            self.pool.put_nowait(conn)
+        # Les échecs et les délais dépassés comptent aussi : ce sont eux, la queue
+        finished = loop.time()
+        self.latency.record(finished - intended)
+        self.service_total.record(finished - started)
+        if status is not None:
+            key = f"{status // 100}xx"
+            self.statuses[key] = self.statuses.get(key, 0) + 1
+            self.completed += 1
+
+    async def _send(self, conn):
+        """Envoie la requête sur `conn`, renvoie le statut ou None après une erreur."""
+        try:
+            await asyncio.wait_for(conn.open(), self.timeout)
+        except (OSError, asyncio.TimeoutError):
+            self._error("connect")
+            return None
+        try:
+            return await asyncio.wait_for(
+                conn.request(self.raw, self.head), self.timeout
+            )
+        except asyncio.TimeoutError:
+            conn.close()
+            self._error("timeout")
+        except (OSError, ValueError, asyncio.IncompleteReadError):
+            conn.close()
+            self._error("protocol")
+        return None
+
+    def _error(self, kind):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def report(self):
+        """Histogramme de l'intervalle écoulé, ajouté ensuite au cumul."""
+        latency, self.latency = self.latency, LatencyHistogram()
+        self.latency_total.merge(latency)
+        return latency
+
+
+async def stress_http(url, generator, duration):
+    stop = threading.Event()
+    watch_stdin(stop)
+    loop = asyncio.get_running_loop()
+    task = asyncio.create_task(generator.run())
+
+    started = last = loop.time()
+    previous = {"sent": 0, "completed": 0}
+    while not stop.is_set():
+        await asyncio.sleep(REPORT_INTERVAL)
+        now = loop.time()
+        interval = now - last
+        latency = generator.report()
+        stats = {
+            "url": url,
+            "arrival": generator.arrival,
+            "target_rate": generator.rate,
+            "sent_rate": round((generator.sent - previous["sent"]) / interval, 1),
+            "achieved_rate": round(
+                (generator.completed - previous["completed"]) / interval, 1
+            ),
+            "outstanding": generator.outstanding,
+            "dropped": generator.dropped,
+            "statuses": generator.statuses,
+            "errors": generator.errors,
+            "latency": latency.to_dict(PERCENTILES),
+            "latency_total": generator.latency_total.to_dict(PERCENTILES),
+            "service_latency_total": generator.service_total.to_dict(PERCENTILES),
+            "elapsed": round(now - started, 1),
+        }
+        print(json.dumps(stats), flush=True)
+        previous.update(sent=generator.sent, completed=generator.completed)
+        last = now
+        if duration and now - started >= duration:
+            break
+    task.cancel()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Charge HTTP en boucle ouverte.")
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--method", choices=METHODS, default="GET")
+    parser.add_argument(
+        "--header", action="append", default=[], help="En-tête 'Nom: valeur'"
+    )
+    parser.add_argument("--body", default=None, help="Corps de la requête")
+    parser.add_argument(
+        "--rate", type=float, required=True, help="Requêtes par seconde"
+    )
+    parser.add_argument("--arrival", choices=ARRIVALS, default="constant")
+    parser.add_argument(
+        "--connections", type=int, default=10, help="Taille du pool de connexions"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=10, help="Délai maximal d'une requête"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=0, help="Durée en secondes (0 = infini)"
+    )
+    args = parser.parse_args()
+
+    headers = [tuple(h.strip() for h in header.split(":", 1)) for header in args.header]
+
+    async def main():
+        generator = Generator(
+            args.url,
+            args.method,
+            headers,
+            args.body,
+            args.rate,
+            args.arrival,
+            args.connections,
+            args.timeout,
+        )
+        await stress_http(args.url, generator, args.duration)
+
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""Micro-benchmark de l'encodage des logs, en lignes par seconde et par cœur.
+
+Usage : python -m app.scripts.log_encoder_bench --lines 200000 --batch 100
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from app.managers.log_encoder import LogEncoder
+from app.managers.log_manager import JsonFormatter, PlainTextFormatter
+from app.models.schemas import LogFormat
+
+MESSAGE = "Synthetic log line for benchmarking"
+SERVICE = "bench"
+
+
+class LegacyJsonFormatter(logging.Formatter):
+    """Formateur JSON d'origine : dict, json.dumps et formatTime par ligne."""
+
+    def format(self, record):
+        return json.dumps(
+            {
+                "timestamp": self.formatTime(record),
+                "level": record.levelname,
+                "service": getattr(record, "service", "-"),
+                "message": record.getMessage(),
+            }
+        )
+
+
+class LegacyPlainTextFormatter(logging.Formatter):
+    """Formateur texte d'origine."""
+
+    def format(self, record):
+        return f"{self.formatTime(record)} | {record.levelname} | {getattr(record, 'service', '-')} | {record.getMessage()}"
+
+
+def make_record():
+    record = logging.LogRecord("bench", logging.INFO, "", 0, MESSAGE, None, None)
+    record.service = SERVICE
+    return record
+
+
+def records_path(formatter, lines):
+    """Chemin d'origine : un LogRecord puis un format par ligne."""
+    for _ in range(lines):
+        formatter.format(make_record()) + "\n"
+
+
+def encoder_path(encoder, lines, batch):
+    """Chemin rapide : gabarit précompilé, horodatage en cache, lot répété."""
+    for _ in range(lines // batch):
+        encoder.encode("INFO", SERVICE, MESSAGE, batch)
+
+
+def measure(fn, lines):
+    """Lignes par seconde de temps CPU du processus (donc par cœur)."""
+    start = time.process_time()
+    fn()
+    elapsed = time.process_time() - start
+    return round(lines / elapsed) if elapsed else None
+
+
+def run(lines, batch):
+    results = []
+    for format_type, legacy, current in (
+        (LogFormat.JSON, LegacyJsonFormatter(), JsonFormatter()),
+        (LogFormat.PLAINTEXT, LegacyPlainTextFormatter(), PlainTextFormatter()),
+    ):
+        encoder = LogEncoder(format_type)
+        before = measure(lambda: records_path(legacy, lines), lines)
+        after = {
+            "formatter": measure(lambda: records_path(current, lines), lines),
+            "encoder": measure(lambda: encoder_path(encoder, lines, 1), lines),
+            f"encoder_batch_{batch}": measure(
+                lambda: encoder_path(encoder, lines, batch), lines
+            ),
+        }
+        results.append(
+            {
+                "format": format_type.value,
+                "before": before,
+                **after,
+                "speedup": {
+                    name: round(value / before, 1) for name, value in after.items()
+                },
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de l'encodeur de logs")
+    parser.add_argument("--lines", type=int, default=200000)
+    parser.add_argument(
+        "--batch", type=int, default=100, help="Lignes par lot (comme un flood)"
+    )
+    args = parser.parse_args()
+    for result in run(args.lines, max(1, args.batch)):
+        print(json.dumps(result))
@@ -1,23 +1,219 @@
+import argparse
+import gc
+import json
+import mmap
+import queue
 import sys
+import threading
 import time
-import gc
 
+import psutil
 
-def allocate_memory(mb):
-    gc.disable()
-    block = " " * (mb * 1024 * 1024)
-    if not block:
-        pass
-    try:
+MB = 1024 * 1024
+CHUNK_MB = 2
+HUGEPAGE_CHUNK_MB = 32
+# Pré-remplit les pages en une fois plutôt qu'à chaque défaut de page
+POPULATE = getattr(mmap, "MAP_POPULATE", 0)
+REPORT_INTERVAL = 1.0
+DIRTY_TICK = 0.1
+
+RESERVE = "reserve"
+TOUCH = "touch"
+DIRTY = "dirty"
+THP = "thp"
+MODES = (RESERVE, TOUCH, DIRTY, THP)
+
+
+class MemoryHolder:
+    """Mémoire détenue sous forme de blocs mmap anonymes de taille fixe.
+
+    Un changement de cible n'alloue ou ne libère que la différence : les
+    blocs existants restent en place, la RSS ne redescend jamais pendant une
+    rampe montante.
+
+    Modes de résidence :
+    - reserve : mémoire réservée (committed) mais jamais touchée
+    - touch : chaque page est écrite une fois à l'allocation
+    - dirty : pages touchées puis réécrites en continu à dirty_rate MB/s
+    - thp : blocs de 32 MB marqués MADV_HUGEPAGE puis touchés
+    """
+
+    def __init__(self, chunk_mb=CHUNK_MB):
+        self.default_chunk_size = chunk_mb * MB
+        self.fills = (
+            memoryview(b"\xa5" * MB),
+            memoryview(b"\x5a" * MB),
+        )
+        self.chunks = []
+        self.allocated = 0
+        self.target_mb = 0
+        self.mode = TOUCH
+        self.dirty_rate = 0.0
+        self.dirtied = 0
+        self.thp_supported = hasattr(mmap, "MADV_HUGEPAGE")
+        self._cursor = (0, 0)
+        self._pass = 0
+        self._lock = threading.Lock()
+        self._process = psutil.Process()
+
+    @property
+    def chunk_size(self):
+        if self.mode == THP:
+            return max(self.default_chunk_size, HUGEPAGE_CHUNK_MB * MB)
+        return self.default_chunk_size
+
+    def configure(self, mb, mode=TOUCH, dirty_rate=0.0):
+        """Applique une cible ; un changement de mode réalloue les blocs."""
+        if mode not in MODES:
+            raise ValueError(f"Unknown memory mode: {mode}")
+        with self._lock:
+            if mode != self.mode:
+                self._resize(0)
+                self.mode = mode
+            self.dirty_rate = dirty_rate if mode == DIRTY else 0.0
+            self._resize(mb)
+
+    def resize(self, mb):
+        """Ajuste la mémoire détenue au nombre de MB demandé."""
+        with self._lock:
+            self._resize(mb)
+
+    def _resize(self, mb):
+        target = mb * MB
+        while self.allocated > target:
+            chunk = self.chunks.pop()
+            self.allocated -= len(chunk)
+            chunk.close()
+        while self.allocated < target:
+            size = min(self.chunk_size, target - self.allocated)
+            self.chunks.append(self._allocate(size))
+            self.allocated += size
+        self.target_mb = mb
+        self._cursor = (0, 0)
+
+    def _allocate(self, size):
+        flags = mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS
+        if self.mode in (TOUCH, DIRTY):
+            flags |= POPULATE
+        chunk = mmap.mmap(-1, size, flags=flags)
+        if self.mode == THP and self.thp_supported:
+            chunk.madvise(mmap.MADV_HUGEPAGE)
+        if self.mode != RESERVE:
+            self._write(chunk, 0, size)
+        return chunk
+
+    def _write(self, chunk, offset, length):
+        fill = self.fills[self._pass % 2]
+        end = offset + length
+        while offset < end:
+            stop = min(offset + len(fill), end)
+            chunk[offset:stop] = fill[: stop - offset]
+            offset = stop
+
+    def dirty(self, budget):
+        """Réécrit `budget` octets en parcourant les blocs en boucle."""
+        with self._lock:
+            index, offset = self._cursor
+            while budget > 0 and self.chunks:
+                if index >= len(self.chunks):
+                    index, offset = 0, 0
+                    self._pass += 1
+                chunk = self.chunks[index]
+                length = min(budget, len(chunk) - offset)
+                self._write(chunk, offset, length)
+                self.dirtied += length
+                budget -= length
+                offset += length
+                if offset >= len(chunk):
+                    index, offset = index + 1, 0
+            self._cursor = (index, offset)
+
+    def run_dirtier(self):
+        """Thread de réécriture continue au débit configuré."""
+        next_tick = time.monotonic()
         while True:
-            time.sleep(10)
-    except KeyboardInterrupt:
-        print("Memory stress process terminated.")
+            next_tick += DIRTY_TICK
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+            if self.dirty_rate > 0:
+                self.dirty(int(self.dirty_rate * MB * DIRTY_TICK))
+
+    def _hugepages_mb(self):
+        try:
+            with open("/proc/self/smaps_rollup") as f:
+                for line in f:
+                    if line.startswith("AnonHugePages:"):
+                        return int(line.split()[1]) // 1024
+        except OSError:
+            pass
+        return None
+
+    def status(self):
+        return {
+            "target_mb": self.target_mb,
+            "allocated_mb": self.allocated // MB,
+            "chunks": len(self.chunks),
+            "rss_mb": self._process.memory_info().rss // MB,
+            "mode": self.mode,
+            "dirty_rate": self.dirty_rate,
+            "dirtied_mb": self.dirtied // MB,
+            "hugepages_mb": self._hugepages_mb(),
+        }
+
+    def run(self, commands):
+        """Boucle principale : applique les commandes et publie l'état."""
+        threading.Thread(target=self.run_dirtier, daemon=True).start()
+        next_report = time.monotonic()
+        while True:
+            try:
+                command = commands.get(timeout=max(0.0, next_report - time.monotonic()))
+                if command is None:
+                    return
+                self.configure(
+                    int(command.get("mb", 0)),
+                    command.get("mode", TOUCH),
+                    float(command.get("dirty_rate", 0)),
+                )
+                next_report = time.monotonic()
+            except queue.Empty:
+                pass
+            except ValueError as e:
+                print(f"Invalid command: {e}", file=sys.stderr)
+            if time.monotonic() >= next_report:
+                print(json.dumps(self.status()), flush=True)
+                next_report = time.monotonic() + REPORT_INTERVAL
+
+
+def read_commands(commands):
+    """Lit les commandes JSON sur stdin ; EOF arrête le processus."""
+    for line in sys.stdin:
+        try:
+            commands.put(json.loads(line))
+        except ValueError:
+            print(f"Invalid command: {line.strip()}", file=sys.stderr)
+    commands.put(None)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python memory_stress.py <memory_in_mb>")
-        sys.exit(1)
-    memory_in_mb = int(sys.argv[1])
-    allocate_memory(memory_in_mb)
+    parser = argparse.ArgumentParser(
+        description="Charge mémoire pilotée par des commandes JSON sur stdin "
+        '(ex: {"mb": 256, "mode": "dirty", "dirty_rate": 100}).'
+    )
+    parser.add_argument(
+        "memory_in_mb", type=int, nargs="?", default=0, help="Mémoire initiale"
+    )
+    parser.add_argument(
+        "--chunk-mb", type=int, default=CHUNK_MB, help="Taille d'un bloc en MB"
+    )
+    parser.add_argument("--mode", choices=MODES, default=TOUCH)
+    parser.add_argument(
+        "--dirty-rate", type=float, default=0.0, help="MB/s réécrits en mode dirty"
+    )
+    args = parser.parse_args()
+
+    gc.disable()
+    holder = MemoryHolder(args.chunk_mb)
+    holder.configure(args.memory_in_mb, args.mode, args.dirty_rate)
+
+    commands = queue.Queue()
+    threading.Thread(target=read_commands, args=(commands,), daemon=True).start()
+    holder.run(commands)
@@ -0,0 +1,289 @@
+import argparse
+import json
+import socket
+import sys
+import threading
+import time
+
+from stress_common import watch_stdin
+
+REPORT_INTERVAL = 1.0
+PROTOCOLS = ("tcp", "udp")
+MODES = ("loopback", "send", "receive")
+MAX_DATAGRAM = 65507
+RECV_BUFFER = 256 * 1024
+SOCKET_BUFFER = 4 * 1024 * 1024
+RECONNECT_DELAY = 1.0
+
+
+class Counter:
+    """Octets et messages comptés par un thread, lus par le rapporteur."""
+
+    def __init__(self):
+        self.bytes = 0
+        self.messages = 0
+        self.errors = 0
+
+
+def pace(next_send, interval):
+    """Attend l'instant d'envoi suivant pour tenir le débit cible.
+
+    Un retard de plus d'une seconde est abandonné plutôt que rattrapé en rafale.
+    """
+    now = time.monotonic()
+    if next_send > now:
+        time.sleep(next_send - now)
+    elif now - next_send > 1.0:
+        next_send = now
+    return next_send + interval
+
+
+def send_tcp(counter, address, payload, interval, stop):
+    """Une connexion TCP qui envoie des messages en boucle, reconnectée en cas d'erreur."""
+    while not stop.is_set():
+        try:
+            sock = socket.create_connection(address, timeout=5)
+        except OSError:
+            counter.errors += 1
+            stop.wait(RECONNECT_DELAY)
+            continue
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        next_send = time.monotonic()
+        try:
+            while not stop.is_set():
+                if interval:
+                    next_send = pace(next_send, interval)
+                sock.sendall(payload)
+                counter.bytes += len(payload)
+                counter.messages += 1
+        except OSError:
+            counter.errors += 1
+            stop.wait(RECONNECT_DELAY)
+        finally:
+            sock.close()
+
+
+def send_udp(counter, address, payload, interval, stop):
+    """Un socket UDP qui envoie un datagramme par message."""
+    # Adresse numérique : seule une adresse IPv6 contient des ':'
+    family = socket.AF_INET6 if ":" in address[0] else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER)
+    next_send = time.monotonic()
+    while not stop.is_set():
+        if interval:
+            next_send = pace(next_send, interval)
+        try:
+            sock.sendto(payload, address)
+        except OSError:
+            # ENOBUFS ou ECONNREFUSED : le datagramme est perdu côté émetteur
+            counter.errors += 1
+            continue
+        counter.bytes += len(payload)
+        counter.messages += 1
+
+
+def receive_tcp_connection(counter, conn, message_size):
+    buffer = bytearray(RECV_BUFFER)
+    pending = 0
+    with conn:
+        while True:
+            try:
+                received = conn.recv_into(buffer)
+            except OSError:
+                counter.errors += 1
+                return
+            if not received:
+                return
+            counter.bytes += received
+            # Flux TCP : les messages sont comptés à partir de la taille attendue
+            pending += received
+            counter.messages += pending // message_size
+            pending %= message_size
+
+
+def receive_tcp(counters, server, message_size):
+    """Accepte les connexions entrantes, un thread et un compteur par connexion."""
+    while True:
+        conn, _ = server.accept()
+        counter = Counter()
+        counters.append(counter)
+        threading.Thread(
+            target=receive_tcp_connection,
+            args=(counter, conn, message_size),
+            daemon=True,
+        ).start()
+
+
+def receive_udp(counter, server):
+    buffer = bytearray(MAX_DATAGRAM)
+    while True:
+        received = server.recv_into(buffer)
+        counter.bytes += received
+        counter.messages += 1
+
+
+def listen(protocol, host, port, connections):
+    """Socket du récepteur, sur un port éphémère si `port` vaut 0.
+
+    `host` vide écoute sur toutes les adresses, IPv6 et IPv4 quand la pile le
+    permet.
+    """
+    dualstack = not host and socket.has_dualstack_ipv6()
+    family = socket.AF_INET6 if dualstack else socket.AF_INET
+    if protocol == "tcp":
+        server = socket.socket(family, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    else:
+        server = socket.socket(family, socket.SOCK_DGRAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER)
+    if dualstack:
+        server.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+    server.bind((host, port))
+    if protocol == "tcp":
+        server.listen(max(connections, 16))
+    return server
+
+
+def resolve(protocol, host, port):
+    """Adresse numérique du pair, IPv4 ou IPv6, résolue une seule fois."""
+    kind = socket.SOCK_STREAM if protocol == "tcp" else socket.SOCK_DGRAM
+    try:
+        infos = socket.getaddrinfo(host, port, type=kind)
+    except OSError as e:
+        print(json.dumps({"error": f"Cannot resolve {host}: {e}"}), flush=True)
+        sys.exit(1)
+    return infos[0][4][:2]
+
+
+def start_receiver(protocol, server, message_size):
+    """Compteurs du récepteur, sommés par le rapporteur."""
+    if protocol == "tcp":
+        counters = []
+        target, args = receive_tcp, (counters, server, message_size)
+    else:
+        counters = [Counter()]
+        target, args = receive_udp, (counters[0], server)
+    threading.Thread(target=target, args=args, daemon=True).start()
+    return counters
+
+
+def start_senders(protocol, address, message_size, connections, rate_mbps, stop):
+    payload = b"\x00" * message_size
+    # Débit cible partagé entre les connexions, 0 = aussi vite que possible
+    interval = message_size * 8 * connections / (rate_mbps * 1e6) if rate_mbps else 0
+    target = send_tcp if protocol == "tcp" else send_udp
+    counters = []
+    for _ in range(connections):
+        counter = Counter()
+        threading.Thread(
+            target=target,
+            args=(counter, address, payload, interval, stop),
+            daemon=True,
+        ).start()
+        counters.append(counter)
+    return counters
+
+
+def rates(counters, previous, interval):
+    total_bytes = sum(counter.bytes for counter in counters)
+    total_messages = sum(counter.messages for counter in counters)
+    moved = total_bytes - previous["bytes"]
+    messages = total_messages - previous["messages"]
+    previous.update(bytes=total_bytes, messages=total_messages)
+    return {
+        "gbps": round(moved * 8 / interval / 1e9, 3),
+        "pps": round(messages / interval, 1),
+        "total_gb": round(total_bytes / 1e9, 3),
+        "errors": sum(counter.errors for counter in counters),
+    }
+
+
+def stress_network(
+    protocol, mode, host, port, message_size, connections, rate_mbps, duration
+):
+    stop = threading.Event()
+    senders, receivers = [], None
+    if mode != "send":
+        bind_host, bind_port = ("127.0.0.1", 0) if mode == "loopback" else ("", port)
+        try:
+            server = listen(protocol, bind_host, bind_port, connections)
+        except OSError as e:
+            print(
+                json.dumps({"error": f"Cannot listen on port {bind_port}: {e}"}),
+                flush=True,
+            )
+            sys.exit(1)
+        receivers = start_receiver(protocol, server, message_size)
+        address = server.getsockname()[:2]
+    else:
+        address = resolve(protocol, host, port)
+    if mode != "receive":
+        senders = start_senders(
+            protocol, address, message_size, connections, rate_mbps, stop
+        )
+    watch_stdin(stop)
+
+    sent = {"bytes": 0, "messages": 0}
+    received = {"bytes": 0, "messages": 0}
+    started = last = time.monotonic()
+    while not stop.wait(REPORT_INTERVAL):
+        now = time.monotonic()
+        stats = {
+            "protocol": protocol,
+            "mode": mode,
+            "message_size": message_size,
+            "connections": connections,
+            "target_mbps": rate_mbps or None,
+        }
+        if senders:
+            stats["sent"] = rates(senders, sent, now - last)
+        if receivers is not None:
+            stats["received"] = rates(receivers, received, now - last)
+        if protocol == "udp" and senders and receivers and sent["messages"]:
+            # Pertes en boucle locale, datagrammes émis jamais reçus
+            lost = max(0, sent["messages"] - received["messages"])
+            stats["loss_ratio"] = round(lost / sent["messages"], 4)
+        stats["elapsed"] = round(now - started, 1)
+        print(json.dumps(stats), flush=True)
+        last = now
+        if duration and now - started >= duration:
+            break
+    stop.set()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Charge réseau TCP ou UDP.")
+    parser.add_argument("--protocol", choices=PROTOCOLS, default="tcp")
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        default="loopback",
+        help="loopback : émetteur et récepteur locaux, send : vers un pair, "
+        "receive : récepteur seul pour un pair",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Hôte du pair (send)")
+    parser.add_argument("--port", type=int, default=5201, help="Port du pair")
+    parser.add_argument("--message-size", type=int, default=64 * 1024)
+    parser.add_argument("--connections", type=int, default=1)
+    parser.add_argument(
+        "--rate-mbps", type=float, default=0, help="Débit cible total (0 = maximum)"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=0, help="Durée en secondes (0 = infini)"
+    )
+    args = parser.parse_args()
+
+    if args.protocol == "udp" and args.message_size > MAX_DATAGRAM:
+        print(f"Error: UDP messages cannot exceed {MAX_DATAGRAM} bytes.")
+        sys.exit(1)
+    stress_network(
+        args.protocol,
+        args.mode,
+        args.host,
+        args.port,
+        args.message_size,
+        args.connections,
+        args.rate_mbps,
+        args.duration,
+    )
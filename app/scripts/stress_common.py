@@ -0,0 +1,28 @@
+"""Outils partagés par les scripts de charge.
+
+Les scripts sont lancés hors paquet (`python app/scripts/<script>.py`) : leur
+dossier est sur sys.path, ce module y ajoute la racine du dépôt pour donner
+accès à app.managers. Il doit donc être importé avant app.
+"""
+
+import os
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def _read_until_eof(stop):
+    for _ in sys.stdin:
+        pass
+    stop.set()
+
+
+def watch_stdin(stop):
+    """EOF sur stdin (processus parent disparu) arrête la charge.
+
+    La lecture se fait dans un thread démon, `stop` est levé à l'EOF.
+    """
+    threading.Thread(target=_read_until_eof, args=(stop,), daemon=True).start()
@@ -31,7 +31,7 @@ def kill_stress_processes():
         try:
             if proc.info["cmdline"] and "python" in proc.info["cmdline"][0]:
                 cmdline = " ".join(proc.info["cmdline"])
-                if "cpu_stress.py" in cmdline or "memory_stress.py" in cmdline:
+                if "app/scripts/" in cmdline and "_stress.py" in cmdline:
                     print(f"Killing process {proc.info['pid']}: {cmdline}")
                     os.kill(proc.info["pid"], signal.SIGTERM)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
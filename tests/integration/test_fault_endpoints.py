@@ -0,0 +1,65 @@
+import time
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.routers.faults import fault_manager
+
+
+class TestFaultEndpoints:
+    """Integration tests for fault injection endpoints"""
+
+    @pytest.fixture
+    def client(self):
+        yield TestClient(app)
+        fault_manager.clear()
+
+    def test_error_injection(self, client):
+        """Test a rule answers matching requests with its status code"""
+        response = client.post(
+            "/faults",
+            json={"route": "/probes/*", "error_rate": 1, "status_code": 503},
+        )
+        assert response.status_code == 200
+
+        response = client.get("/probes/readiness")
+        assert response.status_code == 503
+        assert response.headers["x-injected-fault"] == "error"
+        assert client.get("/load/capacity").status_code == 200
+
+        rules = client.get("/faults").json()["rules"]
+        assert rules[0]["route"] == "/probes/*"
+        assert rules[0]["stats"]["errors"] == 1
+
+        response = client.delete("/faults", params={"route": "/probes/*"})
+        assert response.status_code == 200
+        assert client.get("/probes/readiness").status_code == 200
+
+    def test_latency_injection(self, client):
+        """Test a rule delays matching requests"""
+        client.post(
+            "/faults",
+            json={"route": "/probes/liveness", "methods": ["GET"], "latency_ms": 200},
+        )
+        start = time.perf_counter()
+        assert client.get("/probes/liveness").status_code == 200
+        assert time.perf_counter() - start >= 0.2
+
+        metrics = client.get("/metrics").text
+        assert 'stressed_fault_requests_total{route="/probes/liveness"} 1' in metrics
+
+    def test_invalid_rules(self, client):
+        """Test invalid fault rules"""
+        response = client.post("/faults", json={"route": "probes"})
+        assert response.status_code == 422
+
+        response = client.post("/faults", json={"route": "/", "status_code": 200})
+        assert response.status_code == 422
+
+        response = client.post("/faults", json={"route": "/faults/*"})
+        assert response.status_code == 400
+
+        response = client.delete("/faults", params={"route": "/missing"})
+        assert response.status_code == 404
+
+        assert client.delete("/faults").status_code == 200
+        assert client.get("/faults").json() == {"rules": []}
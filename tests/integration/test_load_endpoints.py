@@ -1,8 +1,61 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 
 
+class OkHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 target answering 200 to every request"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def wait_for_report(client, name, timeout=5):
+    """Wait for the first report of a worker load"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = client.get(f"/load/{name}").json()
+        if "elapsed" in status:
+            return status
+        time.sleep(0.05)
+    raise AssertionError(f"The {name} worker never reported: {status}")
+
+
+def check_worker_load(client, name, start, invalid, rejected) -> dict:
+    """Start, inspect and stop a worker load through its endpoints
+
+    `invalid` fails the request schema (422), `rejected` the load manager
+    checks (400). Returns the first report of the worker.
+    """
+    response = client.post(f"/load/{name}/start", json=start)
+    assert response.status_code == 200
+
+    response = client.get(f"/load/{name}")
+    assert response.status_code == 200
+    assert response.json()["active"] is True
+    assert client.get("/load").json()[f"{name}_active"] is True
+    report = wait_for_report(client, name)
+
+    assert client.post(f"/load/{name}/start", json=invalid).status_code == 422
+    assert client.post(f"/load/{name}/start", json=rejected).status_code == 400
+
+    response = client.post(f"/load/{name}/stop")
+    assert response.status_code == 200
+    assert client.get(f"/load/{name}").json() == {"active": False}
+    return report
+
+
 class TestLoadEndpoints:
     """Integration tests for load endpoints"""
 
@@ -16,12 +69,149 @@ class TestLoadEndpoints:
         response = client.post("/load/cpu/start", json={"value": 1})
         assert response.status_code == 200
 
+        # Test workload selection and CPU pool status
+        response = client.post(
+            "/load/cpu/start", json={"value": 0.5, "workload": "zlib"}
+        )
+        assert response.status_code == 200
+        response = client.get("/load/cpu")
+        assert response.status_code == 200
+        assert response.json()["active"] is True
+
+        response = client.post(
+            "/load/cpu/start", json={"value": 0.5, "workload": "sleep"}
+        )
+        assert response.status_code == 422
+
+        # Test placement policy and CPU set validation
+        response = client.post(
+            "/load/cpu/start", json={"value": 0.5, "placement": "spread"}
+        )
+        assert response.status_code == 200
+        response = client.post("/load/cpu/start", json={"value": 0.5, "cpus": [4096]})
+        assert response.status_code == 400
+
     def test_memory_load_endpoints(self, client):
         """Test memory load endpoints"""
         # Test start memory load
         response = client.post("/load/memory/start", json={"value": 50})
         assert response.status_code == 200
 
+    def test_memory_load_modes(self, client):
+        """Test memory load endpoint residency modes"""
+        response = client.post(
+            "/load/memory/start",
+            json={"value": 50, "mode": "dirty", "dirty_rate": 10},
+        )
+        assert response.status_code == 200
+
+        response = client.post(
+            "/load/memory/start", json={"value": 50, "mode": "dirty"}
+        )
+        assert response.status_code == 400
+
+        response = client.post("/load/memory/start", json={"value": 50, "mode": "swap"})
+        assert response.status_code == 422
+
+    def test_bandwidth_load_endpoints(self, client):
+        """Test bandwidth load endpoints"""
+        response = client.post(
+            "/load/bandwidth/start",
+            json={"workers": 1, "level": "l1", "pattern": "read", "duration": 5},
+        )
+        assert response.status_code == 200
+
+        response = client.get("/load/bandwidth")
+        assert response.status_code == 200
+        assert response.json()["active"] is True
+        assert client.get("/load").json()["bandwidth_active"] is True
+
+        response = client.post("/load/bandwidth/start", json={"level": "l4"})
+        assert response.status_code == 422
+
+        response = client.post("/load/bandwidth/stop")
+        assert response.status_code == 200
+        assert client.get("/load/bandwidth").json() == {"active": False}
+
+    def test_disk_load_endpoints(self, client, tmp_path):
+        """Test disk load endpoints"""
+        report = check_worker_load(
+            client,
+            "disk",
+            {
+                "pattern": "randwrite",
+                "size_mb": 4,
+                "path": str(tmp_path),
+                "fsync": True,
+                "duration": 5,
+            },
+            invalid={"pattern": "trim"},
+            rejected={"queue_depth": 1000},
+        )
+        assert report["fsync"] is True
+        assert report["direct"] is False
+        assert report["write_iops"] > 0
+        assert report["read_iops"] == 0
+        assert report["errors"] == 0
+        assert report["latency"]["p50_ms"] > 0
+
+    def test_network_load_endpoints(self, client):
+        """Test network load endpoints"""
+        report = check_worker_load(
+            client,
+            "network",
+            {
+                "protocol": "udp",
+                "message_size": 1000,
+                "rate_mbps": 50,
+                "duration": 5,
+            },
+            invalid={"protocol": "sctp"},
+            rejected={"mode": "send"},
+        )
+        assert report["protocol"] == "udp"
+        assert report["sent"]["pps"] > 0
+        assert report["received"]["pps"] > 0
+        assert 0 <= report["loss_ratio"] <= 1
+
+    def test_http_load_endpoints(self, client):
+        """Test HTTP load endpoints"""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            report = check_worker_load(
+                client,
+                "http",
+                {
+                    "url": f"http://127.0.0.1:{server.server_address[1]}/",
+                    "rate": 50,
+                    "duration": 5,
+                },
+                invalid={"url": "/", "rate": 0},
+                rejected={"url": "x", "rate": 1},
+            )
+        finally:
+            server.shutdown()
+        assert report["statuses"]["2xx"] > 0
+        assert report["errors"] == {}
+        assert report["achieved_rate"] > 0
+        assert report["latency"]["p50_ms"] is not None
+        assert report["latency"]["count"] == report["statuses"]["2xx"]
+
+    def test_churn_load_endpoints(self, client):
+        """Test connection churn load endpoints"""
+        report = check_worker_load(
+            client,
+            "churn",
+            {"rate": 50, "linger_zero": True, "duration": 5},
+            invalid={"rate": 10, "port": 0},
+            rejected={"rate": 10, "host": "x"},
+        )
+        assert report["local_listener"] is True
+        assert report["conn_per_s"] > 0
+        assert report["failures"] == {}
+        assert report["connect_latency"]["p50_ms"] is not None
+
     def test_dynamic_load_endpoints(self, client):
         """Test dynamic load endpoints"""
         # Test dynamic CPU load
@@ -65,6 +255,64 @@ class TestLoadEndpoints:
         response = client.post("/load/memory/stop")
         assert response.status_code == 200
 
+    def test_dynamic_load_shapes(self, client):
+        """Test dynamic load endpoints with ramp shapes"""
+        response = client.post(
+            "/load/cpu/dynamic",
+            json={
+                "start_value": 0.5,
+                "end_value": 0.1,
+                "duration": 5,
+                "shape": "sine",
+                "resolution": 0.1,
+                "stop_at_end": True,
+            },
+        )
+        assert response.status_code == 200
+        assert response.json()["shape"] == "sine"
+
+        response = client.post(
+            "/load/memory/dynamic",
+            json={"start_value": 50, "end_value": 100, "shape": "triangle"},
+        )
+        assert response.status_code == 422
+
+        response = client.post("/load/cpu/stop")
+        assert response.status_code == 200
+
+    def test_capacity_and_percent_units(self, client):
+        """Test container capacity and percent-of-limit load targets"""
+        response = client.get("/load/capacity")
+        assert response.status_code == 200
+        capacity = response.json()
+        assert capacity["cpus"] > 0
+        assert capacity["memory_mb"] > 0
+
+        response = client.post(
+            "/load/memory/start", json={"value": 1, "unit": "percent_limit"}
+        )
+        assert response.status_code == 200
+        assert f"{capacity['memory_mb'] // 100} MB" in response.json()["message"]
+
+        response = client.post(
+            "/load/cpu/start", json={"value": 120, "unit": "percent_limit"}
+        )
+        assert response.status_code == 400
+
+        response = client.post("/load/memory/stop")
+        assert response.status_code == 200
+
+    def test_load_history(self, client):
+        """Test measured load and sample history"""
+        response = client.get("/load/history")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["interval"] > 0
+        assert all("cpu_measured" in sample for sample in data["samples"])
+
+        response = client.get("/load/history", params={"seconds": 0})
+        assert response.status_code == 400
+
     def test_get_current_load(self, client):
         """Test get current load endpoint"""
         response = client.get("/load")
@@ -77,5 +325,7 @@ class TestLoadEndpoints:
                 "memory_requested",
                 "cpu_active",
                 "memory_active",
+                "cpu_measured",
+                "memory_measured",
             ]
         )
@@ -1,3 +1,5 @@
+import os
+import uuid
 from fastapi.testclient import TestClient
 from app.main import app
 
@@ -80,3 +82,138 @@ def test_create_log_with_interval_and_duration():
     assert data["message"] == "Recurring log creation started"
     assert data["interval"] == 5
     assert data["duration"] == 15
+
+
+def test_create_log_flood():
+    response = client.post(
+        "/log/",
+        json={"message": "Flood", "level": "info", "rate": 500, "duration": 1},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["message"] == "Log flood started"
+
+    response = client.get("/log/floods")
+    assert response.status_code == 200
+    assert any(flood["id"] == data["id"] for flood in response.json())
+
+
+def test_create_log_flood_invalid():
+    response = client.post(
+        "/log/", json={"message": "Flood", "level": "info", "rate": 500}
+    )
+    assert response.status_code == 400
+
+
+def test_get_log_queue():
+    response = client.get("/log/queue")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["policy"] == "block"
+    assert data["queued"] >= 0
+    assert data["dropped"] >= 0
+
+
+def test_create_log_with_payload():
+    response = client.post(
+        "/log/",
+        json={
+            "message": "Payload",
+            "level": "info",
+            "payload": {"distribution": "uniform", "min_size": 10, "max_size": 100},
+        },
+    )
+    assert response.status_code == 200
+
+    response = client.post(
+        "/log/",
+        json={"message": "Payload", "level": "info", "payload": {"size": 10**6}},
+    )
+    assert response.status_code == 422
+
+
+def test_log_streams():
+    response = client.post(
+        "/log/streams", json={"name": "orders", "format": "plaintext"}
+    )
+    assert response.status_code == 200
+    assert response.json()["format"] == "plaintext"
+
+    response = client.post("/log/streams", json={"name": "orders"})
+    assert response.status_code == 400
+
+    response = client.post(
+        "/log/", json={"message": "Order", "level": "info", "stream": "orders"}
+    )
+    assert response.status_code == 200
+    assert "| INFO | - | Order" in response.json()
+
+    response = client.get("/log/streams")
+    names = [stream["name"] for stream in response.json()]
+    assert {"json", "plaintext", "orders"} <= set(names)
+
+    response = client.delete("/log/streams/orders")
+    assert response.status_code == 200
+    response = client.post(
+        "/log/", json={"message": "Order", "level": "info", "stream": "orders"}
+    )
+    assert response.status_code == 404
+    assert client.delete("/log/streams/json").status_code == 400
+
+
+def test_log_jobs():
+    with TestClient(app) as local_client:
+        response = local_client.post(
+            "/log/",
+            json={"message": "Job", "level": "info", "interval": 1, "duration": 30},
+        )
+        job_id = response.json()["id"]
+
+        response = local_client.get("/log/jobs", params={"active": True})
+        assert any(job["id"] == job_id for job in response.json())
+
+        response = local_client.get(f"/log/jobs/{job_id}")
+        assert response.status_code == 200
+        assert response.json()["kind"] == "recurring"
+
+        response = local_client.delete(f"/log/jobs/{job_id}")
+        assert response.status_code == 200
+        assert response.json()["cancelled"] is True
+        assert local_client.delete(f"/log/jobs/{job_id}").status_code == 400
+        assert local_client.get("/log/jobs/missing").status_code == 404
+        assert local_client.delete("/log/jobs").status_code == 200
+
+
+def test_log_file_sink():
+    from app.routers.log_router import log_manager
+
+    name = f"sink-test-{uuid.uuid4().hex[:6]}.log"
+    response = client.post(
+        "/log/",
+        json={
+            "message": "To file",
+            "level": "info",
+            "sink": {"type": "file", "path": name},
+        },
+    )
+    assert response.status_code == 200
+
+    sink = log_manager.sinks[f"file:{log_manager.file_dir}/{name}"]
+    assert sink.flush()
+    with open(os.path.join(log_manager.file_dir, name)) as f:
+        assert '"message": "To file"' in f.read()
+
+    response = client.get("/log/sinks")
+    stats = {sink["sink"]: sink for sink in response.json()}
+    assert stats[f"file:{log_manager.file_dir}/{name}"]["written"] == 1
+    assert "p99_ms" in stats["stderr"]["write_latency"]
+
+    response = client.post(
+        "/log/",
+        json={
+            "message": "Escape",
+            "level": "info",
+            "sink": {"type": "file", "path": "../x"},
+        },
+    )
+    assert response.status_code == 400
@@ -0,0 +1,107 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.routers.faults import fault_manager
+from app.routers.log_router import log_manager
+
+
+def parse_metrics(text):
+    """Map `name{labels}` to its value"""
+    metrics = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            metrics[name] = float(value)
+    return metrics
+
+
+class TestMetricsEndpoints:
+    """Integration tests for the Prometheus endpoint"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_metrics_format(self, client):
+        """Test metrics are served in the Prometheus text format"""
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE stressed_log_lines_total counter" in response.text
+        metrics = parse_metrics(response.text)
+        assert metrics["stressed_cpu_capacity_cores"] > 0
+        assert 'stressed_load_active{load="cpu"}' in metrics
+
+    def test_log_and_probe_counters(self, client):
+        """Test log and probe counters follow the API calls"""
+        before = parse_metrics(client.get("/metrics").text)
+        client.post("/log/", json={"message": "metrics", "level": "warning"})
+        client.post("/probes/status", json={"probe": "liveness", "status": "error"})
+        client.post("/probes/status", json={"probe": "liveness", "status": "ok"})
+        assert log_manager.emitter.flush()
+        after = parse_metrics(client.get("/metrics").text)
+
+        key = 'stressed_log_lines_total{level="warning"}'
+        assert after[key] == before.get(key, 0) + 1
+        assert after["stressed_log_bytes_total"] > before["stressed_log_bytes_total"]
+        key = 'stressed_probe_flips_total{probe="liveness"}'
+        assert after[key] == before[key] + 2
+        assert after['stressed_probe_healthy{probe="liveness"}'] == 1
+
+    def test_log_bytes_are_encoded_bytes(self, client):
+        """Test the log byte counter counts UTF-8 bytes, not characters"""
+        message = "d\u00e9bit \u2713"
+        before = parse_metrics(client.get("/metrics").text)
+        client.post(
+            "/log/",
+            json={
+                "message": message,
+                "level": "info",
+                "service": "metrics",
+                "format": "plaintext",
+            },
+        )
+        assert log_manager.emitter.flush()
+        after = parse_metrics(client.get("/metrics").text)
+
+        line = f"2024-01-01 00:00:00,000 | INFO | metrics | {message}\n"
+        delta = after["stressed_log_bytes_total"] - before["stressed_log_bytes_total"]
+        assert delta == len(line.encode())
+
+    def test_log_queue_metrics(self, client):
+        """Test log queue depth and drops are exposed"""
+        metrics = parse_metrics(client.get("/metrics").text)
+        assert metrics["stressed_log_dropped_total"] >= 0
+        assert metrics['stressed_log_queue_lines{sink="stderr"}'] >= 0
+        assert metrics['stressed_log_sink_bytes_total{sink="stderr"}'] >= 0
+
+    def test_sink_write_latency_summary(self, client):
+        """Test sink write latency is a summary with running sum and count"""
+        client.post("/log/", json={"message": "summary", "level": "info"})
+        assert log_manager.emitter.flush()
+        response = client.get("/metrics")
+        assert "# TYPE stressed_log_sink_write_seconds summary" in response.text
+        assert "quantile" not in response.text
+        metrics = parse_metrics(response.text)
+        count = metrics['stressed_log_sink_write_seconds_count{sink="stderr"}']
+        assert count == log_manager.emitter.latency.count > 0
+        assert metrics['stressed_log_sink_write_seconds_sum{sink="stderr"}'] > 0
+
+    def test_label_values_are_escaped(self, client):
+        """Test quotes, backslashes and newlines in labels keep the format valid"""
+        client.post("/faults", json={"route": '/odd\\"path\n', "latency_ms": 0})
+        try:
+            text = client.get("/metrics").text
+        finally:
+            fault_manager.clear()
+        metrics = parse_metrics(text)
+        key = 'stressed_fault_requests_total{route="/odd\\\\\\"path\\n"}'
+        assert metrics[key] == 0
+
+    def test_load_metrics(self, client):
+        """Test requested load is exposed"""
+        client.post("/load/cpu/start", json={"value": 0.2})
+        metrics = parse_metrics(client.get("/metrics").text)
+        assert metrics["stressed_cpu_requested_cores"] == 0.2
+        assert metrics['stressed_load_active{load="cpu"}'] == 1
+        client.post("/load/cpu/stop")
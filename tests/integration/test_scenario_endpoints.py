@@ -0,0 +1,69 @@
+import time
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+class TestScenarioEndpoints:
+    """Integration tests for scenario endpoints"""
+
+    @pytest.fixture
+    def client(self):
+        # Keep one event loop for the scheduler across requests
+        with TestClient(app) as client:
+            yield client
+
+    def test_scenario_lifecycle(self, client):
+        """Test starting, querying and cancelling a scenario"""
+        response = client.post(
+            "/scenarios",
+            json={
+                "name": "ramp",
+                "phases": [
+                    {"name": "ramp", "duration": 30, "cpu": {"start": 0, "end": 1}}
+                ],
+            },
+        )
+        assert response.status_code == 200
+        run_id = response.json()["id"]
+
+        time.sleep(0.3)
+        response = client.get(f"/scenarios/{run_id}")
+        assert response.status_code == 200
+        assert response.json()["state"] == "running"
+        assert response.json()["phases"][0]["state"] == "running"
+        assert any(run["id"] == run_id for run in client.get("/scenarios").json())
+
+        response = client.delete(f"/scenarios/{run_id}")
+        assert response.status_code == 200
+        time.sleep(0.1)
+        assert client.get(f"/scenarios/{run_id}").json()["state"] == "cancelled"
+        assert client.delete(f"/scenarios/{run_id}").status_code == 400
+        assert client.get("/scenarios/unknown").status_code == 404
+
+    def test_yaml_scenario(self, client):
+        """Test a YAML scenario runs to completion"""
+        response = client.post(
+            "/scenarios",
+            content=b"name: probes\nphases:\n  - probes: {liveness: ok}\n",
+            headers={"Content-Type": "application/yaml"},
+        )
+        assert response.status_code == 200
+        time.sleep(0.2)
+        run = client.get(f"/scenarios/{response.json()['id']}").json()
+        assert run["state"] == "completed"
+
+    def test_invalid_scenarios(self, client):
+        """Test scenario validation errors"""
+        response = client.post("/scenarios", json={"phases": []})
+        assert response.status_code == 422
+        response = client.post(
+            "/scenarios", json={"phases": [{"cpu": {"value": 10000}}]}
+        )
+        assert response.status_code == 400
+        response = client.post(
+            "/scenarios",
+            content=b"phases: [",
+            headers={"Content-Type": "application/yaml"},
+        )
+        assert response.status_code == 400
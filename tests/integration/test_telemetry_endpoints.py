@@ -0,0 +1,49 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.routers.telemetry import broadcaster, stream_telemetry
+
+
+class TestTelemetryEndpoints:
+    """Integration tests for the telemetry stream"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_stream_events(self, client):
+        """Test the stream pushes load, log and probe state"""
+        events = []
+        with client.stream("GET", "/telemetry/stream", params={"limit": 2}) as r:
+            assert r.status_code == 200
+            assert r.headers["content-type"].startswith("text/event-stream")
+            for line in r.iter_lines():
+                if line.startswith("data: "):
+                    events.append(json.loads(line.removeprefix("data: ")))
+        assert len(events) == 2
+        assert {"load", "logs", "probes"} <= set(events[0])
+        assert "cpu_requested" in events[0]["load"]
+        assert "readiness_status" in events[0]["probes"]
+        assert events[1]["logs"]["lines_per_sec"] is not None
+
+        response = client.get("/telemetry")
+        assert response.status_code == 200
+        assert response.json()["subscribers"] == 0
+
+    def test_invalid_parameters(self, client):
+        """Test stream parameter validation"""
+        response = client.get("/telemetry/stream", params={"interval": 0.01})
+        assert response.status_code == 400
+        response = client.get("/telemetry/stream", params={"limit": 0})
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_unstarted_stream_does_not_subscribe(self):
+        """Test a stream never iterated leaves no subscriber behind"""
+        response = await stream_telemetry(limit=1)
+        assert broadcaster.subscribers == 0
+        events = response.body_iterator
+        assert (await anext(events)).startswith("event: telemetry")
+        await events.aclose()
+        assert broadcaster.subscribers == 0
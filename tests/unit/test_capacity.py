@@ -0,0 +1,120 @@
+import os
+import pytest
+from app.managers.capacity import CgroupCapacity, cache_sizes, parse_cpulist
+
+
+def write_files(root, files):
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+class TestCgroupCapacity:
+    @pytest.fixture
+    def cgroup_v2(self, tmp_path):
+        """Fake cgroup v2 hierarchy with the process in /pod"""
+        write_files(
+            tmp_path,
+            {
+                "sys/cgroup.controllers": "cpu memory cpuset",
+                "sys/pod/cpu.max": "150000 100000",
+                "sys/pod/cpu.weight": "79",
+                "sys/pod/cpuset.cpus.effective": "0",
+                "sys/pod/memory.max": str(512 * 1024 * 1024),
+                "sys/pod/memory.current": str(64 * 1024 * 1024),
+                "sys/pod/cpu.stat": "usage_usec 2500000\nuser_usec 2000000\n",
+                "proc": "0::/pod\n",
+            },
+        )
+        return CgroupCapacity(str(tmp_path / "sys"), str(tmp_path / "proc"))
+
+    @pytest.fixture
+    def cgroup_v1(self, tmp_path):
+        """Fake cgroup v1 hierarchy without limits"""
+        write_files(
+            tmp_path,
+            {
+                "sys/cpu/pod/cpu.cfs_quota_us": "-1",
+                "sys/cpu/pod/cpu.cfs_period_us": "100000",
+                "sys/cpu/pod/cpu.shares": "512",
+                "sys/memory/pod/memory.limit_in_bytes": str(1 << 62),
+                "proc": "4:cpu,cpuacct:/pod\n3:memory:/pod\n",
+            },
+        )
+        return CgroupCapacity(str(tmp_path / "sys"), str(tmp_path / "proc"))
+
+    def test_parse_cpulist(self):
+        """Test kernel CPU list parsing"""
+        assert parse_cpulist("0-3,8\n") == {0, 1, 2, 3, 8}
+        assert parse_cpulist("") == set()
+
+    def test_cache_sizes(self, tmp_path):
+        """Test data and unified caches are read from sysfs, by level"""
+        write_files(
+            tmp_path,
+            {
+                "cache/index0/type": "Data\n",
+                "cache/index0/level": "1\n",
+                "cache/index0/size": "48K\n",
+                "cache/index1/type": "Instruction\n",
+                "cache/index1/level": "1\n",
+                "cache/index1/size": "32K\n",
+                "cache/index2/type": "Unified\n",
+                "cache/index2/level": "3\n",
+                "cache/index2/size": "32M\n",
+            },
+        )
+        assert cache_sizes(str(tmp_path)) == {"l1": 48 * 1024, "l3": 32 * 1024 * 1024}
+
+    def test_cgroup_v2_limits(self, cgroup_v2, monkeypatch):
+        """Test limits and request read from cgroup v2 files"""
+        monkeypatch.delenv("CONTAINER_CPU_REQUEST", raising=False)
+        assert cgroup_v2.version == 2
+        assert cgroup_v2.cpu_limit() == 1.5
+        assert cgroup_v2.cpuset() == {0}
+        assert cgroup_v2.memory_limit_mb() == 512
+        # A 2000m request is written as cpu.weight 79 by the kubelet
+        assert cgroup_v2.cpu_request() == pytest.approx(2, abs=0.01)
+        # The cpuset caps the quota
+        assert cgroup_v2.cpus == 1
+        assert cgroup_v2.worker_slots == 1
+        assert cgroup_v2.memory_mb == 512
+        assert cgroup_v2.cpu_usage_seconds() == 2.5
+        assert cgroup_v2.memory_usage_mb() == 64
+
+    def test_cgroup_v1_unlimited(self, cgroup_v1, monkeypatch):
+        """Test cgroup v1 fallback without limits uses host capacity"""
+        monkeypatch.delenv("CONTAINER_CPU_REQUEST", raising=False)
+        assert cgroup_v1.version == 1
+        assert cgroup_v1.cpu_limit() is None
+        assert cgroup_v1.memory_limit_mb() is None
+        assert cgroup_v1.cpu_request() == 0.5
+        assert cgroup_v1.cpus == min(len(os.sched_getaffinity(0)), os.cpu_count())
+        assert cgroup_v1.memory_mb > 0
+
+    def test_default_weight_is_no_request(self, tmp_path, monkeypatch):
+        """Test the default CPU weight or shares of a host are not a request"""
+        monkeypatch.delenv("CONTAINER_CPU_REQUEST", raising=False)
+        write_files(
+            tmp_path,
+            {
+                "v2/cgroup.controllers": "cpu memory",
+                "v2/cpu.weight": "100",
+                "v1/cpu/cpu.shares": "1024",
+                "proc": "",
+            },
+        )
+        v2 = CgroupCapacity(str(tmp_path / "v2"), str(tmp_path / "proc"))
+        v1 = CgroupCapacity(str(tmp_path / "v1"), str(tmp_path / "proc"))
+        assert v2.version == 2 and v1.version == 1
+        assert v2.cpu_request() is None
+        assert v1.cpu_request() is None
+
+    def test_requests_from_environment(self, cgroup_v1, monkeypatch):
+        """Test requests exposed through the downward API"""
+        monkeypatch.setenv("CONTAINER_CPU_REQUEST", "0.25")
+        monkeypatch.setenv("CONTAINER_MEMORY_REQUEST", "128")
+        assert cgroup_v1.cpu_request() == 0.25
+        assert cgroup_v1.memory_request_mb() == 128
+        assert cgroup_v1.to_dict()["memory_request_mb"] == 128
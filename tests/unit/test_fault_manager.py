@@ -0,0 +1,115 @@
+import asyncio
+import time
+import pytest
+from app.managers.fault_manager import MAX_DELAY, FaultManager
+from app.middleware import FaultInjectionMiddleware
+from app.models.schemas import FaultRule
+
+
+async def call(middleware, method="GET", path="/load"):
+    """Run one HTTP request through the middleware, return the status sent"""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    await middleware(scope, receive, send)
+    return sent[0]["status"]
+
+
+async def endpoint(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+class TestFaultManager:
+    """Unit tests for the fault rules and the injection middleware"""
+
+    def test_most_specific_rule_matches(self):
+        manager = FaultManager()
+        manager.set_rule(FaultRule(route="/load/*", latency_ms=1))
+        manager.set_rule(FaultRule(route="/load/cpu/*", latency_ms=2))
+        manager.set_rule(FaultRule(route="/load/cpu/start", latency_ms=3))
+        assert manager.match("POST", "/load/cpu/start").latency_ms == 3
+        assert manager.match("POST", "/load/cpu/stop").latency_ms == 2
+        assert manager.match("GET", "/load/memory").latency_ms == 1
+        assert manager.match("GET", "/probes") is None
+        assert manager.match("GET", "/faults") is None
+
+    def test_methods_filter(self):
+        manager = FaultManager()
+        manager.set_rule(FaultRule(route="/log/*", methods=["POST"]))
+        assert manager.match("POST", "/log/floods") is not None
+        assert manager.match("GET", "/log/floods") is None
+
+    def test_distributions(self):
+        manager = FaultManager(seed=1)
+        fixed = FaultRule(route="/", latency_ms=20)
+        assert manager.sample_delay(fixed) == 0.02
+
+        normal = FaultRule(route="/", distribution="normal", latency_ms=5, stddev_ms=50)
+        delays = [manager.sample_delay(normal) for _ in range(1000)]
+        assert min(delays) == 0
+        assert 0.015 < sum(delays) / len(delays) < 0.03
+
+        lognormal = FaultRule(route="/", distribution="lognormal", latency_ms=10)
+        delays = sorted(manager.sample_delay(lognormal) for _ in range(1001))
+        assert delays[500] == pytest.approx(0.01, rel=0.1)
+
+        bimodal = FaultRule(
+            route="/",
+            distribution="bimodal",
+            latency_ms=1,
+            slow_ms=1000,
+            slow_ratio=0.1,
+        )
+        delays = [manager.sample_delay(bimodal) for _ in range(1000)]
+        assert set(delays) == {0.001, 1.0}
+        assert 50 < delays.count(1.0) < 150
+
+        huge = FaultRule(route="/", latency_ms=10**9)
+        assert manager.sample_delay(huge) == MAX_DELAY
+
+    def test_invalid_rules(self):
+        manager = FaultManager()
+        with pytest.raises(ValueError, match="cannot be targeted"):
+            manager.set_rule(FaultRule(route="/faults"))
+        with pytest.raises(ValueError, match="slow_ratio"):
+            FaultRule(route="/", distribution="bimodal", slow_ms=100)
+        with pytest.raises(KeyError):
+            manager.delete_rule("/missing")
+
+    def test_inject_counts_errors(self):
+        manager = FaultManager(seed=2)
+        manager.set_rule(FaultRule(route="/", error_rate=0.25, status_code=503))
+        statuses = [manager.inject("GET", "/")[1] for _ in range(1000)]
+        assert set(statuses) == {None, 503}
+        assert manager.stats["/"]["requests"] == 1000
+        assert manager.stats["/"]["errors"] == statuses.count(503)
+        assert 150 < statuses.count(503) < 350
+
+    @pytest.mark.asyncio
+    async def test_middleware_injects_error(self):
+        manager = FaultManager()
+        middleware = FaultInjectionMiddleware(endpoint, manager)
+        assert await call(middleware) == 200
+        manager.set_rule(FaultRule(route="/load", error_rate=1, status_code=429))
+        assert await call(middleware) == 429
+        assert await call(middleware, path="/probes") == 200
+
+    @pytest.mark.asyncio
+    async def test_middleware_delay_does_not_block(self):
+        manager = FaultManager()
+        manager.set_rule(FaultRule(route="/load", latency_ms=200))
+        middleware = FaultInjectionMiddleware(endpoint, manager)
+        start = time.perf_counter()
+        statuses = await asyncio.gather(*(call(middleware) for _ in range(50)))
+        elapsed = time.perf_counter() - start
+        assert statuses == [200] * 50
+        # Concurrent delayed requests wait together instead of one after another
+        assert 0.2 <= elapsed < 1
+        assert manager.stats["/load"]["delay_seconds"] == pytest.approx(10)
@@ -1,7 +1,38 @@
 import os
 import pytest
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from app.managers.load_manager import LoadManager
 import psutil
+import time
+
+
+def wait_for_stats(process, timeout=5, **expected):
+    """Wait until a worker process reports the expected values"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        stats = process.stats
+        if all(stats.get(key) == value for key, value in expected.items()):
+            return stats
+        time.sleep(0.05)
+    raise AssertionError(f"Worker never reported {expected}: {process.stats}")
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 target for the HTTP load"""
+
+    protocol_version = "HTTP/1.1"
+    wbufsize = 65536
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
 
 
 class TestLoadManager:
@@ -59,6 +90,57 @@ class TestLoadManager:
         assert load_manager.cpu_requested == value
         assert len(load_manager.cpu_processes) > 0
 
+    def test_add_cpu_load_with_feedback(self, load_manager):
+        """Test CPU load in closed-loop feedback mode"""
+        load_manager.add_cpu_load(0.5, feedback=True)
+        assert load_manager.cpu_requested == 0.5
+        stats = wait_for_stats(load_manager.cpu_processes[0], feedback=True)
+        assert stats["target"] == 0.5
+
+    def test_add_cpu_load_retargets_pool(self, load_manager):
+        """Test CPU load changes reuse the running worker pool"""
+        load_manager.add_cpu_load(0.2)
+        pool = load_manager.cpu_processes[0]
+        load_manager.add_cpu_load(0.6)
+        assert load_manager.cpu_processes == [pool]
+        assert pool.is_alive()
+        assert wait_for_stats(pool, target=0.6)["target"] == 0.6
+
+    def test_add_cpu_load_workload(self, load_manager):
+        """Test CPU workload kinds report their throughput"""
+        load_manager.add_cpu_load(0.5, workload="hash")
+        pool = load_manager.cpu_processes[0]
+        wait_for_stats(pool, workload="hash")
+        deadline = time.time() + 5
+        while not load_manager.cpu_stats.get("ops_per_sec") and time.time() < deadline:
+            time.sleep(0.1)
+        assert load_manager.cpu_stats["ops_per_sec"] > 0
+
+        load_manager.add_cpu_load(0.5, workload="json")
+        assert load_manager.cpu_processes == [pool]
+        wait_for_stats(pool, workload="json")
+
+    def test_set_cpu_load_keeps_workload(self, load_manager):
+        """Test a retarget without workload keeps the running one"""
+        load_manager.add_cpu_load(0.5, workload="hash")
+        pool = load_manager.cpu_processes[0]
+        load_manager.set_cpu_target(0.3)
+        assert wait_for_stats(pool, target=0.3)["workload"] == "hash"
+
+    def test_add_cpu_load_placement(self, load_manager):
+        """Test CPU workers are pinned and their placement reported"""
+        cpu = min(os.sched_getaffinity(0))
+        load_manager.add_cpu_load(0.5, placement="pack", cpus=[cpu])
+        stats = wait_for_stats(
+            load_manager.cpu_processes[0], placement_policy="pack", cpus=[cpu]
+        )
+        assert all(worker["affinity"] == [cpu] for worker in stats["placement"])
+
+    def test_add_cpu_load_invalid_cpu_set(self, load_manager):
+        """Test CPU set validation"""
+        with pytest.raises(ValueError, match="CPU set must be a subset"):
+            load_manager.add_cpu_load(0.5, cpus=[4096])
+
     def test_add_cpu_load_with_invalid_values(self, load_manager):
         """Test invalid CPU load values"""
         with pytest.raises(ValueError):
@@ -104,6 +186,41 @@ class TestLoadManager:
         assert load_manager.cpu_requested >= 0
         assert load_manager.cpu_requested <= 1
 
+    def test_dynamic_cpu_load_high_resolution(self, load_manager):
+        """Test sub-second ramp updates the CPU target"""
+        load_manager.dynamic_cpu_load(0.2, 0.8, 1, False, resolution=0.1)
+        time.sleep(0.35)
+        assert 0.2 < load_manager.cpu_requested < 0.8
+        time.sleep(0.9)
+        assert load_manager.cpu_requested == 0.8
+        assert not load_manager.cpu_ramp.active
+
+    def test_dynamic_cpu_load_stop_cancels_ramp(self, load_manager):
+        """Test stopping CPU load cancels the running ramp"""
+        load_manager.dynamic_cpu_load(0.1, 0.5, 10, False, shape="sine")
+        ramp = load_manager.cpu_ramp
+        load_manager.stop_cpu_load()
+        assert not ramp.active
+        assert load_manager.cpu_processes == []
+        assert load_manager.cpu_requested == 0
+
+    def test_dynamic_cpu_load_records_ramp_error(self, load_manager, monkeypatch):
+        """Test a failing ramp tick is reported instead of lost"""
+
+        def fail():
+            raise RuntimeError("Failed to start CPU stress")
+
+        load_manager.dynamic_cpu_load(0, 1, 10, False, resolution=0.1)
+        monkeypatch.setattr(load_manager, "_cpu_pool", fail)
+        time.sleep(0.3)
+        assert not load_manager.cpu_ramp.active
+        assert "Failed to start CPU stress" in load_manager.cpu_ramp_error
+
+    def test_dynamic_cpu_load_invalid_resolution(self, load_manager):
+        """Test resolution below the ramp engine minimum"""
+        with pytest.raises(ValueError, match="Resolution must be at least"):
+            load_manager.dynamic_cpu_load(0, 1, 10, False, resolution=0.01)
+
     # 3. Memory methods tests
     def test_add_memory_load(self, load_manager):
         """Test memory load setting"""
@@ -112,6 +229,34 @@ class TestLoadManager:
         assert load_manager.memory_requested == value
         assert load_manager.memory_process is not None
 
+    def test_add_memory_load_resizes_holder(self, load_manager):
+        """Test memory load changes resize the running holder in place"""
+        load_manager.add_memory_load(20)
+        holder = load_manager.memory_process
+        assert wait_for_stats(holder, allocated_mb=20)["chunks"] > 0
+        load_manager.add_memory_load(40)
+        assert load_manager.memory_process is holder
+        assert wait_for_stats(holder, allocated_mb=40)["rss_mb"] >= 40
+        load_manager.add_memory_load(10)
+        assert wait_for_stats(holder, allocated_mb=10)["target_mb"] == 10
+
+    def test_add_memory_load_modes(self, load_manager):
+        """Test memory residency modes"""
+        load_manager.add_memory_load(64, mode="reserve")
+        stats = wait_for_stats(load_manager.memory_process, mode="reserve")
+        assert stats["allocated_mb"] == 64
+        assert stats["rss_mb"] < 64
+
+        load_manager.add_memory_load(64, mode="dirty", dirty_rate=200)
+        stats = wait_for_stats(load_manager.memory_process, mode="dirty")
+        assert stats["rss_mb"] >= 64
+        assert stats["dirty_rate"] == 200
+
+    def test_add_memory_load_dirty_requires_rate(self, load_manager):
+        """Test dirty mode without a dirty rate"""
+        with pytest.raises(ValueError, match="Dirty mode requires a dirty rate"):
+            load_manager.add_memory_load(10, mode="dirty")
+
     def test_add_memory_load_with_invalid_values(self, load_manager):
         """Test invalid memory load values"""
         with pytest.raises(ValueError):
@@ -148,7 +293,164 @@ class TestLoadManager:
         assert load_manager.memory_requested >= 100
         assert load_manager.memory_requested <= 256
 
-    # 4. Combined and other tests
+    # 4. Bandwidth methods tests
+    def test_add_bandwidth_load(self, load_manager):
+        """Test bandwidth load reports achieved throughput"""
+        load_manager.add_bandwidth_load(1, "l2", "copy", duration=5)
+        assert load_manager.bandwidth_active
+        deadline = time.time() + 5
+        while not load_manager.bandwidth_process.stats and time.time() < deadline:
+            time.sleep(0.1)
+        stats = load_manager.bandwidth_process.stats
+        assert stats["pattern"] == "copy"
+        assert stats["gbps"] > 0
+        assert stats["ns_per_access"] > 0
+        load_manager.stop_bandwidth_load()
+        assert not load_manager.bandwidth_active
+
+    def test_add_bandwidth_load_with_invalid_values(self, load_manager):
+        """Test invalid bandwidth load parameters"""
+        with pytest.raises(ValueError, match="Bandwidth workers must be between"):
+            load_manager.add_bandwidth_load(workers=os.cpu_count() + 1)
+        with pytest.raises(ValueError, match="Working set cannot exceed"):
+            load_manager.add_bandwidth_load(working_set_kb=1024 * 1024 * 1024)
+        # The default dram working set is at least 64 MB per worker
+        load_manager.system_memory = 32
+        with pytest.raises(ValueError, match="Working set cannot exceed"):
+            load_manager.add_bandwidth_load(level="dram")
+        assert not load_manager.bandwidth_active
+
+    def test_add_disk_load(self, load_manager, tmp_path):
+        """Test disk load reports IOPS and latency and removes its file"""
+        load_manager.add_disk_load("randrw", 4, 2, 8, path=str(tmp_path), duration=5)
+        assert load_manager.disk_active
+        stats = wait_for_stats(load_manager.disk_process, pattern="randrw")
+        assert stats["queue_depth"] == 2
+        assert stats["read_iops"] > 0 and stats["write_iops"] > 0
+        assert stats["errors"] == 0
+        assert stats["latency"]["p99_ms"] is not None
+        load_manager.stop_disk_load()
+        assert not load_manager.disk_active
+        assert list(tmp_path.iterdir()) == []
+
+    def test_add_disk_load_with_invalid_values(self, load_manager, tmp_path):
+        """Test invalid disk load parameters"""
+        with pytest.raises(ValueError, match="Queue depth must be between"):
+            load_manager.add_disk_load(queue_depth=0, path=str(tmp_path))
+        with pytest.raises(ValueError, match="Direct I/O needs"):
+            load_manager.add_disk_load(block_size_kb=6, direct=True)
+        with pytest.raises(ValueError, match="Disk load size must be between"):
+            load_manager.add_disk_load(size_mb=load_manager.disk_max_size_mb + 1)
+        with pytest.raises(ValueError, match="is not a directory"):
+            load_manager.add_disk_load(path=str(tmp_path / "missing"))
+
+    def test_add_network_load(self, load_manager):
+        """Test loopback network load reports throughput on both sides"""
+        load_manager.add_network_load("udp", "loopback", message_size=1000, duration=5)
+        assert load_manager.network_active
+        stats = wait_for_stats(load_manager.network_process, protocol="udp")
+        assert stats["sent"]["pps"] > 0
+        assert stats["received"]["pps"] > 0
+        assert "loss_ratio" in stats
+        load_manager.stop_network_load()
+        assert not load_manager.network_active
+
+    @pytest.mark.skipif(not socket.has_ipv6, reason="IPv6 unavailable")
+    def test_network_load_to_ipv6_peer(self, load_manager):
+        """Test send mode reaches a peer listening on an IPv6 address"""
+        server = socket.create_server(("::1", 0), family=socket.AF_INET6)
+        port = server.getsockname()[1]
+
+        def drain():
+            conn, _ = server.accept()
+            with conn:
+                while conn.recv(65536):
+                    pass
+
+        threading.Thread(target=drain, daemon=True).start()
+        try:
+            load_manager.add_network_load(
+                "tcp", "send", host="::1", port=port, message_size=1000, duration=5
+            )
+            stats = wait_for_stats(load_manager.network_process, mode="send")
+            assert stats["sent"]["pps"] > 0
+            assert stats["sent"]["errors"] == 0
+            load_manager.stop_network_load()
+        finally:
+            server.close()
+
+    def test_add_network_load_with_invalid_values(self, load_manager):
+        """Test invalid network load parameters"""
+        with pytest.raises(ValueError, match="Message size must be between"):
+            load_manager.add_network_load("udp", message_size=70000)
+        with pytest.raises(ValueError, match="Connections must be between"):
+            load_manager.add_network_load(connections=1000)
+        with pytest.raises(ValueError, match="peer host is required"):
+            load_manager.add_network_load(mode="send")
+
+    def test_add_http_load(self, load_manager):
+        """Test open-loop HTTP load reports rate, statuses and percentiles"""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        try:
+            load_manager.add_http_load(url, 100, "poisson", 4, duration=5)
+            assert load_manager.http_active
+            stats = wait_for_stats(load_manager.http_process, arrival="poisson")
+            assert stats["statuses"]["2xx"] > 0
+            assert stats["errors"] == {}
+            assert stats["latency_total"]["p99.9_ms"] is not None
+            load_manager.stop_http_load()
+            assert not load_manager.http_active
+        finally:
+            server.shutdown()
+
+    def test_http_load_records_timeouts(self, load_manager):
+        """Test requests to a hung server count in the latency at the timeout"""
+        # Connections queue in the backlog and are never answered
+        server = socket.create_server(("127.0.0.1", 0))
+        url = f"http://127.0.0.1:{server.getsockname()[1]}/"
+        try:
+            load_manager.add_http_load(url, 20, connections=4, timeout=0.2)
+            stats = wait_for_stats(load_manager.http_process, arrival="constant")
+            assert stats["errors"]["timeout"] > 0
+            assert "2xx" not in stats["statuses"]
+            assert stats["latency"]["p50_ms"] >= 200
+            assert stats["service_latency_total"]["p50_ms"] >= 200
+            load_manager.stop_http_load()
+        finally:
+            server.close()
+
+    def test_add_http_load_with_invalid_values(self, load_manager):
+        """Test invalid HTTP load parameters"""
+        with pytest.raises(ValueError, match="absolute http"):
+            load_manager.add_http_load("ftp://example.com", 10)
+        with pytest.raises(ValueError, match="Rate must be between"):
+            load_manager.add_http_load("/health", 0)
+        with pytest.raises(ValueError, match="line breaks"):
+            load_manager.add_http_load("/", 10, headers={"X-A": "1\r\nX-B: 2"})
+
+    def test_add_churn_load(self, load_manager):
+        """Test connection churn against the local listener"""
+        load_manager.add_churn_load(200, hold_ms=10, duration=5)
+        assert load_manager.churn_active
+        stats = wait_for_stats(load_manager.churn_process, local_listener=True)
+        assert stats["conn_per_s"] > 0
+        assert stats["connect_latency"]["p99_ms"] is not None
+        assert stats["failures"] == {}
+        load_manager.stop_churn_load()
+        assert not load_manager.churn_active
+
+    def test_add_churn_load_with_invalid_values(self, load_manager):
+        """Test invalid connection churn parameters"""
+        with pytest.raises(ValueError, match="Rate must be between"):
+            load_manager.add_churn_load(0)
+        with pytest.raises(ValueError, match="port is required"):
+            load_manager.add_churn_load(10, host="example.com")
+        with pytest.raises(ValueError, match="Hold time must be between"):
+            load_manager.add_churn_load(10, hold_ms=-1)
+
+    # 5. Combined and other tests
     def test_stop_all_loads(self, load_manager):
         """Test stopping all loads"""
         load_manager.add_cpu_load(1)
@@ -216,6 +518,24 @@ class TestLoadManager:
         with pytest.raises(ValueError, match="Memory load must be greater than 0"):
             load_manager.add_memory_load(0)
 
+    def test_percent_units(self, load_manager, monkeypatch):
+        """Test loads expressed as a percentage of the container limit or request"""
+        load_manager.add_cpu_load(50, unit="percent_limit")
+        assert load_manager.cpu_requested == load_manager.system_cpus / 2
+
+        monkeypatch.setenv("CONTAINER_MEMORY_REQUEST", "200")
+        load_manager.add_memory_load(25, unit="percent_request")
+        assert load_manager.memory_requested == 50
+
+        load_manager.dynamic_memory_load(10, 20, 10, unit="percent_request")
+        assert load_manager.memory_requested == 20
+
+        monkeypatch.delenv("CONTAINER_MEMORY_REQUEST")
+        with pytest.raises(ValueError, match="Memory request is unknown"):
+            load_manager.add_memory_load(25, unit="percent_request")
+        with pytest.raises(ValueError, match="CPU load cannot exceed"):
+            load_manager.add_cpu_load(150, unit="percent_limit")
+
     @pytest.mark.asyncio
     async def test_edge_cases_dynamic_load(self, load_manager):
         """Test edge cases for dynamic load changes"""
@@ -228,9 +548,9 @@ class TestLoadManager:
         assert load_manager.memory_requested >= 100
         assert load_manager.memory_requested <= 200
 
-        # Test with reversed values
-        with pytest.raises(ValueError, match="End value must be greater than"):
-            load_manager.dynamic_cpu_load(0.8, 0.2, 10, True)
+        # Test with reversed values (ramp down)
+        load_manager.dynamic_cpu_load(0.8, 0.2, 10, True)
+        assert load_manager.cpu_requested == 0.8
 
         # Test with maximum duration
         with pytest.raises(ValueError, match="Duration must be between 1 and"):
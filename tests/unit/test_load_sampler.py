@@ -0,0 +1,82 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+import psutil
+import pytest
+from app.managers.capacity import CgroupCapacity
+from app.managers.load_sampler import LoadSampler
+
+
+class TestLoadSampler:
+    @pytest.fixture
+    def busy_process(self):
+        """Process burning one core through a child process"""
+        code = (
+            "import multiprocessing, time\n"
+            "def spin():\n"
+            "    while True: pass\n"
+            "p = multiprocessing.Process(target=spin, daemon=True)\n"
+            "p.start()\n"
+            "time.sleep(60)\n"
+        )
+        process = subprocess.Popen([sys.executable, "-c", code], start_new_session=True)
+        deadline = time.time() + 10
+        while not psutil.Process(process.pid).children() and time.time() < deadline:
+            time.sleep(0.05)
+        yield process
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+    def test_measures_process_tree(self, busy_process):
+        """Test CPU time of children is aggregated under the root process"""
+        sampler = LoadSampler(
+            lambda: {"cpu": busy_process.pid, "memory": None},
+            lambda: {"cpu_requested": 1},
+            CgroupCapacity(),
+        )
+        first = sampler.sample()
+        assert first["cpu_measured"] is None
+        time.sleep(0.5)
+        sample = sampler.sample()
+        assert sample["cpu_requested"] == 1
+        assert sample["loads"]["cpu"]["cpu"] > 0
+        assert sample["loads"]["cpu"]["rss_mb"] > 0
+        assert sample["loads"]["memory"] == {"cpu": 0, "rss_mb": 0}
+        assert len(sampler._handles) == 2
+
+    def test_ring_buffer(self):
+        """Test the history keeps the most recent samples only"""
+        sampler = LoadSampler(
+            dict, dict, CgroupCapacity(), interval=0.1, history_size=3
+        )
+        for _ in range(5):
+            sampler.sample()
+        assert len(sampler.series()) == 3
+        assert sampler.latest is sampler.series()[-1]
+        assert sampler.series(seconds=60) == sampler.series()
+
+    def test_background_thread(self):
+        """Test the sampler thread samples at the configured interval"""
+        sampler = LoadSampler(dict, dict, CgroupCapacity(), interval=0.1)
+        sampler.start()
+        time.sleep(0.55)
+        sampler.stop()
+        assert 4 <= len(sampler.history) <= 7
+
+    def test_invalid_parameters(self):
+        """Test sampler parameter validation"""
+        with pytest.raises(ValueError, match="interval"):
+            LoadSampler(dict, dict, CgroupCapacity(), interval=0)
+        with pytest.raises(ValueError, match="History size"):
+            LoadSampler(dict, dict, CgroupCapacity(), history_size=0)
+
+    def test_dead_processes_are_dropped(self):
+        """Test cached handles of exited processes are released"""
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        sampler = LoadSampler(lambda: {"cpu": process.pid}, dict, CgroupCapacity())
+        sample = sampler.sample()
+        assert sample["loads"]["cpu"]["rss_mb"] == 0
+        assert sampler._handles == {}
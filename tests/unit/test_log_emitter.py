@@ -0,0 +1,155 @@
+import asyncio
+import io
+import threading
+import time
+import pytest
+from app.managers.log_emitter import LogEmitter
+from app.models import LogOverflowPolicy
+
+
+class SlowStream(io.StringIO):
+    """Stream whose writes wait until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait(5)
+        return super().write(text)
+
+
+class TestLogEmitter:
+    """Unit tests for the log writer thread and its overflow policies"""
+
+    def test_writes_and_counts(self):
+        stream = io.StringIO()
+        emitter = LogEmitter(stream)
+        assert emitter.submit("one\n") == 1
+        assert emitter.submit("two\nthree\n", 2, "ERROR") == 2
+        assert emitter.flush()
+        assert stream.getvalue() == "one\ntwo\nthree\n"
+        assert emitter.lines == {"INFO": 1, "ERROR": 2}
+        assert emitter.bytes_written == len("one\ntwo\nthree\n")
+        emitter.close()
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            LogEmitter(io.StringIO(), max_lines=0)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            LogEmitter(io.StringIO(), sample_rate=0)
+
+    def test_slow_stream_does_not_block_submit(self):
+        stream = SlowStream()
+        emitter = LogEmitter(stream, max_lines=1000)
+        start = time.monotonic()
+        for _ in range(100):
+            emitter.submit("line\n")
+        assert time.monotonic() - start < 0.5
+        assert emitter.stats()["queued"] > 0
+        stream.release.set()
+        assert emitter.flush()
+        assert emitter.stats()["written"] == 100
+        emitter.close()
+
+    def test_drop_policy(self):
+        stream = SlowStream()
+        emitter = LogEmitter(stream, max_lines=10, policy=LogOverflowPolicy.DROP)
+        # The writer takes the first chunk and stalls on it
+        emitter.submit("first\n")
+        time.sleep(0.1)
+        accepted = sum(emitter.submit("line\n") for _ in range(20))
+        # The line being written still holds its place in the queue
+        assert accepted == 9
+        assert emitter.dropped == 11
+        stream.release.set()
+        assert emitter.flush()
+        assert emitter.stats()["written"] == 10
+        emitter.close()
+
+    def test_sample_policy(self):
+        stream = SlowStream()
+        emitter = LogEmitter(
+            stream, max_lines=100, policy=LogOverflowPolicy.SAMPLE, sample_rate=0.5
+        )
+        emitter.submit("first\n")
+        time.sleep(0.1)
+        accepted = sum(emitter.submit("line\n") for _ in range(80))
+        # Below half full every line is kept, then one in two
+        assert accepted == 49 + 15
+        assert emitter.dropped == 16
+        stream.release.set()
+        emitter.close()
+
+    def test_block_policy_without_wait(self):
+        stream = SlowStream()
+        emitter = LogEmitter(stream, max_lines=10)
+        emitter.submit("first\n")
+        time.sleep(0.1)
+        assert emitter.submit("batch\n" * 9, 9, wait=False) == 9
+        assert emitter.submit("late\n", wait=False) == 0
+        assert emitter.dropped == 1
+        stream.release.set()
+        assert emitter.flush()
+        emitter.close()
+
+    def test_block_policy_waits_for_room(self):
+        stream = SlowStream()
+        emitter = LogEmitter(stream, max_lines=10)
+        emitter.submit("first\n")
+        time.sleep(0.1)
+        emitter.submit("batch\n" * 9, 9)
+        threading.Timer(0.2, stream.release.set).start()
+        start = time.monotonic()
+        assert emitter.submit("late\n") == 1
+        assert time.monotonic() - start >= 0.1
+        assert emitter.dropped == 0
+        assert emitter.flush()
+        emitter.close()
+
+    def test_block_policy_waits_on_event_loop_without_stalling_it(self):
+        stream = SlowStream()
+        emitter = LogEmitter(stream, max_lines=10)
+        emitter.submit("first\n")
+        time.sleep(0.1)
+        emitter.submit("batch\n" * 9, 9)
+
+        async def submit():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker = asyncio.create_task(tick())
+            threading.Timer(0.2, stream.release.set).start()
+            accepted = await emitter.asubmit("late\n")
+            ticker.cancel()
+            return accepted, ticks
+
+        start = time.monotonic()
+        accepted, ticks = asyncio.run(submit())
+        assert accepted == 1
+        assert time.monotonic() - start >= 0.1
+        # The loop kept running while the line waited for room
+        assert ticks >= 5
+        assert emitter.dropped == 0
+        assert emitter.flush()
+        assert emitter.stats()["written"] == 11
+        emitter.close()
+
+    def test_asubmit_with_room_does_not_wait(self):
+        emitter = LogEmitter(io.StringIO())
+        assert asyncio.run(emitter.asubmit("one\ntwo\n", 2, "ERROR")) == 2
+        assert emitter.flush()
+        assert emitter.lines == {"ERROR": 2}
+        emitter.close()
+
+    def test_counts_encoded_bytes(self):
+        emitter = LogEmitter(io.StringIO())
+        emitter.submit("caf\u00e9 \u2713\n")
+        assert emitter.flush()
+        assert emitter.bytes_written == len("caf\u00e9 \u2713\n".encode())
+        emitter.close()
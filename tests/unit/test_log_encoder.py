@@ -0,0 +1,49 @@
+import json
+import logging
+from app.managers import log_encoder
+from app.managers.log_encoder import LogEncoder, TimestampCache
+from app.models.schemas import LogFormat
+
+
+class TestLogEncoder:
+    """Unit tests for the fast-path log encoder"""
+
+    def test_timestamp_matches_logging(self):
+        clock = TimestampCache()
+        record = logging.LogRecord("test", logging.INFO, "", 0, "x", None, None)
+        assert clock.format(record.created) == logging.Formatter().formatTime(record)
+
+    def test_timestamp_cached_per_millisecond(self):
+        clock = TimestampCache()
+        first = clock.format(1700000000.1234)
+        assert clock.format(1700000000.1236) is first
+        assert clock.format(1700000000.1246).endswith(",124")
+        assert clock.format(1700000001.0).endswith(",000")
+
+    def test_json_line(self):
+        encoder = LogEncoder(LogFormat.JSON)
+        line = encoder.line("ERROR", 'svc "a"', 'quote " and \\ é\n', 1700000000.5)
+        data = json.loads(line)
+        assert data["level"] == "ERROR"
+        assert data["service"] == 'svc "a"'
+        assert data["message"] == 'quote " and \\ é\n'
+        assert data["timestamp"].endswith(",500")
+
+    def test_plaintext_line(self):
+        encoder = LogEncoder(LogFormat.PLAINTEXT)
+        line = encoder.line("INFO", "svc", "hello", 1700000000.0)
+        assert line.endswith(",000 | INFO | svc | hello")
+
+    def test_encode_batch(self):
+        encoder = LogEncoder(LogFormat.JSON)
+        text = encoder.encode("INFO", "svc", "hello", 3)
+        lines = text.splitlines()
+        assert len(lines) == 3 and text.endswith("\n")
+        assert all(json.loads(line)["message"] == "hello" for line in lines)
+
+    def test_template_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(log_encoder, "MAX_TEMPLATES", 4)
+        encoder = LogEncoder(LogFormat.JSON)
+        for i in range(10):
+            encoder.line("INFO", "svc", f"message {i}")
+        assert len(encoder._templates) <= 4
@@ -1,7 +1,10 @@
 import pytest
+import io
+import json
 import logging
 from datetime import datetime, UTC
 from app.managers.log_manager import LogManager, JsonFormatter, PlainTextFormatter
+from app.managers.log_sinks import StreamSink
 from app.models.schemas import LogRequest, LogFormat
 import asyncio
 
@@ -86,6 +89,17 @@ class TestLogManager:
         result = await log_manager.create_log(log_data)
         assert "| INFO | TestService | Test log" in result
 
+    @pytest.mark.asyncio
+    async def test_emitted_counters(self, log_manager):
+        """Test lines and bytes counters survive format switches"""
+        await log_manager.create_log(LogRequest(message="one", level="info"))
+        await log_manager.create_log(
+            LogRequest(message="two", level="error", format=LogFormat.PLAINTEXT)
+        )
+        assert log_manager.emitter.flush()
+        assert log_manager.lines_emitted == {"INFO": 1, "ERROR": 1}
+        assert log_manager.bytes_emitted > len("one") + len("two")
+
     @pytest.mark.asyncio
     async def test_invalid_log_level(self, log_manager):
         """Test invalid log level"""
@@ -184,6 +198,160 @@ class TestLogManager:
         assert result["interval"] == 1
         assert result["duration"] == 3
 
+    @pytest.mark.asyncio
+    async def test_log_flood(self, log_manager):
+        """Test a rate-driven flood reaches its target rate"""
+        log_data = LogRequest(message="flood", level="info", rate=2000, duration=1)
+        result = await log_manager.create_log(log_data)
+        assert result["message"] == "Log flood started"
+        assert result["rate"] == 2000
+
+        await asyncio.sleep(1.2)
+        stats = log_manager.floods[-1].to_dict()
+        assert stats["id"] == result["id"]
+        assert stats["active"] is False
+        assert stats["emitted"] >= 1900
+        assert stats["achieved_rate"] >= 1900
+        assert stats["shortfall_ratio"] < 0.05
+        assert log_manager.emitter.flush()
+        assert log_manager.lines_emitted["INFO"] == stats["emitted"]
+
+    @pytest.mark.asyncio
+    async def test_log_flood_with_payload(self, log_manager):
+        """Test floods draw their lines from the payload generator"""
+        payload = {"distribution": "lognormal", "size": 512, "fields": 5, "seed": 1}
+        log_data = LogRequest(
+            message="flood", level="info", rate=1000, duration=1, payload=payload
+        )
+        await log_manager.create_log(log_data)
+        await asyncio.sleep(1.2)
+        stats = log_manager.floods[-1].to_dict()
+        assert stats["emitted"] >= 950
+        assert log_manager.emitter.flush()
+        assert log_manager.bytes_emitted > stats["emitted"] * 400
+        # The generator is reused by later requests with the same options
+        generator = log_manager._generator(log_data, LogFormat.JSON)
+        assert log_manager._generator(log_data, LogFormat.JSON) is generator
+
+    @pytest.mark.asyncio
+    async def test_concurrent_streams_keep_their_format(self, log_manager):
+        """Test streams in different formats never reconfigure each other"""
+        stream = io.StringIO()
+        log_manager.emitter.sink = StreamSink(stream)
+        log_manager.create_stream("audit", LogFormat.PLAINTEXT)
+        handler = log_manager.handler
+        for _ in range(3):
+            await log_manager.create_log(LogRequest(message="json", level="info"))
+            await log_manager.create_log(
+                LogRequest(message="text", level="info", stream="audit")
+            )
+            await log_manager.emit(
+                LogRequest(message="plain", level="info", format=LogFormat.PLAINTEXT)
+            )
+        assert log_manager.handler is handler
+        assert log_manager.emitter.flush()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 9
+        for line in lines:
+            if "json" in line:
+                assert json.loads(line)["message"] == "json"
+            else:
+                assert line.endswith("| INFO | - | text") or line.endswith("| plain")
+        assert log_manager.streams["audit"].emitted == 3
+        assert log_manager.streams["plaintext"].emitted == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_registry(self, log_manager):
+        """Test named streams can be created, used and deleted"""
+        stream = log_manager.create_stream("api", LogFormat.JSON)
+        assert stream.to_dict()["format"] == "json"
+        with pytest.raises(ValueError, match="already exists"):
+            log_manager.create_stream("api", LogFormat.PLAINTEXT)
+        with pytest.raises(ValueError, match="builtin"):
+            log_manager.delete_stream("json")
+        log_manager.delete_stream("api")
+        with pytest.raises(KeyError):
+            await log_manager.create_log(
+                LogRequest(message="lost", level="info", stream="api")
+            )
+
+    @pytest.mark.asyncio
+    async def test_recurring_job_counts_failures(self, log_manager, monkeypatch):
+        """Test a recurring job only counts the lines actually queued"""
+
+        def fail(*args, **kwargs):
+            raise OSError("sink unavailable")
+
+        monkeypatch.setattr(log_manager.logger, "makeRecord", fail)
+        result = await log_manager.create_log(
+            LogRequest(message="tick", level="info", interval=1, duration=30)
+        )
+        await asyncio.sleep(0.1)
+        job = log_manager.get_job(result["id"])
+        assert job.to_dict()["emitted"] == 0
+        assert job.to_dict()["failed"] == 1
+        assert job.to_dict()["last_error"] == "sink unavailable"
+        log_manager.cancel_job(job.id)
+
+    @pytest.mark.asyncio
+    async def test_delete_stream_used_by_job(self, log_manager):
+        """Test a stream cannot be deleted while a running job writes to it"""
+        log_manager.create_stream("orders", LogFormat.JSON)
+        flood = await log_manager.create_log(
+            LogRequest(
+                message="order", level="info", rate=100, duration=30, stream="orders"
+            )
+        )
+        with pytest.raises(ValueError, match=f"used by running jobs: {flood['id']}"):
+            log_manager.delete_stream("orders")
+        log_manager.cancel_job(flood["id"])
+        await asyncio.sleep(0.01)
+        assert log_manager.delete_stream("orders").name == "orders"
+
+    @pytest.mark.asyncio
+    async def test_log_jobs(self, log_manager):
+        """Test recurring jobs and floods are tracked and can be cancelled"""
+        result = await log_manager.create_log(
+            LogRequest(message="tick", level="info", interval=1, duration=30)
+        )
+        flood = await log_manager.create_log(
+            LogRequest(message="flood", level="info", rate=500, duration=30)
+        )
+        await asyncio.sleep(0.3)
+        job = log_manager.get_job(result["id"])
+        assert job.to_dict()["kind"] == "recurring"
+        assert job.emitted == 1
+        assert log_manager.get_job(flood["id"]).emitted > 50
+
+        assert log_manager.cancel_job(result["id"]) is job
+        with pytest.raises(KeyError):
+            log_manager.get_job("missing")
+        cancelled = log_manager.cancel_jobs()
+        assert [other.id for other in cancelled] == [flood["id"]]
+        await asyncio.sleep(0.01)
+        assert not any(other.active for other in log_manager.jobs.values())
+        with pytest.raises(ValueError, match="not running"):
+            log_manager.cancel_job(result["id"])
+
+    @pytest.mark.asyncio
+    async def test_log_flood_validation(self, log_manager):
+        """Test validation of log flood parameters"""
+        with pytest.raises(ValueError, match="Duration must be set when rate"):
+            await log_manager.create_log(
+                LogRequest(message="Test log", level="info", rate=10)
+            )
+        with pytest.raises(ValueError, match="Use either interval or rate"):
+            await log_manager.create_log(
+                LogRequest(
+                    message="Test log", level="info", rate=10, interval=1, duration=5
+                )
+            )
+        with pytest.raises(ValueError, match="Rate must be between"):
+            await log_manager.create_log(
+                LogRequest(message="Test log", level="info", rate=10**7, duration=5)
+            )
+
     @pytest.mark.asyncio
     async def test_automatic_logs_initialization(self, monkeypatch, caplog):
         """Test automatic log initialization from environment"""
@@ -207,11 +375,14 @@ class TestLogManager:
             "Test auto message" in record.message for record in caplog.records
         ), "Expected log message not found in records"
         assert all(
-            record.levelname == "INFO" for record in caplog.records if "Test auto message" in record.message
+            record.levelname == "INFO"
+            for record in caplog.records
+            if "Test auto message" in record.message
         ), "Not all logs are at INFO level"
         assert all(
             hasattr(record, "service") and record.service == "test-service"
-            for record in caplog.records if "Test auto message" in record.message
+            for record in caplog.records
+            if "Test auto message" in record.message
         ), "Service attribute missing or incorrect"
         assert isinstance(
             manager.logger.handlers[0].formatter, JsonFormatter
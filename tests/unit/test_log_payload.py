@@ -0,0 +1,68 @@
+import json
+import statistics
+from app.managers.log_encoder import LogEncoder
+from app.managers.log_payload import PayloadGenerator
+from app.models.schemas import LogFormat, LogPayload
+
+
+def message_sizes(generator):
+    return [
+        len(json.loads("{" + body)["message"].encode())
+        for body in generator.bodies(2000)
+    ]
+
+
+class TestPayloadGenerator:
+    """Unit tests for the synthetic log payload generator"""
+
+    def test_fixed_size(self):
+        generator = PayloadGenerator(
+            LogPayload(size=300, seed=1), "hello", LogFormat.JSON
+        )
+        sizes = message_sizes(generator)
+        # Filler slices may lose a few bytes of a cut multi-byte character
+        assert all(297 <= size <= 300 for size in sizes)
+
+    def test_uniform_size(self):
+        payload = LogPayload(distribution="uniform", min_size=100, max_size=500, seed=1)
+        sizes = message_sizes(PayloadGenerator(payload, "hello", LogFormat.JSON))
+        assert min(sizes) >= 96 and max(sizes) <= 500
+        assert 250 < statistics.mean(sizes) < 350
+
+    def test_lognormal_size(self):
+        payload = LogPayload(distribution="lognormal", size=400, sigma=0.5, seed=1)
+        sizes = message_sizes(PayloadGenerator(payload, "hello", LogFormat.JSON))
+        assert 340 < statistics.mean(sizes) < 460
+        assert statistics.median(sizes) < statistics.mean(sizes)
+
+    def test_fields_and_cardinality(self):
+        payload = LogPayload(size=0, fields=15, cardinality=100000, seed=1)
+        generator = PayloadGenerator(payload, "hello", LogFormat.JSON)
+        lines = [json.loads("{" + body) for body in generator.bodies(1000)]
+        assert all(len(line) == 1 + 15 + 1 for line in lines)
+        assert {"method", "status", "field_14"} <= set(lines[0])
+        # Not bounded by the pool size
+        assert len({line["request_id"] for line in lines}) > 900
+
+    def test_stack_traces_and_utf8(self):
+        payload = LogPayload(size=200, stack_trace_ratio=1, utf8_ratio=0.5, seed=1)
+        generator = PayloadGenerator(payload, "boom", LogFormat.PLAINTEXT)
+        body = generator.bodies(1)[0]
+        assert "Traceback (most recent call last):" in body
+        assert len(body.encode()) > len(body)
+
+    def test_encoded_lines(self):
+        payload = LogPayload(size=100, fields=3, cardinality=10, seed=1)
+        encoder = LogEncoder(LogFormat.JSON)
+        generator = PayloadGenerator(payload, "hello", LogFormat.JSON)
+        text = encoder.encode_bodies("WARNING", "svc", generator.bodies(5))
+        lines = [json.loads(line) for line in text.splitlines()]
+        assert len(lines) == 5
+        assert all(line["level"] == "WARNING" for line in lines)
+        assert all(line["message"].startswith("hello") for line in lines)
+
+    def test_seed_is_reproducible(self):
+        payload = LogPayload(distribution="lognormal", fields=4, seed=7)
+        first = PayloadGenerator(payload, "x", LogFormat.JSON).bodies(10)
+        second = PayloadGenerator(payload, "x", LogFormat.JSON).bodies(10)
+        assert first == second
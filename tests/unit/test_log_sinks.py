@@ -0,0 +1,108 @@
+import io
+import os
+import socket
+import time
+import pytest
+from app.managers.log_emitter import LogEmitter
+from app.managers.log_sinks import (
+    BufferedStdoutSink,
+    LogSink,
+    RotatingFileSink,
+    SyslogSink,
+    make_sink,
+    sink_name,
+)
+from app.models.schemas import LogSinkConfig
+
+
+class TestLogSinks:
+    """Unit tests for the log sinks"""
+
+    def test_buffered_stdout_flushes_by_size(self):
+        stream = io.BytesIO()
+        sink = BufferedStdoutSink(flush_bytes=10, flush_interval=60, stream=stream)
+        sink.write("12345\n")
+        sink.flush()
+        assert stream.getvalue() == b""
+        sink.write("67890\n")
+        assert stream.getvalue() == b"12345\n67890\n"
+        assert sink.stats()["flushes"] == 1
+
+    def test_buffered_stdout_flushes_by_interval(self):
+        stream = io.BytesIO()
+        sink = BufferedStdoutSink(1 << 20, flush_interval=0.05, stream=stream)
+        emitter = LogEmitter(sink)
+        emitter.submit("idle line\n")
+        assert emitter.flush()
+        assert stream.getvalue() == b""
+        # The idle writer thread flushes the partial block
+        time.sleep(0.3)
+        assert stream.getvalue() == b"idle line\n"
+        emitter.close()
+
+    def test_rotating_file(self, tmp_path):
+        path = str(tmp_path / "logs" / "app.log")
+        sink = RotatingFileSink(path, max_bytes=100, backups=2)
+        for _ in range(10):
+            sink.write("x" * 39 + "\n")
+        sink.close()
+        assert sink.rotations == 4
+        assert os.path.getsize(path) == 80
+        assert os.path.exists(path + ".1") and os.path.exists(path + ".2")
+        assert not os.path.exists(path + ".3")
+
+    def test_syslog_udp(self):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.settimeout(2)
+        sink = SyslogSink("127.0.0.1", listener.getsockname()[1], facility=1)
+        sink.write_chunks([("one\ntwo\n", 2, "ERROR")])
+        first = listener.recv(65535).decode()
+        second = listener.recv(65535).decode()
+        assert first.startswith("<11>1 - ") and first.endswith(" - - one")
+        assert second.endswith(" - - two")
+        sink.close()
+        listener.close()
+
+    def test_syslog_tcp(self):
+        listener = socket.create_server(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+        sink = SyslogSink("127.0.0.1", port, protocol="tcp")
+        sink.write_chunks([("hello\n", 1, "INFO")])
+        connection, _ = listener.accept()
+        connection.settimeout(2)
+        assert connection.recv(65535).decode().startswith("<14>1 - ")
+        assert sink.stats()["messages"] == 1
+        sink.close()
+        connection.close()
+        listener.close()
+
+    def test_emitter_reports_latency_and_errors(self):
+        sink = SyslogSink("127.0.0.1", 1, protocol="tcp")
+        emitter = LogEmitter(sink)
+        emitter.submit("refused\n")
+        assert emitter.flush()
+        stats = emitter.stats()
+        assert stats["sink"] == "syslog:tcp://127.0.0.1:1"
+        assert stats["write_errors"] == 1
+        assert stats["write_latency"]["count"] == 1
+        # Lines of the failed write are dropped, not counted as written
+        assert stats["written"] == 0
+        assert stats["bytes_written"] == 0
+        assert stats["dropped"] == 1
+        emitter.close()
+
+    def test_sinks_implement_write(self):
+        with pytest.raises(TypeError):
+            LogSink()
+        sink = SyslogSink("127.0.0.1", 1)
+        sink.write("one\ntwo\n")
+        assert sink.stats()["messages"] == 2
+        sink.close()
+
+    def test_sink_names(self):
+        assert sink_name(LogSinkConfig()) == "stderr"
+        assert sink_name(LogSinkConfig(type="stdout")) == "stdout"
+        config = LogSinkConfig(type="syslog", port=5514, protocol="tcp")
+        assert sink_name(config) == "syslog:tcp://127.0.0.1:5514"
+        assert make_sink(config).name == sink_name(config)
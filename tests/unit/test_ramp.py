@@ -0,0 +1,87 @@
+import time
+import pytest
+from app.managers.ramp import Ramp
+from app.models.schemas import RampShape
+
+
+class TestRamp:
+    def test_linear(self):
+        """Test linear ramp up and down"""
+        assert Ramp(0, 10, 10).value_at(5) == pytest.approx(5)
+        assert Ramp(10, 0, 10).value_at(2) == pytest.approx(8)
+        assert Ramp(0, 10, 10).value_at(20) == pytest.approx(10)
+
+    def test_exponential(self):
+        """Test exponential ramp stays below linear and reaches the end"""
+        ramp = Ramp(0, 10, 10, RampShape.EXPONENTIAL)
+        assert ramp.value_at(0) == pytest.approx(0)
+        assert ramp.value_at(5) < 5
+        assert ramp.value_at(10) == pytest.approx(10)
+
+    def test_step(self):
+        """Test step ramp holds discrete levels"""
+        ramp = Ramp(0, 4, 10, RampShape.STEP, steps=5)
+        assert ramp.value_at(0) == 0
+        assert ramp.value_at(1.9) == 0
+        assert ramp.value_at(2) == 1
+        assert ramp.value_at(9.9) == 4
+
+    def test_sine(self):
+        """Test sine ramp oscillates between start and end values"""
+        ramp = Ramp(1, 3, 10, RampShape.SINE, cycles=2)
+        assert ramp.value_at(0) == pytest.approx(1)
+        assert ramp.value_at(2.5) == pytest.approx(3)
+        assert ramp.value_at(5) == pytest.approx(1)
+
+    def test_sawtooth(self):
+        """Test sawtooth ramp restarts at each cycle"""
+        ramp = Ramp(0, 10, 10, RampShape.SAWTOOTH, cycles=2)
+        assert ramp.value_at(2.5) == pytest.approx(5)
+        assert ramp.value_at(5) == pytest.approx(0)
+        assert ramp.value_at(10) == pytest.approx(10)
+
+    def test_invalid_parameters(self):
+        """Test ramp parameter validation"""
+        with pytest.raises(ValueError, match="Resolution must be at least"):
+            Ramp(0, 1, 10, resolution=0.05)
+        with pytest.raises(ValueError, match="at least 2 steps"):
+            Ramp(0, 1, 10, RampShape.STEP, steps=1)
+        with pytest.raises(ValueError, match="Hold must be"):
+            Ramp(0, 1, 10, hold=-1)
+
+    def test_run_applies_values_and_ends(self):
+        """Test the ramp thread applies values then calls on_end after hold"""
+        applied = []
+        ended = []
+        ramp = Ramp(0, 1, 0.5, resolution=0.1, hold=0.2)
+        ramp.start(applied.append, lambda: ended.append(True))
+        time.sleep(1)
+        assert applied[0] == 0
+        assert applied[-1] == pytest.approx(1)
+        assert len(applied) == 6
+        assert ended == [True]
+
+    def test_cancel(self):
+        """Test cancelling stops the ramp before on_end"""
+        ended = []
+        ramp = Ramp(0, 1, 1, resolution=0.1)
+        ramp.start(lambda value: None, lambda: ended.append(True))
+        ramp.cancel()
+        assert not ramp.active
+        time.sleep(0.2)
+        assert ended == []
+
+    def test_apply_error_is_recorded(self):
+        """Test an apply failure ends the ramp and is kept on it"""
+
+        def apply(value):
+            if value > 0:
+                raise RuntimeError("Failed to start CPU stress")
+
+        ended = []
+        ramp = Ramp(0, 1, 1, resolution=0.1)
+        ramp.start(apply, lambda: ended.append(True))
+        time.sleep(0.3)
+        assert not ramp.active
+        assert ramp.error == "Failed to start CPU stress"
+        assert ended == []
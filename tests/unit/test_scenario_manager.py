@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+from pydantic import ValidationError
+from app.managers.lifecycle_manager import LifecycleManager
+from app.managers.load_manager import LoadManager
+from app.managers.log_manager import LogManager
+from app.managers.scenario_manager import ScenarioManager
+from app.models.schemas import Scenario
+
+
+class TestScenarioManager:
+    @pytest.fixture
+    def managers(self):
+        load_manager = LoadManager()
+        yield load_manager, LogManager(), LifecycleManager()
+        load_manager.stop_cpu_load()
+        load_manager.stop_memory_load()
+
+    @pytest.fixture
+    def scenario_manager(self, managers):
+        return ScenarioManager(*managers)
+
+    def test_parse_json_and_yaml(self):
+        """Test scenarios are parsed from JSON and YAML documents"""
+        scenario = ScenarioManager.parse(
+            b'{"name": "json", "phases": [{"duration": 1, "cpu": {"value": 0.5}}]}'
+        )
+        assert scenario.phases[0].cpu.start == scenario.phases[0].cpu.end == 0.5
+
+        scenario = ScenarioManager.parse(
+            b"name: yaml\nphases:\n  - at: 2\n    probes: {readiness: error}\n",
+            "application/yaml",
+        )
+        assert scenario.phases[0].at == 2
+        assert scenario.phases[0].probes.readiness == "error"
+
+        with pytest.raises(ValueError, match="Invalid JSON scenario"):
+            ScenarioManager.parse(b"{not json")
+        with pytest.raises(ValidationError):
+            ScenarioManager.parse(b'{"phases": [{"cpu": {"start": 1}}]}')
+
+    def test_plan_timing_and_validation(self, scenario_manager):
+        """Test phases are sequential unless `at` is given"""
+        scenario = Scenario(
+            phases=[
+                {"duration": 10, "cpu": {"start": 0, "end": 0.5}},
+                {"duration": 5},
+                {"at": 3, "probes": {"liveness": "error"}},
+                {"duration": 2},
+            ]
+        )
+        plans = scenario_manager._plan(scenario)
+        assert [(plan.start, plan.end) for plan in plans] == [
+            (0, 10),
+            (10, 15),
+            (3, 3),
+            (3, 5),
+        ]
+        with pytest.raises(ValueError, match="CPU load cannot exceed"):
+            scenario_manager._plan(Scenario(phases=[{"cpu": {"value": 1000}}]))
+        with pytest.raises(ValueError, match="Dirty mode requires"):
+            scenario_manager._plan(
+                Scenario(phases=[{"memory": {"value": 10, "mode": "dirty"}}])
+            )
+
+    @pytest.mark.asyncio
+    async def test_run_phases(self, scenario_manager, managers):
+        """Test the scheduler drives loads, logs and probes on time"""
+        load_manager, log_manager, lifecycle_manager = managers
+        scenario = Scenario(
+            resolution=0.05,
+            phases=[
+                {"duration": 0.4, "cpu": {"start": 0.1, "end": 0.5}},
+                {"duration": 0.2, "logs": {"rate": 1000, "message": "burst"}},
+                {"at": 0.3, "probes": {"readiness": "error"}},
+            ],
+        )
+        run = scenario_manager.start(scenario)
+        await asyncio.sleep(0.2)
+        assert run.state == "running"
+        assert 0.1 < load_manager.cpu_requested < 0.5
+        await asyncio.sleep(0.6)
+        assert run.state == "completed"
+        assert lifecycle_manager.readiness_status == "error"
+        assert log_manager.emitter.flush()
+        assert log_manager.lines_emitted["INFO"] == 200
+        assert run.max_lag < 0.1
+        # stop_at_end stops the loads the scenario drove
+        assert load_manager.cpu_requested == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel(self, scenario_manager, managers):
+        """Test cancelling a scenario stops its loads"""
+        load_manager = managers[0]
+        run = scenario_manager.start(
+            Scenario(phases=[{"duration": 30, "cpu": {"value": 0.2}}])
+        )
+        await asyncio.sleep(0.1)
+        assert load_manager.cpu_requested == 0.2
+        scenario_manager.cancel(run.id)
+        with pytest.raises(asyncio.CancelledError):
+            await run.task
+        assert run.task.cancelled()
+        assert run.state == "cancelled"
+        assert load_manager.cpu_requested == 0
+        with pytest.raises(ValueError, match="is not running"):
+            scenario_manager.cancel(run.id)
+        with pytest.raises(KeyError):
+            scenario_manager.get("unknown")
+
+    @pytest.mark.asyncio
+    async def test_new_scenario_replaces_running(self, scenario_manager):
+        """Test starting a scenario cancels the running one"""
+        first = scenario_manager.start(Scenario(phases=[{"duration": 30}]))
+        second = scenario_manager.start(Scenario(phases=[{"duration": 30}]))
+        await asyncio.sleep(0.05)
+        assert first.state == "cancelled"
+        assert second.state == "running"
+        scenario_manager.cancel(second.id)
@@ -1,6 +1,6 @@
 import pytest
 from pydantic import ValidationError
-from app.models.schemas import LogRequest, LogResponse, LogFormat
+from app.models.schemas import LogRequest, LogResponse, LogFormat, LogPayload
 
 
 class TestSchemas:
@@ -51,3 +51,33 @@ class TestSchemas:
         # Test detail manquant
         with pytest.raises(ValidationError):
             LogResponse(status_code=500)
+
+    def test_log_payload_validation(self):
+        """Tests de validation du schéma LogPayload"""
+        payload = LogPayload()
+        assert payload.distribution == "fixed"
+        assert payload.size == 256
+
+        log_request = LogRequest(
+            message="Test", level="info", payload={"distribution": "uniform"}
+        )
+        assert log_request.payload.distribution == "uniform"
+
+        # Bornes incohérentes
+        with pytest.raises(ValidationError):
+            LogPayload(min_size=100, max_size=10)
+        with pytest.raises(ValidationError):
+            LogPayload(size=2048, max_size=1024)
+
+        # Distribution inconnue
+        with pytest.raises(ValidationError):
+            LogPayload(distribution="pareto")
+
+        # Clé de cardinalité en conflit avec un champ généré
+        with pytest.raises(ValidationError, match="collides"):
+            LogPayload(cardinality=10, cardinality_key="message")
+        with pytest.raises(ValidationError, match="collides"):
+            LogPayload(cardinality=10, fields=3, cardinality_key="status")
+        with pytest.raises(ValidationError, match="collides"):
+            LogPayload(cardinality=10, fields=20, cardinality_key="field_15")
+        assert LogPayload(cardinality=10, fields=2, cardinality_key="status")
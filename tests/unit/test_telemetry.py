@@ -0,0 +1,94 @@
+import asyncio
+import json
+import pytest
+from app.managers.telemetry import RateMeter, TelemetryBroadcaster
+
+
+class TestTelemetryBroadcaster:
+    @pytest.fixture
+    def broadcaster(self):
+        calls = []
+
+        def snapshot():
+            calls.append(True)
+            return {"tick": len(calls)}
+
+        broadcaster = TelemetryBroadcaster(snapshot, interval=0.05)
+        broadcaster.calls = calls
+        return broadcaster
+
+    @pytest.mark.asyncio
+    async def test_single_producer_fans_out(self, broadcaster):
+        """Test one snapshot per tick is shared by every subscriber"""
+        queues = [broadcaster.subscribe() for _ in range(5)]
+        events = [json.loads(await queue.get()) for queue in queues]
+        assert all(event == {"tick": 1} for event in events)
+        await asyncio.sleep(0.12)
+        assert len(broadcaster.calls) <= 4
+        for queue in queues:
+            broadcaster.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_decimation(self, broadcaster):
+        """Test a slower subscriber only gets every Nth event"""
+        fast = broadcaster.subscribe()
+        slow = broadcaster.subscribe(interval=0.1)
+        await asyncio.sleep(0.32)
+        assert fast.qsize() >= 2 * slow.qsize() - 1
+        ticks = [json.loads(slow.get_nowait())["tick"] for _ in range(slow.qsize())]
+        assert all(tick % 2 == 0 for tick in ticks)
+        broadcaster.unsubscribe(fast)
+        broadcaster.unsubscribe(slow)
+
+    @pytest.mark.asyncio
+    async def test_producer_stops_without_subscribers(self, broadcaster):
+        """Test the producer ends once the last subscriber leaves"""
+        queue = broadcaster.subscribe()
+        await queue.get()
+        producer = broadcaster._producer
+        broadcaster.unsubscribe(queue)
+        assert broadcaster._producer is None
+        await asyncio.sleep(0)
+        assert producer.cancelled()
+        assert broadcaster.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_failing_snapshot_skips_tick(self, broadcaster):
+        """Test a snapshot error is counted without ending the stream"""
+        calls = []
+
+        def snapshot():
+            calls.append(True)
+            if len(calls) == 1:
+                raise RuntimeError("sampler not ready")
+            return {"tick": len(calls)}
+
+        broadcaster.snapshot = snapshot
+        queue = broadcaster.subscribe()
+        assert json.loads(await queue.get()) == {"tick": 2}
+        assert broadcaster.errors == 1
+        broadcaster.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest(self, broadcaster):
+        """Test a full queue drops its oldest event instead of blocking"""
+        broadcaster.queue_size = 2
+        queue = broadcaster.subscribe()
+        await asyncio.sleep(0.2)
+        assert queue.qsize() == 2
+        assert json.loads(queue.get_nowait())["tick"] > 1
+        broadcaster.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_invalid_interval(self, broadcaster):
+        """Test subscribers cannot go faster than the producer"""
+        with pytest.raises(ValueError, match="Interval must be at least"):
+            broadcaster.subscribe(interval=0.01)
+        with pytest.raises(ValueError, match="greater than 0"):
+            TelemetryBroadcaster(dict, interval=0)
+
+    def test_rate_meter(self):
+        """Test counter rates are computed between two calls"""
+        meter = RateMeter()
+        assert meter.rate(0) is None
+        assert meter.rate(100) > 0